@@ -17,6 +17,7 @@ from app.core.theme_manager import ThemeManager
 from app.core.config import DEFAULT_THEME, MODULE_SECTIONS
 from app.services.favorites_service import FavoritesService
 from app.services.preferences_service import PreferencesService
+from app.services.yahoo_finance_service import YahooFinanceService
 
 
 def _dynamic_import(class_path: str):
@@ -33,6 +34,8 @@ def main() -> int:
     # Initialize services
     FavoritesService.initialize()
     PreferencesService.initialize()
+    app.aboutToQuit.connect(PreferencesService.flush)
+    app.aboutToQuit.connect(YahooFinanceService.shutdown_metadata_prefetch)
 
     # Create centralized theme manager and load saved theme
     theme_manager = ThemeManager()
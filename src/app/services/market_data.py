@@ -53,6 +53,9 @@ from app.utils.market_hours import is_crypto_ticker
 # Create a global cache instance (disk-based parquet cache)
 _cache = MarketDataCache()
 
+# Worker threads for parallel cache classification in classify_tickers()
+_CLASSIFY_WORKERS = 16
+
 # Data source version tracking - increment when switching data sources
 # to automatically clear cache and avoid mixing data from different providers
 _DATA_SOURCE_VERSION = "yahoo_v2"
@@ -240,34 +243,42 @@ def classify_tickers(
         TickerGroup.NEEDS_UPDATE: [],
     }
 
-    for ticker in tickers:
-        ticker = ticker.strip().upper()
+    tickers = [ticker.strip().upper() for ticker in tickers]
 
-        # Check memory cache first
-        df = _get_from_memory_cache(ticker)
-        if df is not None and not df.empty and _cache.is_cache_current(ticker):
-            groups[TickerGroup.CACHE_CURRENT].append(
-                TickerClassification(TickerGroup.CACHE_CURRENT, ticker, df)
-            )
-            continue
+    # Parquet reads are I/O bound and release the GIL - classify in parallel
+    if DATA_FETCH_THREADS and len(tickers) > 1:
+        with ThreadPoolExecutor(max_workers=min(_CLASSIFY_WORKERS, len(tickers))) as pool:
+            classifications = list(pool.map(_classify_ticker, tickers))
+    else:
+        classifications = [_classify_ticker(ticker) for ticker in tickers]
 
-        # Check disk cache
-        if _cache.has_cache(ticker) and _cache.is_cache_current(ticker):
-            cached_df = _cache.get_cached_data(ticker)
-            if cached_df is not None and not cached_df.empty:
-                groups[TickerGroup.CACHE_CURRENT].append(
-                    TickerClassification(TickerGroup.CACHE_CURRENT, ticker, cached_df)
-                )
-                continue
-
-        # Need to fetch from Yahoo
-        groups[TickerGroup.NEEDS_UPDATE].append(
-            TickerClassification(TickerGroup.NEEDS_UPDATE, ticker, None)
-        )
+    for classification in classifications:
+        groups[classification.group].append(classification)
 
     return groups
 
 
+def _classify_ticker(ticker: str) -> TickerClassification:
+    """Classify a single (normalized) ticker, reading its parquet cache at most once."""
+    # Check memory cache first
+    df = _get_from_memory_cache(ticker)
+    if df is not None and not df.empty and _cache.is_cache_current(ticker, df):
+        return TickerClassification(TickerGroup.CACHE_CURRENT, ticker, df)
+
+    # Check disk cache
+    if _cache.has_cache(ticker):
+        cached_df = _cache.get_cached_data(ticker)
+        if (
+            cached_df is not None
+            and not cached_df.empty
+            and _cache.is_cache_current(ticker, cached_df)
+        ):
+            return TickerClassification(TickerGroup.CACHE_CURRENT, ticker, cached_df)
+
+    # Need to fetch from Yahoo
+    return TickerClassification(TickerGroup.NEEDS_UPDATE, ticker, None)
+
+
 def fetch_price_history_batch(
     tickers: List[str],
     progress_callback: Optional[Callable[[int, int, str, str], None]] = None,
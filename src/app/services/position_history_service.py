@@ -1,6 +1,6 @@
 """Position History Service - Reconstruct positions and weights from transactions."""
 
-from typing import TYPE_CHECKING, Any, Dict, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 if TYPE_CHECKING:
     import numpy as np
@@ -32,6 +32,7 @@ class PositionHistoryService:
         Returns:
             DataFrame with dates as index, tickers as columns, quantities as values.
         """
+        import numpy as np
         import pandas as pd
 
         transactions = PortfolioDataService.get_transactions(portfolio_name)
@@ -47,54 +48,39 @@ class PositionHistoryService:
         transactions = sorted(transactions, key=lambda t: (t.date, t.sequence))
 
         tickers = list(set(t.ticker for t in transactions))
+        col_of = {ticker: j for j, ticker in enumerate(tickers)}
 
-        # Build position changes by date
-        position_changes: Dict[str, Dict[str, float]] = {}
-
-        for tx in transactions:
-            date = tx.date
-            ticker = tx.ticker
-
-            if date not in position_changes:
-                position_changes[date] = {}
-
-            if ticker not in position_changes[date]:
-                position_changes[date][ticker] = 0.0
-
-            if tx.transaction_type == "Buy":
-                position_changes[date][ticker] += tx.quantity
-            else:
-                position_changes[date][ticker] -= tx.quantity
-
-        transaction_dates = sorted(position_changes.keys())
-        if not transaction_dates:
-            return pd.DataFrame()
-
-        first_tx_date = pd.to_datetime(transaction_dates[0])
+        # Integer day offsets from the first transaction: dates are parsed
+        # once as a batch and used directly as row positions
+        tx_days = pd.to_datetime([t.date for t in transactions]).to_numpy().astype("datetime64[D]")
+        first_day = tx_days.min()
 
         if end_date:
-            last_date = pd.to_datetime(end_date)
+            last_day = np.datetime64(pd.to_datetime(end_date).date(), "D")
         else:
-            last_date = pd.Timestamp.now().normalize()
+            last_day = np.datetime64(pd.Timestamp.now().date(), "D")
 
-        all_dates = pd.date_range(start=first_tx_date, end=last_date, freq="D")
+        n_days = max(int((last_day - first_day).astype(np.int64)) + 1, 0)
+        all_dates = pd.date_range(start=pd.Timestamp(first_day), periods=n_days, freq="D")
 
-        positions = pd.DataFrame(0.0, index=all_dates, columns=tickers)
-
-        current_position = {ticker: 0.0 for ticker in tickers}
-
-        for date in all_dates:
-            date_str = date.strftime("%Y-%m-%d")
-
-            if date_str in position_changes:
-                for ticker, change in position_changes[date_str].items():
-                    current_position[ticker] += change
+        rows = (tx_days - first_day).astype(np.int64)
+        cols = np.fromiter((col_of[t.ticker] for t in transactions), dtype=np.int64, count=len(transactions))
+        signed_qty = np.fromiter(
+            (t.quantity if t.transaction_type == "Buy" else -t.quantity for t in transactions),
+            dtype=np.float64, count=len(transactions),
+        )
 
-            for ticker in tickers:
-                positions.loc[date, ticker] = current_position[ticker]
+        # Scatter changes into a dense day x ticker matrix (transactions past
+        # end_date are dropped) and accumulate in one cumsum
+        in_range = rows < n_days
+        matrix = np.zeros((n_days, len(tickers)), dtype=np.float64)
+        np.add.at(matrix, (rows[in_range], cols[in_range]), signed_qty[in_range])
+        np.cumsum(matrix, axis=0, out=matrix)
+        positions = pd.DataFrame(matrix, index=all_dates, columns=tickers)
 
         if start_date:
-            positions = positions[positions.index >= pd.to_datetime(start_date)]
+            # all_dates is sorted - slice instead of masking every row
+            positions = positions.loc[pd.to_datetime(start_date):]
 
         return positions
 
@@ -130,40 +116,59 @@ class PositionHistoryService:
         tickers = positions.columns.tolist()
 
         from app.services.market_data import fetch_price_history_batch
+        from app.services.returns_data_service import ReturnsDataService
 
         tickers_to_fetch = [t for t in tickers if t.upper() != "FREE CASH"]
-        batch_data = fetch_price_history_batch(tickers_to_fetch)
-
-        price_data: Dict[str, Any] = {}
-        for ticker in tickers_to_fetch:
-            if ticker in batch_data:
-                df = batch_data[ticker]
-                if df is not None and not df.empty:
-                    close = df["Close"]
-                    close.index = pd.to_datetime(close.index)
-                    price_data[ticker] = close
-
-        market_values = pd.DataFrame(index=positions.index, columns=tickers, dtype=float)
-
-        for ticker in tickers:
-            if ticker.upper() == "FREE CASH":
-                market_values[ticker] = positions[ticker]
-            elif ticker in price_data:
-                prices = price_data[ticker].reindex(positions.index, method="ffill")
-                market_values[ticker] = positions[ticker] * prices
-            else:
-                market_values[ticker] = 0.0
-
-        market_values = market_values.fillna(0)
-
-        total_values = market_values.sum(axis=1)
-
-        weights = market_values.copy()
-        for col in weights.columns:
-            weights[col] = np.where(
-                total_values > 0,
-                market_values[col] / total_values,
-                0.0
+
+        # Reuse Close prices cached alongside the portfolio's returns as one
+        # block; only fetch tickers the matrix doesn't cover
+        price_frames: List[Any] = []
+        closes = ReturnsDataService.get_close_matrix(portfolio_name)
+        covered = [] if closes is None else [t for t in tickers_to_fetch if t in closes.columns]
+        if covered:
+            price_frames.append(closes[covered])
+
+        covered_set = set(covered)
+        missing = [t for t in tickers_to_fetch if t not in covered_set]
+        batch_data = fetch_price_history_batch(missing) if missing else {}
+
+        fetched: Dict[str, Any] = {}
+        for ticker in missing:
+            df = batch_data.get(ticker)
+            if df is not None and not df.empty:
+                fetched[ticker] = df["Close"]
+        if fetched:
+            price_frames.append(pd.concat(fetched, axis=1))
+
+        # Price matrix aligned to positions: union with the calendar so each
+        # ticker carries its last close forward, then sample the position dates
+        if price_frames:
+            prices = price_frames[0] if len(price_frames) == 1 else pd.concat(price_frames, axis=1)
+            if not isinstance(prices.index, pd.DatetimeIndex):
+                prices.index = pd.to_datetime(prices.index)
+            prices = (
+                prices.reindex(prices.index.union(positions.index))
+                .ffill()
+                .reindex(index=positions.index, columns=tickers)
             )
+            price_matrix = prices.to_numpy(dtype=np.float64)
+        else:
+            price_matrix = np.full(positions.shape, np.nan)
+
+        # FREE CASH is valued at 1.0 per unit; unpriced tickers count as 0
+        price_matrix[:, positions.columns.str.upper() == "FREE CASH"] = 1.0
+
+        market_values = positions.to_numpy(dtype=np.float64) * price_matrix
+        market_values[np.isnan(market_values)] = 0.0
+
+        total_values = market_values.sum(axis=1, keepdims=True)
+        weights = pd.DataFrame(
+            np.divide(
+                market_values, total_values,
+                out=np.zeros_like(market_values), where=total_values > 0,
+            ),
+            index=positions.index,
+            columns=tickers,
+        )
 
         return weights
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
 import json
+import os
+import threading
 from pathlib import Path
-from typing import Optional
 
 
 class PreferencesService:
@@ -22,6 +23,16 @@ class PreferencesService:
     # In-memory preferences
     _preferences = {}
 
+    # Mirror of _preferences["theme"] - get_theme() is polled during repaints
+    _cached_theme = "bloomberg"
+
+    # Debounced disk writes: rapid set() calls collapse into one save.
+    # Each schedule bumps the generation so only the latest timer saves.
+    _SAVE_DELAY_MS = 250
+    _save_pending = False
+    _save_generation = 0
+    _save_lock = threading.Lock()
+
     @classmethod
     def initialize(cls) -> None:
         """Initialize the service and load saved preferences."""
@@ -32,43 +43,84 @@ class PreferencesService:
         """Load preferences from disk."""
         if not cls._SAVE_PATH.exists():
             cls._preferences = cls._DEFAULT_PREFERENCES.copy()
-            return
+        else:
+            try:
+                with open(cls._SAVE_PATH, "r") as f:
+                    data = json.load(f)
+                    cls._preferences = {**cls._DEFAULT_PREFERENCES, **data}
+            except (json.JSONDecodeError, IOError) as e:
+                print(f"Error loading preferences: {e}")
+                cls._preferences = cls._DEFAULT_PREFERENCES.copy()
 
-        try:
-            with open(cls._SAVE_PATH, "r") as f:
-                data = json.load(f)
-                cls._preferences = {**cls._DEFAULT_PREFERENCES, **data}
-        except (json.JSONDecodeError, IOError) as e:
-            print(f"Error loading preferences: {e}")
-            cls._preferences = cls._DEFAULT_PREFERENCES.copy()
+        cls._cached_theme = cls._preferences.get("theme", "bloomberg")
 
     @classmethod
     def save_preferences(cls) -> None:
-        """Save preferences to disk."""
-        # Ensure directory exists
-        cls._SAVE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        """Save preferences to disk immediately, cancelling any pending save."""
+        with cls._save_lock:
+            cls._save_pending = False
+            snapshot = dict(cls._preferences)
+
+            # Write to a temp file and swap it in so a crash never leaves a torn file
+            tmp_path = cls._SAVE_PATH.with_suffix(cls._SAVE_PATH.suffix + ".tmp")
+            try:
+                cls._SAVE_PATH.parent.mkdir(parents=True, exist_ok=True)
+                with open(tmp_path, "w") as f:
+                    json.dump(snapshot, f, indent=2)
+                os.replace(tmp_path, cls._SAVE_PATH)
+            except (OSError, TypeError, ValueError) as e:
+                print(f"Error saving preferences: {e}")
+                tmp_path.unlink(missing_ok=True)
+
+    @classmethod
+    def _schedule_save(cls) -> None:
+        """Save preferences once no further changes arrive for _SAVE_DELAY_MS."""
+        from PySide6.QtCore import QCoreApplication, QTimer
+
+        # No event loop to run the timer (e.g. scripts) - save right away
+        if QCoreApplication.instance() is None:
+            cls.save_preferences()
+            return
 
-        try:
-            with open(cls._SAVE_PATH, "w") as f:
-                json.dump(cls._preferences, f, indent=2)
-        except IOError as e:
-            print(f"Error saving preferences: {e}")
+        with cls._save_lock:
+            cls._save_pending = True
+            cls._save_generation += 1
+            gen = cls._save_generation
+        QTimer.singleShot(cls._SAVE_DELAY_MS, lambda g=gen: cls._save_if_current(g))
+
+    @classmethod
+    def _save_if_current(cls, gen: int) -> None:
+        """Timer callback: save unless a later change rescheduled the write."""
+        with cls._save_lock:
+            if gen != cls._save_generation or not cls._save_pending:
+                return
+        cls.save_preferences()
+
+    @classmethod
+    def flush(cls) -> None:
+        """Write any pending preference changes to disk (call on shutdown)."""
+        with cls._save_lock:
+            pending = cls._save_pending
+        if pending:
+            cls.save_preferences()
 
     @classmethod
     def get_theme(cls) -> str:
         """Get the saved theme preference."""
-        return cls._preferences.get("theme", "bloomberg")
+        return cls._cached_theme
 
     @classmethod
     def set_theme(cls, theme: str) -> None:
         """
-        Set the theme preference and save to disk.
+        Set the theme preference and schedule a save to disk.
 
         Args:
             theme: Theme name (dark, light, or bloomberg)
         """
-        cls._preferences["theme"] = theme
-        cls.save_preferences()
+        with cls._save_lock:
+            cls._preferences["theme"] = theme
+            cls._cached_theme = theme
+        cls._schedule_save()
 
     @classmethod
     def get(cls, key: str, default=None):
@@ -77,6 +129,9 @@ class PreferencesService:
 
     @classmethod
     def set(cls, key: str, value) -> None:
-        """Set a preference value and save to disk."""
-        cls._preferences[key] = value
-        cls.save_preferences()
+        """Set a preference value and schedule a save to disk."""
+        with cls._save_lock:
+            cls._preferences[key] = value
+            if key == "theme":
+                cls._cached_theme = value
+        cls._schedule_save()
@@ -21,15 +21,22 @@ class QtSettingsSerializationMixin:
 
     _STR_TO_PENSTYLE = {v: k for k, v in _PENSTYLE_TO_STR.items()}
 
+    @staticmethod
+    def _is_line_style_key(key: str) -> bool:
+        """Pen styles live under ``line_style`` / ``*_line_style`` keys."""
+        return key == "line_style" or key.endswith("_line_style")
+
     def _serialize_settings(self, settings: Dict[str, Any]) -> Dict[str, Any]:
         """Convert settings to JSON-serializable format.
 
-        - Qt.PenStyle → string ("solid", "dash", etc.)
+        - Qt.PenStyle (``*_line_style`` keys) → string ("solid", "dash", etc.)
         - Tuples → lists (for JSON compatibility)
         """
+        # Gate on the key suffix rather than isinstance(value, Qt.PenStyle):
+        # the cross-binding enum check is slow and most keys aren't styles.
         serialized = {}
         for key, value in settings.items():
-            if isinstance(value, Qt.PenStyle):
+            if self._is_line_style_key(key) and not isinstance(value, str):
                 serialized[key] = self._PENSTYLE_TO_STR.get(value, "solid")
             elif isinstance(value, tuple):
                 serialized[key] = list(value)
@@ -45,7 +52,7 @@ class QtSettingsSerializationMixin:
         """
         deserialized = {}
         for key, value in data.items():
-            if (key == "line_style" or key.endswith("_line_style")) and isinstance(value, str):
+            if self._is_line_style_key(key) and isinstance(value, str):
                 deserialized[key] = self._STR_TO_PENSTYLE.get(value, Qt.SolidLine)
             elif key.endswith("_color") and isinstance(value, list):
                 deserialized[key] = tuple(value) if value else None
@@ -5,6 +5,8 @@ for analysis modules like Risk Analysis, Monte Carlo, and Return Distributions.
 """
 
 import threading
+import time
+from collections import OrderedDict
 from datetime import datetime
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
@@ -30,8 +32,40 @@ class ReturnsDataService:
     _CACHE_DIR = Path.home() / ".quant_terminal" / "cache" / "returns"
     _cache_lock = threading.Lock()
 
-    # In-memory cache for session performance
-    _memory_cache: Dict[str, Any] = {}
+    # Dense float returns: dictionary encoding buys nothing, ZSTD-3 beats snappy.
+    # The file is always read whole, so large pages cut per-page header work
+    # and min/max statistics are never consulted
+    _PARQUET_WRITE_OPTIONS: Dict[str, Any] = {
+        "version": "2.6",
+        "compression": "zstd",
+        "compression_level": 3,
+        "use_dictionary": False,
+        "data_page_size": 8 * 1024 * 1024,
+        "write_statistics": False,
+    }
+
+    # In-memory caches for session performance, LRU-bounded so a long session
+    # that opens many portfolios doesn't keep every returns matrix resident
+    _MEMORY_CACHE_MAX_ENTRIES = 8
+    _memory_cache: "OrderedDict[str, Any]" = OrderedDict()
+
+    # When each memory-cached frame was loaded; a hit is fresh if the
+    # portfolio hasn't been modified since, without stat-ing the parquet file
+    _memory_cache_timestamps: Dict[str, datetime] = {}
+
+    # Wide Close-price matrix per portfolio, captured while computing returns
+    # so PositionHistoryService can value positions without a second fetch
+    _close_cache: "OrderedDict[str, Any]" = OrderedDict()
+
+    # NaN-filled float32 copy of each cached returns frame, keyed to the frame
+    # it was built from: (frame, array). Weighted-sum getters slice it instead
+    # of re-running the NaN fill per call
+    _filled_cache: "OrderedDict[str, Tuple[Any, Any]]" = OrderedDict()
+
+    # Portfolio mtime memo: (mtime, monotonic fetch time). Every getter checks
+    # validity, so analytics chains would otherwise stat the same file repeatedly
+    _MTIME_TTL_S = 1.0
+    _mtime_cache: Dict[str, Tuple[Optional[datetime], float]] = {}
 
     @classmethod
     def _ensure_cache_dir(cls) -> None:
@@ -59,7 +93,7 @@ class ReturnsDataService:
             return False
 
         # Get portfolio modification time
-        portfolio_mtime = PortfolioDataService.get_portfolio_modified_time(portfolio_name)
+        portfolio_mtime = cls._get_portfolio_mtime(portfolio_name)
         if portfolio_mtime is None:
             return False
 
@@ -72,12 +106,53 @@ class ReturnsDataService:
         # Cache valid if created after portfolio was last modified
         return cache_mtime > portfolio_mtime
 
+    @classmethod
+    def _get_portfolio_mtime(cls, portfolio_name: str) -> Optional[datetime]:
+        """Portfolio modification time, memoized for _MTIME_TTL_S seconds."""
+        now = time.monotonic()
+        cached = cls._mtime_cache.get(portfolio_name)
+        if cached is not None and now - cached[1] < cls._MTIME_TTL_S:
+            return cached[0]
+
+        mtime = PortfolioDataService.get_portfolio_modified_time(portfolio_name)
+        cls._mtime_cache[portfolio_name] = (mtime, now)
+        return mtime
+
+    @classmethod
+    def _is_memory_cache_valid(cls, portfolio_name: str) -> bool:
+        """Check a memory-cached frame against the portfolio's modification time."""
+        loaded_at = cls._memory_cache_timestamps.get(portfolio_name)
+        if loaded_at is None or portfolio_name not in cls._memory_cache:
+            return False
+
+        portfolio_mtime = cls._get_portfolio_mtime(portfolio_name)
+        return portfolio_mtime is not None and loaded_at > portfolio_mtime
+
+    @classmethod
+    def _store_returns(cls, portfolio_name: str, df: "pd.DataFrame") -> None:
+        """Put a returns frame in the memory cache and stamp its load time."""
+        cls._lru_put(cls._memory_cache, portfolio_name, df)
+        cls._memory_cache_timestamps[portfolio_name] = datetime.now()
+
+    @classmethod
+    def _lru_put(cls, cache: "OrderedDict[str, Any]", key: str, value: Any) -> None:
+        """Insert into an LRU cache, evicting the oldest entries past the cap."""
+        cache[key] = value
+        cache.move_to_end(key)
+        while len(cache) > cls._MEMORY_CACHE_MAX_ENTRIES:
+            evicted, _ = cache.popitem(last=False)
+            if cache is cls._memory_cache:
+                # Keep the per-portfolio side tables bounded with the cache
+                cls._memory_cache_timestamps.pop(evicted, None)
+                cls._mtime_cache.pop(evicted, None)
+
     @classmethod
     def get_daily_returns(
         cls,
         portfolio_name: str,
         start_date: Optional[str] = None,
         end_date: Optional[str] = None,
+        copy: bool = True,
     ) -> "pd.DataFrame":
         """
         Get daily returns for all tickers in a portfolio.
@@ -91,26 +166,35 @@ class ReturnsDataService:
             portfolio_name: Name of the portfolio
             start_date: Optional start date filter (YYYY-MM-DD)
             end_date: Optional end date filter (YYYY-MM-DD)
+            copy: If False, return the memory-cached frame (or a slice of it)
+                without copying. The result is shared and must be treated as
+                read-only; meant for internal read-only hot paths.
 
         Returns:
             DataFrame of daily returns, or empty DataFrame if portfolio not found
         """
-        import pandas as pd
+        import pyarrow.parquet as pq
 
         with cls._cache_lock:
-            # Check memory cache first
-            if portfolio_name in cls._memory_cache:
-                if cls._is_cache_valid(portfolio_name):
-                    df = cls._memory_cache[portfolio_name]
-                    return cls._filter_date_range(df, start_date, end_date)
+            # Check memory cache first - no filesystem access on a hit
+            if cls._is_memory_cache_valid(portfolio_name):
+                cls._memory_cache.move_to_end(portfolio_name)
+                df = cls._memory_cache[portfolio_name]
+                return cls._filter_date_range(df, start_date, end_date, copy=copy)
 
             # Check disk cache
             if cls._is_cache_valid(portfolio_name):
                 cache_path = cls._get_cache_path(portfolio_name)
                 try:
-                    df = pd.read_parquet(cache_path)
-                    cls._memory_cache[portfolio_name] = df
-                    return cls._filter_date_range(df, start_date, end_date)
+                    # Direct pyarrow read: threaded column decode, memory-mapped
+                    # file, and Arrow buffers released as they are converted
+                    table = pq.read_table(cache_path, use_threads=True, memory_map=True)
+                    df = table.to_pandas(self_destruct=True)
+                    del table
+                    if not df.index.is_monotonic_increasing:
+                        df = df.sort_index()
+                    cls._store_returns(portfolio_name, df)
+                    return cls._filter_date_range(df, start_date, end_date, copy=copy)
                 except Exception:
                     pass  # Cache corrupted, will recompute
 
@@ -122,14 +206,19 @@ class ReturnsDataService:
             # Cache to disk
             cls._ensure_cache_dir()
             try:
-                df.to_parquet(cls._get_cache_path(portfolio_name))
+                df.to_parquet(
+                    cls._get_cache_path(portfolio_name),
+                    engine="pyarrow",
+                    row_group_size=len(df),
+                    **cls._PARQUET_WRITE_OPTIONS,
+                )
             except Exception as e:
                 print(f"Warning: Could not cache returns for {portfolio_name}: {e}")
 
             # Cache in memory
-            cls._memory_cache[portfolio_name] = df
+            cls._store_returns(portfolio_name, df)
 
-            return cls._filter_date_range(df, start_date, end_date)
+            return cls._filter_date_range(df, start_date, end_date, copy=copy)
 
     @classmethod
     def _compute_returns(cls, portfolio_name: str) -> "pd.DataFrame":
@@ -152,6 +241,7 @@ class ReturnsDataService:
         price_data = fetch_price_history_batch(tickers)
 
         returns_dict: Dict[str, Any] = {}
+        close_dict: Dict[str, Any] = {}
 
         for ticker in tickers:
             try:
@@ -167,6 +257,7 @@ class ReturnsDataService:
                 daily_returns = close.pct_change().dropna()
 
                 returns_dict[ticker] = daily_returns
+                close_dict[ticker] = close
 
             except Exception as e:
                 print(f"Warning: Could not compute returns for {ticker}: {e}")
@@ -176,35 +267,127 @@ class ReturnsDataService:
             return pd.DataFrame()
 
         # Combine all returns into a single DataFrame
-        # Use outer join to preserve all dates (NaN for missing)
-        df = pd.DataFrame(returns_dict)
-        df.index = pd.to_datetime(df.index)
-        df.sort_index(inplace=True)
+        # Use outer join to preserve all dates (NaN for missing); concat does a
+        # single union-join instead of aligning column by column
+        df = cls._combine_columns(returns_dict)
+        cls._lru_put(cls._close_cache, portfolio_name, cls._combine_columns(close_dict))
+
+        # Daily returns carry far fewer significant digits than float64 offers;
+        # float32 halves the parquet size and the bytes scanned by every
+        # downstream rolling/corr/weighted-sum pass.
+        return df.astype("float32")
+
+    @staticmethod
+    def _combine_columns(series_dict: Dict[str, "pd.Series"]) -> "pd.DataFrame":
+        """Outer-join ticker -> Series into one date-sorted DataFrame."""
+        import pandas as pd
 
+        df = pd.concat(series_dict, axis=1)
+        if not isinstance(df.index, pd.DatetimeIndex):
+            df.index = pd.to_datetime(df.index)
+        if not df.index.is_monotonic_increasing:
+            df.sort_index(inplace=True)
         return df
 
+    @classmethod
+    def get_close_matrix(cls, portfolio_name: str) -> Optional["pd.DataFrame"]:
+        """
+        Get Close prices for every ticker in a portfolio.
+
+        Normally captured while computing returns. When the returns were
+        served from the disk cache instead, prices are batch-fetched once and
+        kept for the session, so weights and returns share a single fetch.
+
+        Returns:
+            DataFrame with dates as index and tickers as columns (NaN where a
+            ticker did not trade), or None if no prices are available
+        """
+        from app.services.market_data import fetch_price_history_batch
+
+        with cls._cache_lock:
+            closes = cls._close_cache.get(portfolio_name)
+            if closes is not None and cls._is_cache_valid(portfolio_name):
+                cls._close_cache.move_to_end(portfolio_name)
+                return closes
+
+            tickers = PortfolioDataService.get_tickers(portfolio_name)
+            if not tickers:
+                return None
+
+            price_data = fetch_price_history_batch(tickers)
+            close_dict = {
+                ticker: price_data[ticker]["Close"]
+                for ticker in tickers
+                if price_data.get(ticker) is not None and not price_data[ticker].empty
+            }
+            if not close_dict:
+                return None
+
+            closes = cls._combine_columns(close_dict)
+            cls._lru_put(cls._close_cache, portfolio_name, closes)
+            return closes
+
     @classmethod
     def _filter_date_range(
         cls,
-        df: "pd.DataFrame",
+        df: "pd.DataFrame | pd.Series",
         start_date: Optional[str],
         end_date: Optional[str],
-    ) -> "pd.DataFrame":
-        """Filter DataFrame to date range."""
+        copy: bool = True,
+    ) -> "pd.DataFrame | pd.Series":
+        """
+        Filter a DataFrame or Series to date range.
+
+        Returns a copy unless ``copy=False``, in which case the result may be
+        ``df`` itself or a view of it and must not be mutated.
+        """
         import pandas as pd
 
-        if df.empty:
-            return df
+        if df.empty or (not start_date and not end_date):
+            return df.copy() if copy else df
 
-        result = df.copy()
+        # Label slicing on a sorted DatetimeIndex is a searchsorted, not two
+        # full-length boolean masks
+        if not df.index.is_monotonic_increasing:
+            df = df.sort_index()
 
-        if start_date:
-            result = result[result.index >= pd.to_datetime(start_date)]
+        start = pd.to_datetime(start_date) if start_date else None
+        end = pd.to_datetime(end_date) if end_date else None
+        result = df.loc[start:end]
+        return result.copy() if copy else result
 
-        if end_date:
-            result = result[result.index <= pd.to_datetime(end_date)]
+    @classmethod
+    def _get_filled_values(cls, portfolio_name: str, returns: "pd.DataFrame") -> "np.ndarray":
+        """
+        NaN-filled float32 values for a frame returned by get_daily_returns.
 
-        return result
+        When ``returns`` is a date slice of the memory-cached frame, the rows
+        are sliced from a shared read-only array built once per cached frame.
+        Anything else is converted directly.
+        """
+        import numpy as np
+
+        with cls._cache_lock:
+            full = cls._memory_cache.get(portfolio_name)
+            if full is not None and not returns.empty and full.columns.equals(returns.columns):
+                start = full.index.searchsorted(returns.index[0])
+                stop = start + len(returns)
+                if (
+                    stop <= len(full)
+                    and full.index[start] == returns.index[0]
+                    and full.index[stop - 1] == returns.index[-1]
+                ):
+                    entry = cls._filled_cache.get(portfolio_name)
+                    if entry is None or entry[0] is not full:
+                        filled = full.to_numpy(dtype=np.float32, na_value=0.0)
+                        filled.flags.writeable = False
+                        entry = (full, filled)
+                        cls._lru_put(cls._filled_cache, portfolio_name, entry)
+                    else:
+                        cls._filled_cache.move_to_end(portfolio_name)
+                    return entry[1][start:stop]
+
+        return returns.to_numpy(dtype=np.float32, na_value=0.0)
 
     @classmethod
     def get_portfolio_returns(
@@ -227,9 +410,10 @@ class ReturnsDataService:
         Returns:
             Series of daily portfolio returns
         """
+        import numpy as np
         import pandas as pd
 
-        returns = cls.get_daily_returns(portfolio_name, start_date, end_date)
+        returns = cls.get_daily_returns(portfolio_name, start_date, end_date, copy=False)
         if returns.empty:
             return pd.Series(dtype=float)
 
@@ -245,15 +429,14 @@ class ReturnsDataService:
                 return pd.Series(dtype=float)
             w = {t: weights.get(t, 0) / total for t in tickers}
 
-        # Calculate weighted returns
-        # Fill NaN with 0 for days where ticker didn't trade
-        portfolio_returns = pd.Series(0.0, index=returns.index)
-        for ticker in tickers:
-            if ticker in w and w[ticker] > 0:
-                ticker_returns = returns[ticker].fillna(0)
-                portfolio_returns += ticker_returns * w[ticker]
+        # Calculate weighted returns as a single matrix-vector product
+        # Fill NaN with 0 for days where ticker didn't trade; only positive
+        # weights contribute. The product runs at the cached float32 width and
+        # only the result is widened to float64.
+        w_vec = np.array([max(w[t], 0.0) for t in tickers], dtype=np.float32)
+        values = cls._get_filled_values(portfolio_name, returns)
 
-        return portfolio_returns
+        return pd.Series((values @ w_vec).astype(np.float64), index=returns.index)
 
     @classmethod
     def get_cumulative_returns(
@@ -273,15 +456,27 @@ class ReturnsDataService:
         Returns:
             DataFrame with cumulative returns (1.0 = 100% gain)
         """
+        import numpy as np
         import pandas as pd
 
-        returns = cls.get_daily_returns(portfolio_name, start_date, end_date)
+        returns = cls.get_daily_returns(portfolio_name, start_date, end_date, copy=False)
         if returns.empty:
             return pd.DataFrame()
 
         # Calculate cumulative returns: (1 + r1) * (1 + r2) * ... - 1
-        cumulative = (1 + returns).cumprod() - 1
-        return cumulative
+        # Accumulated in log space - exp(sum(log1p(r))) - 1 - in place on a
+        # single float64 buffer (float32 returns are promoted). Missing days
+        # compound as 0% and stay NaN in the output, matching pandas' skipna
+        # cumprod. A -100% day gives log1p = -inf, which expm1 maps back to -1.
+        arr = returns.to_numpy(dtype=np.float64, copy=True)
+        missing = np.isnan(arr)
+        arr[missing] = 0.0
+        with np.errstate(divide="ignore", invalid="ignore"):
+            np.log1p(arr, out=arr)
+            np.cumsum(arr, axis=0, out=arr)
+            np.expm1(arr, out=arr)
+        arr[missing] = np.nan
+        return pd.DataFrame(arr, index=returns.index, columns=returns.columns)
 
     @classmethod
     def invalidate_cache(cls, portfolio_name: str) -> None:
@@ -296,6 +491,10 @@ class ReturnsDataService:
         with cls._cache_lock:
             # Clear memory cache
             cls._memory_cache.pop(portfolio_name, None)
+            cls._memory_cache_timestamps.pop(portfolio_name, None)
+            cls._close_cache.pop(portfolio_name, None)
+            cls._filled_cache.pop(portfolio_name, None)
+            cls._mtime_cache.pop(portfolio_name, None)
 
             # Delete disk cache
             cache_path = cls._get_cache_path(portfolio_name)
@@ -310,6 +509,10 @@ class ReturnsDataService:
         """Clear all cached returns."""
         with cls._cache_lock:
             cls._memory_cache.clear()
+            cls._memory_cache_timestamps.clear()
+            cls._close_cache.clear()
+            cls._filled_cache.clear()
+            cls._mtime_cache.clear()
 
             if cls._CACHE_DIR.exists():
                 for cache_file in cls._CACHE_DIR.glob("*_returns.parquet"):
@@ -346,7 +549,7 @@ class ReturnsDataService:
         """
         import pandas as pd
 
-        returns = cls.get_daily_returns(portfolio_name, start_date, end_date)
+        returns = cls.get_daily_returns(portfolio_name, start_date, end_date, copy=False)
         if returns.empty:
             return pd.DataFrame()
 
@@ -375,10 +578,22 @@ class ReturnsDataService:
         import numpy as np
         import pandas as pd
 
-        returns = cls.get_daily_returns(portfolio_name, start_date, end_date)
+        returns = cls.get_daily_returns(portfolio_name, start_date, end_date, copy=False)
         if returns.empty:
             return pd.DataFrame()
 
+        from app.utils.numba_kernels import HAS_NUMBA
+
+        if HAS_NUMBA and 2 <= window <= len(returns):
+            # Fused streaming-variance kernel, parallel across tickers
+            from app.utils.numba_kernels import rolling_annualized_volatility
+
+            vol = rolling_annualized_volatility(returns.to_numpy(), window, 252.0)
+            keep = ~np.isnan(vol).any(axis=1)
+            return pd.DataFrame(
+                vol[keep], index=returns.index[window - 1:][keep], columns=returns.columns
+            )
+
         # Annualized volatility = daily_std * sqrt(252)
         volatility = returns.rolling(window=window).std() * np.sqrt(252)
         return volatility.dropna()
@@ -442,6 +657,7 @@ class ReturnsDataService:
         Returns:
             Series of portfolio returns at the specified interval
         """
+        import numpy as np
         import pandas as pd
 
         # Weights-based portfolios use constant weights (daily rebalanced)
@@ -456,6 +672,11 @@ class ReturnsDataService:
                 returns = cls._resample_returns(returns, interval)
             return returns
 
+        # Get daily returns first - computing them warms the Close-price
+        # matrix that get_daily_weights reuses instead of refetching prices
+        returns = cls.get_daily_returns(portfolio_name, start_date, end_date, copy=False)
+        filled = cls._get_filled_values(portfolio_name, returns)
+
         # Get time-varying weights
         weights = cls.get_daily_weights(
             portfolio_name, start_date, end_date, include_cash
@@ -463,15 +684,12 @@ class ReturnsDataService:
         if weights.empty:
             return pd.Series(dtype=float)
 
-        # Get daily returns for all tickers (excluding FREE CASH - it has 0% return)
+        # Tickers excluding FREE CASH - it has 0% return
         tickers = [t for t in weights.columns if t.upper() != "FREE CASH"]
 
         if not tickers:
             return pd.Series(0.0, index=weights.index, name="portfolio_return")
 
-        # Get daily returns
-        returns = cls.get_daily_returns(portfolio_name, start_date, end_date)
-
         # Normalize both indices to date-only (remove time component and timezone)
         # This fixes mismatches like 2026-01-15 00:00:00 vs 2026-01-15 05:00:00
         weights_idx = pd.to_datetime(weights.index).normalize()
@@ -481,8 +699,9 @@ class ReturnsDataService:
             weights_idx = weights_idx.tz_localize(None)
         if returns_idx.tz is not None:
             returns_idx = returns_idx.tz_localize(None)
-        weights.index = weights_idx
-        returns.index = returns_idx
+        # set_axis rather than assigning .index - returns may be the cached frame
+        weights = weights.set_axis(weights_idx)
+        returns = returns.set_axis(returns_idx)
 
         # Ensure same index
         common_dates = weights.index.intersection(returns.index)
@@ -490,22 +709,17 @@ class ReturnsDataService:
             return pd.Series(dtype=float)
 
         weights = weights.loc[common_dates]
-        returns = returns.loc[common_dates]
 
         # Calculate weighted portfolio returns for each day
         # portfolio_return = sum(weight_i * return_i)
-        # FREE CASH contributes weight * 0 = 0
-        portfolio_returns = pd.Series(0.0, index=common_dates, name="portfolio_return")
-
-        for ticker in weights.columns:
-            if ticker.upper() == "FREE CASH":
-                # Cash has 0% return, contributes nothing
-                continue
-
-            if ticker in returns.columns:
-                ticker_returns = returns[ticker].fillna(0)
-                ticker_weights = weights[ticker]
-                portfolio_returns += ticker_weights * ticker_returns
+        # FREE CASH has 0% return and contributes nothing, so it is left out
+        cols = [t for t in tickers if t in returns.columns]
+        w_mat = weights[cols].to_numpy(dtype=np.float64)
+        rows = returns.index.get_indexer(common_dates)
+        r_mat = filled[np.ix_(rows, returns.columns.get_indexer(cols))].astype(np.float64)
+        portfolio_returns = pd.Series(
+            np.einsum("ij,ij->i", w_mat, r_mat), index=common_dates, name="portfolio_return"
+        )
 
         # Resample if needed
         if interval.lower() != "daily":
@@ -513,6 +727,35 @@ class ReturnsDataService:
 
         return portfolio_returns
 
+    @classmethod
+    def _rolling_compound_returns(cls, returns: "pd.Series", window_days: int) -> "pd.Series":
+        """
+        Compound returns over a rolling window using geometric linking.
+
+        Args:
+            returns: Daily returns series
+            window_days: Rolling window length in rows
+
+        Returns:
+            Series of rolling compounded returns (leading partial windows dropped)
+        """
+        import numpy as np
+
+        # (1 + r1) * ... * (1 + rn) - 1 as exp(rolling_sum(log1p(r))) - 1, so the
+        # window reduction is pandas' running-sum kernel instead of a Python
+        # callable per window. A -100% day (log1p = -inf) would poison the
+        # running sum, so it is summed as 0 and the windows holding it set to -1.
+        with np.errstate(divide="ignore"):
+            log_returns = np.log1p(returns)
+        wiped_out = np.isneginf(log_returns)
+        rolling_returns = np.expm1(
+            log_returns.mask(wiped_out, 0.0).rolling(window=window_days).sum()
+        )
+        if wiped_out.any():
+            rolling_returns[wiped_out.astype(float).rolling(window=window_days).sum() > 0] = -1.0
+
+        return rolling_returns.dropna()
+
     @classmethod
     def _resample_returns(cls, returns: "pd.Series", interval: str) -> "pd.Series":
         """
@@ -525,6 +768,8 @@ class ReturnsDataService:
         Returns:
             Resampled returns series
         """
+        import numpy as np
+
         if returns.empty:
             return returns
 
@@ -539,11 +784,12 @@ class ReturnsDataService:
         if not rule:
             return returns
 
-        # Geometric linking: (1 + r1) * (1 + r2) * ... - 1
-        def compound_returns(r):
-            return (1 + r).prod() - 1
-
-        return returns.resample(rule).apply(compound_returns)
+        # Geometric linking: (1 + r1) * (1 + r2) * ... - 1, as exp(sum(log1p(r))) - 1
+        # so the per-bin reduction is pandas' built-in sum rather than a
+        # Python callable per bin. NaNs are skipped and empty bins give 0.
+        with np.errstate(divide="ignore"):
+            log_returns = np.log1p(returns)
+        return np.expm1(log_returns.resample(rule).sum())
 
     @classmethod
     def calculate_cash_drag(
@@ -569,6 +815,8 @@ class ReturnsDataService:
             - cash_drag_bps: Estimated return reduction in basis points
             - period_days: Number of days analyzed
         """
+        import numpy as np
+
         # Weights portfolios have no cash concept
         if PortfolioDataService.is_weights_portfolio(portfolio_name):
             return {
@@ -605,13 +853,21 @@ class ReturnsDataService:
             }
 
         # Calculate average cash weight
-        cash_weights = weights[cash_col]
-        avg_cash_weight = cash_weights.mean()
+        avg_cash_weight = float(np.nanmean(weights[cash_col].to_numpy(dtype=np.float64)))
 
         # Calculate average daily market return (non-cash positions)
-        returns = cls.get_daily_returns(portfolio_name, start_date, end_date)
+        returns = cls.get_daily_returns(portfolio_name, start_date, end_date, copy=False)
         if not returns.empty:
-            avg_daily_return = returns.mean().mean()  # Mean across all tickers
+            # Mean across all tickers: per-column nan-means from one masked
+            # sum/count pass, so each ticker weighs equally regardless of history
+            arr = returns.to_numpy()
+            valid = ~np.isnan(arr)
+            counts = valid.sum(axis=0)
+            sums = np.where(valid, arr, 0.0).sum(axis=0, dtype=np.float64)
+            has_data = counts > 0
+            avg_daily_return = (
+                float((sums[has_data] / counts[has_data]).mean()) if has_data.any() else np.nan
+            )
             # Annualize: (1 + daily)^252 - 1, approximated as daily * 252
             annualized_market_return = avg_daily_return * 252
             # Cash drag in basis points (cash weight * missed return * 10000)
@@ -836,15 +1092,7 @@ class ReturnsDataService:
             return pd.Series(dtype=float)
 
         # Calculate rolling compounded returns
-        # (1 + r1) * (1 + r2) * ... * (1 + rn) - 1
-        def compound_return(window):
-            return (1 + window).prod() - 1
-
-        rolling_returns = returns.rolling(window=window_days).apply(
-            compound_return, raw=False
-        )
-
-        return rolling_returns.dropna()
+        return cls._rolling_compound_returns(returns, window_days)
 
     @classmethod
     def get_time_under_water(
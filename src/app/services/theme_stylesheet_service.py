@@ -1,6 +1,284 @@
 """Theme Stylesheet Service - Centralized widget stylesheets by theme."""
 
-from typing import Dict, Tuple
+import sys
+from dataclasses import dataclass, fields
+from types import MappingProxyType
+from typing import Dict, Final, Iterator, Mapping, Tuple
+
+
+@dataclass(frozen=True, slots=True)
+class ThemeColors(Mapping[str, str]):
+    """
+    Immutable color palette for one theme.
+
+    Fields read as attributes (``c.bg``). The Mapping interface keeps
+    ``c['bg']`` lookups and %-template formatting working for existing callers.
+    """
+
+    accent: str
+    accent_hover: str
+    accent_selection: str
+    bg: str
+    bg_alt: str
+    bg_header: str
+    border: str
+    text: str
+    text_muted: str
+    text_on_accent: str
+
+    def __getitem__(self, key: str) -> str:
+        if key not in _THEME_COLOR_KEYS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(_THEME_COLOR_KEYS)
+
+    def __len__(self) -> int:
+        return len(_THEME_COLOR_KEYS)
+
+
+_THEME_COLOR_KEYS: Final[Tuple[str, ...]] = tuple(f.name for f in fields(ThemeColors))
+
+
+def _rgba(hex_color: str, alpha: float) -> str:
+    """Convert a '#rrggbb' color to a CSS rgba() string with the given alpha."""
+    r, g, b = (int(hex_color[i:i + 2], 16) for i in (1, 3, 5))
+    return f"rgba({r}, {g}, {b}, {alpha})"
+
+
+def _read_only(table: Mapping[str, Mapping[str, str]]) -> Mapping[str, Mapping[str, str]]:
+    """Wrap a per-theme palette table, and each theme's row, in read-only proxies."""
+    return MappingProxyType({theme: MappingProxyType(dict(row)) for theme, row in table.items()})
+
+
+def _minify_css(css: str) -> str:
+    """Collapse stylesheet whitespace that Qt's parser ignores.
+
+    Runs of whitespace become one space, and spaces around braces, colons,
+    semicolons and commas are dropped. The spaces between words
+    (descendant selectors, multi-part values, quoted font names) are kept.
+    """
+    # str.split/replace run in C; a regex sub here dominated cache warm-up
+    css = " ".join(css.split())
+    for punct in "{}:;,":
+        css = css.replace(" " + punct, punct).replace(punct + " ", punct)
+    return css
+
+
+# Declarations shared by the in-cell line-edit and combobox templates
+_EDITOR_BASE: Final = """
+                background-color: transparent;
+                border: none;"""
+_EDITOR_FONT: Final = """
+                font-size: 14px;"""
+_DROPDOWN_HIDDEN: Final = """
+            QComboBox::drop-down { border: none; width: 0px; }"""
+
+# Base QPushButton rules shared by the dialog and toolbar templates; both
+# substitution dicts provide bg_hover
+_PUSH_BUTTON_BASE: Final = """
+            QPushButton {
+                background-color: %(bg_header)s;
+                color: %(text)s;
+                border: 1px solid %(border)s;
+                border-radius: 3px;
+                padding: 6px 12px;
+                font-size: 13px;
+            }
+            QPushButton:hover {
+                background-color: %(bg_hover)s;
+                border-color: %(accent)s;
+            }"""
+
+
+# Theme color constants - immutable, shared by every caller of get_colors
+# and by the cached stylesheets, so nothing can mutate them
+COLORS: Final[Mapping[str, ThemeColors]] = MappingProxyType({
+    "dark": ThemeColors(
+        accent="#00d4ff",
+        accent_hover="#00e5ff",
+        accent_selection="#40e0ff",
+        bg="#1e1e1e",
+        bg_alt="#232323",
+        bg_header="#2d2d2d",
+        border="#3d3d3d",
+        text="#ffffff",
+        text_muted="#cccccc",
+        text_on_accent="#000000",
+    ),
+    "light": ThemeColors(
+        accent="#0066cc",
+        accent_hover="#0077dd",
+        accent_selection="#0088ee",
+        bg="#ffffff",
+        bg_alt="#f5f5f5",
+        bg_header="#f5f5f5",
+        border="#cccccc",
+        text="#000000",
+        text_muted="#333333",
+        text_on_accent="#ffffff",
+    ),
+    "bloomberg": ThemeColors(
+        accent="#FF8000",
+        accent_hover="#FF9020",
+        accent_selection="#FFa040",
+        bg="#000814",
+        bg_alt="#0a0f1c",
+        bg_header="#0d1420",
+        border="#1a2838",
+        text="#e8e8e8",
+        text_muted="#a8a8a8",
+        text_on_accent="#000000",
+    ),
+})
+
+# ------------------------------------------------------------------
+# Layout stylesheet color palettes (preserves exact ThemeManager values)
+# ------------------------------------------------------------------
+
+# Tokens shared with the base palette are read from COLORS so each hex
+# value has a single definition; only layout-specific colors are literal
+_dark, _light, _bloomberg = COLORS["dark"], COLORS["light"], COLORS["bloomberg"]
+
+# Theme-specific font declarations, empty where the theme keeps the default
+_MONO_FONT: Final = 'font-family: "Menlo", "Consolas", "Courier New";'
+_UI_FONT: Final = 'font-family: "Segoe UI", "Arial", sans-serif;'
+
+_SIDEBAR: Final[Mapping[str, Mapping[str, str]]] = _read_only({
+    "dark": {
+        "bg": _dark.bg_header, "text": _dark.text, "header_bg": "#1a1a1a",
+        "accent": _dark.accent, "footer": "#666666", "nav_text": _dark.text_muted,
+        "hover_bg": "#3d3d3d", "hover_text": _dark.text,
+        "text_on_accent": _dark.text_on_accent, "mono": "", "hover_border": "",
+    },
+    "light": {
+        "bg": _light.bg_header, "text": _light.text, "header_bg": "#e0e0e0",
+        "accent": _light.accent, "footer": "#999999", "nav_text": _light.text_muted,
+        "hover_bg": "#e8e8e8", "hover_text": _light.text,
+        "text_on_accent": _light.text_on_accent, "mono": "", "hover_border": "",
+    },
+    "bloomberg": {
+        "bg": _bloomberg.bg_header, "text": _bloomberg.text, "header_bg": _bloomberg.bg,
+        "accent": _bloomberg.accent, "footer": "#666666", "nav_text": "#b0b0b0",
+        "hover_bg": "#162030", "hover_text": _bloomberg.text,
+        "text_on_accent": _bloomberg.text_on_accent, "mono": _MONO_FONT,
+        "hover_border": f"border-left: 3px solid {_bloomberg.accent};",
+    },
+})
+
+_CONTENT: Final[Mapping[str, Mapping[str, str]]] = _read_only({
+    "dark": {
+        "bg": _dark.bg, "text": _dark.text, "text_muted": _dark.text_muted,
+        "groupbox_bg": _dark.bg_header, "groupbox_extra": "",
+    },
+    "light": {
+        "bg": _light.bg, "text": _light.text, "text_muted": _light.text_muted,
+        "groupbox_bg": _light.bg_header, "groupbox_extra": "border: 2px solid #d0d0d0;",
+    },
+    "bloomberg": {
+        "bg": _bloomberg.bg, "text": _bloomberg.text, "text_muted": "#b0b0b0",
+        "groupbox_bg": "#0a1018",
+        "groupbox_extra": "border: 1px solid #1a2332; " + _UI_FONT,
+    },
+})
+
+_CONTROLS: Final[Mapping[str, Mapping[str, str]]] = _read_only({
+    "dark": {
+        "bg": _dark.bg_header, "accent": _dark.accent, "label_color": "#b0b0b0",
+        "label_size": "12px", "input_bg": _dark.bg, "input_text": _dark.text,
+        "input_border": _dark.border, "input_padding": "7px 10px", "input_font": "",
+        "selection_color": _dark.text_on_accent, "hover_bg": "#252525", "focus_bg": "#252525",
+        "arrow_color": _dark.text_muted, "dropdown_bg": _dark.bg_header,
+        "dropdown_text": _dark.text,
+    },
+    "light": {
+        "bg": _light.bg_header, "accent": _light.accent, "label_color": "#555555",
+        "label_size": "12px", "input_bg": _light.bg, "input_text": _light.text,
+        "input_border": _light.border, "input_padding": "7px 10px", "input_font": "",
+        "selection_color": _light.text_on_accent, "hover_bg": "#f9f9f9", "focus_bg": _light.bg,
+        "arrow_color": "#555555", "dropdown_bg": _light.bg, "dropdown_text": _light.text,
+    },
+    "bloomberg": {
+        "bg": _bloomberg.bg_header, "accent": _bloomberg.accent, "label_color": "#b0b0b0",
+        "label_size": "11px", "input_bg": "#0a1018", "input_text": _bloomberg.text,
+        "input_border": "#1a2332", "input_padding": "6px 10px",
+        "input_font": _MONO_FONT,
+        "selection_color": _bloomberg.text_on_accent, "hover_bg": _bloomberg.bg_header,
+        "focus_bg": _bloomberg.bg_header, "arrow_color": "#b0b0b0",
+        "dropdown_bg": _bloomberg.bg_header, "dropdown_text": _bloomberg.text,
+    },
+})
+
+# Buttons use only base-palette tokens plus a translucent accent
+_BUTTON: Final[Mapping[str, Mapping[str, str]]] = _read_only({
+    theme: {
+        "text": c.text, "accent": c.accent,
+        "accent_rgba": _rgba(c.accent, 0.15),
+        "text_on_accent": c.text_on_accent,
+        "font": _UI_FONT if theme == "bloomberg" else "",
+    }
+    for theme, c in COLORS.items()
+})
+
+del _dark, _light, _bloomberg
+
+# Extra per-theme colors for the dialog and toolbar stylesheets
+_DIALOG: Final[Mapping[str, Mapping[str, str]]] = _read_only({
+    "dark": {
+        "bg_pressed": "#1a1a1a", "bg_hover": "#3d3d3d",
+        "text_desc": "#888888", "text_disabled": "#666666",
+    },
+    "light": {
+        "bg_pressed": "#d0d0d0", "bg_hover": "#e8e8e8",
+        "text_desc": "#666666", "text_disabled": "#999999",
+    },
+    "bloomberg": {
+        "bg_pressed": "#060a10", "bg_hover": "#1a2838",
+        "text_desc": "#666666", "text_disabled": "#555555",
+    },
+})
+
+_TOOLBAR: Final[Mapping[str, Mapping[str, str]]] = _read_only({
+    "dark": {
+        "bg_hover": "#3d3d3d", "bg_pressed": "#1a1a1a",
+        "run_hover": "#00bfe6", "run_pressed": "#00a6c7",
+        "disabled_bg": "#1a1a1a", "disabled_text": "#666666",
+        "disabled_border": "#2d2d2d", "delete_hover_bg": "#5c1a1a",
+    },
+    "light": {
+        "bg_hover": "#e8e8e8", "bg_pressed": "#d0d0d0",
+        "run_hover": "#0055aa", "run_pressed": "#004488",
+        "disabled_bg": "#e0e0e0", "disabled_text": "#999999",
+        "disabled_border": "#cccccc", "delete_hover_bg": "#ffebee",
+    },
+    "bloomberg": {
+        "bg_hover": "#1a2838", "bg_pressed": "#060a10",
+        "run_hover": "#e67300", "run_pressed": "#cc6600",
+        "disabled_bg": "#060a10", "disabled_text": "#555555",
+        "disabled_border": "#1a2838", "delete_hover_bg": "#3d1a1a",
+    },
+})
+
+# PyQtGraph chart colors; unknown themes fall back to the "dark" entry
+_CHART_BACKGROUND_RGB: Final[Mapping[str, Tuple[int, int, int]]] = MappingProxyType({
+    "dark": (30, 30, 30), "light": (255, 255, 255), "bloomberg": (13, 20, 32),
+})
+_CHART_ACCENT_RGB: Final[Mapping[str, Tuple[int, int, int]]] = MappingProxyType({
+    "dark": (0, 212, 255), "light": (0, 102, 204), "bloomberg": (255, 128, 0),
+})
+_CHART_TEXT_RGB: Final[Mapping[str, Tuple[int, int, int]]] = MappingProxyType({
+    "dark": (255, 255, 255), "light": (0, 0, 0), "bloomberg": (255, 255, 255),
+})
+_CHART_CROSSHAIR_RGB: Final[Mapping[str, Tuple[int, int, int]]] = MappingProxyType({
+    "dark": (150, 150, 150), "light": (100, 100, 100), "bloomberg": (100, 120, 140),
+})
+_CHART_BACKGROUND: Final[Mapping[str, str]] = MappingProxyType({
+    "dark": "#1e1e1e", "light": "w", "bloomberg": "#000814",
+})
+_CHART_LINE_RGB: Final[Mapping[str, Tuple[int, int, int]]] = MappingProxyType({
+    "dark": (76, 175, 80), "light": (0, 0, 0), "bloomberg": (0, 212, 255),
+})
 
 
 class ThemeStylesheetService:
@@ -9,91 +287,125 @@ class ThemeStylesheetService:
 
     Centralizes theme colors and stylesheet generation to avoid duplication
     across modules. All colors are defined in COLORS dict for easy maintenance.
+
+    Stylesheet getters return shared cached strings; treat them as immutable.
     """
 
-    # Theme color constants
-    COLORS: Dict[str, Dict[str, str]] = {
-        "dark": {
-            "accent": "#00d4ff",
-            "accent_hover": "#00e5ff",
-            "accent_selection": "#40e0ff",
-            "bg": "#1e1e1e",
-            "bg_alt": "#232323",
-            "bg_header": "#2d2d2d",
-            "border": "#3d3d3d",
-            "text": "#ffffff",
-            "text_muted": "#cccccc",
-            "text_on_accent": "#000000",
-        },
-        "light": {
-            "accent": "#0066cc",
-            "accent_hover": "#0077dd",
-            "accent_selection": "#0088ee",
-            "bg": "#ffffff",
-            "bg_alt": "#f5f5f5",
-            "bg_header": "#f5f5f5",
-            "border": "#cccccc",
-            "text": "#000000",
-            "text_muted": "#333333",
-            "text_on_accent": "#ffffff",
-        },
-        "bloomberg": {
-            "accent": "#FF8000",
-            "accent_hover": "#FF9020",
-            "accent_selection": "#FFa040",
-            "bg": "#000814",
-            "bg_alt": "#0a0f1c",
-            "bg_header": "#0d1420",
-            "border": "#1a2838",
-            "text": "#e8e8e8",
-            "text_muted": "#a8a8a8",
-            "text_on_accent": "#000000",
-        }
+    # Class alias of the module-level palette; builders read the module
+    # globals directly to skip the class attribute lookup
+    COLORS: Final[Mapping[str, ThemeColors]] = COLORS
+
+    # Rendered stylesheets keyed by (kind, theme, highlighted). They are pure
+    # functions of the fixed palettes, so each theme's variants are rendered
+    # once, on the first request for that theme (see _build_theme), into a
+    # read-only mapping and callers share the same string
+    _stylesheet_cache: Mapping[Tuple[str, str, bool], str] = MappingProxyType({})
+
+    # Stylesheet kinds -> highlighted variants. Every kind renders through
+    # _build_<kind>_stylesheet(theme, highlighted) with a known theme name,
+    # so builders index the palettes directly without a dark fallback
+    _STYLESHEET_VARIANTS: Final[Mapping[str, Tuple[bool, ...]]] = {
+        "table": (False,),
+        "line_edit": (True, False),
+        "combobox": (True, False),
+        "dialog": (False,),
+        "sidebar": (False,),
+        "content": (False,),
+        "controls": (False,),
+        "home_button": (False,),
+        "button": (False,),
+        "toolbar": (False,),
     }
 
     @classmethod
-    def get_colors(cls, theme: str) -> Dict[str, str]:
+    def get_colors(cls, theme: str) -> ThemeColors:
         """Get color palette for a theme."""
-        return cls.COLORS.get(theme, cls.COLORS["dark"])
+        # Resolve the dark fallback only on a miss, not on every call
+        colors = COLORS.get(theme)
+        return colors if colors is not None else COLORS["dark"]
+
+    @classmethod
+    def _cached_stylesheet(cls, kind: str, theme: str, highlighted: bool) -> str:
+        """Miss path for the getters: unknown themes share the dark entry."""
+        if theme not in COLORS:
+            theme = "dark"
+        key = (kind, theme, bool(highlighted))
+        css = cls._stylesheet_cache.get(key)
+        if css is None:
+            cls._build_theme(theme)
+            css = cls._stylesheet_cache[key]
+        return css
+
+    @classmethod
+    def _build_theme(cls, theme: str) -> None:
+        """Render every (kind, highlighted) stylesheet of one theme into the cache."""
+        cache: Dict[Tuple[str, str, bool], str] = dict(cls._stylesheet_cache)
+        for kind, variants in cls._STYLESHEET_VARIANTS.items():
+            build = getattr(cls, f"_build_{kind}_stylesheet")
+            for highlighted in variants:
+                # Minified once here so the getters hand Qt the shortest sheet;
+                # interned so variants that render identically share one object
+                css = _minify_css(build(theme, highlighted))
+                cache[(kind, theme, highlighted)] = sys.intern(css)
+        # Swap in a new mapping so readers never see a partly built theme
+        cls._stylesheet_cache = MappingProxyType(cache)
+
+    @classmethod
+    def reload(cls) -> None:
+        """Drop every cached stylesheet so it re-renders from the current palettes.
+
+        Normal runtime never needs this - the palettes are fixed at import.
+        It exists for debugging sessions or tests that patch COLORS or a
+        layout palette and want the getters to reflect the change.
+        """
+        cls._stylesheet_cache = MappingProxyType({})
 
     @classmethod
     def get_table_stylesheet(cls, theme: str) -> str:
         """Get QTableWidget stylesheet for a theme."""
-        c = cls.get_colors(theme)
-        return f"""
-            QTableWidget {{
-                background-color: {c['bg']};
-                alternate-background-color: {c['bg_alt']};
-                color: {c['text']};
-                gridline-color: {c['border']};
-                border: 1px solid {c['border']};
+        css = cls._stylesheet_cache.get(("table", theme, False))
+        return css if css is not None else cls._cached_stylesheet("table", theme, False)
+
+    # %-style templates filled straight from a COLORS palette; literal braces
+    # need no escaping and substitution runs in C
+    _TABLE_TEMPLATE: Final = """
+            QTableWidget {
+                background-color: %(bg)s;
+                alternate-background-color: %(bg_alt)s;
+                color: %(text)s;
+                gridline-color: %(border)s;
+                border: 1px solid %(border)s;
                 font-size: 14px;
-            }}
-            QTableWidget::item {{
+            }
+            QTableWidget::item {
                 padding: 4px 8px;
-            }}
-            QTableWidget::item:selected {{
-                background-color: {c['accent']};
-                color: {c['text_on_accent']};
-            }}
-            QHeaderView::section {{
-                background-color: {c['bg_header']};
-                color: {c['text_muted']};
+            }
+            QTableWidget::item:selected {
+                background-color: %(accent)s;
+                color: %(text_on_accent)s;
+            }
+            QHeaderView::section {
+                background-color: %(bg_header)s;
+                color: %(text_muted)s;
                 padding: 8px;
-                border: 1px solid {c['border']};
+                border: 1px solid %(border)s;
                 font-weight: bold;
                 font-size: 14px;
-            }}
-            QTableCornerButton::section {{
-                background-color: {c['bg_header']};
-                color: {c['text_muted']};
-                border: 1px solid {c['border']};
+            }
+            QTableCornerButton::section {
+                background-color: %(bg_header)s;
+                color: %(text_muted)s;
+                border: 1px solid %(border)s;
                 font-weight: bold;
                 font-size: 13px;
                 padding: 8px;
-            }}
+            }
         """
 
+    @classmethod
+    def _build_table_stylesheet(cls, theme: str, highlighted: bool) -> str:
+        return cls._TABLE_TEMPLATE % COLORS[theme]
+
     @classmethod
     def get_line_edit_stylesheet(cls, theme: str, highlighted: bool = True) -> str:
         """Get QLineEdit stylesheet for editable cells.
@@ -102,33 +414,32 @@ class ThemeStylesheetService:
             theme: Theme name ('dark', 'light', 'bloomberg')
             highlighted: If True, use accent color background. If False, transparent.
         """
-        c = cls.get_colors(theme)
-
-        if not highlighted:
-            return f"""
-                QLineEdit {{
-                    background-color: transparent;
-                    color: {c['text']};
-                    border: none;
-                    margin: 0px;
-                    padding: 0px 8px;
-                    font-size: 14px;
-                }}
-            """
-
-        return f"""
-            QLineEdit {{
-                background-color: transparent;
-                color: {c['text_on_accent']};
-                border: none;
+        css = cls._stylesheet_cache.get(("line_edit", theme, highlighted))
+        return css if css is not None else cls._cached_stylesheet("line_edit", theme, highlighted)
+
+    _LINE_EDIT_TEMPLATES: Final[Mapping[bool, str]] = {
+        True: """
+            QLineEdit {""" + _EDITOR_BASE + """
+                color: %(text_on_accent)s;
                 margin: 0px;
-                padding: 0px 4px;
-                font-size: 14px;
-            }}
-            QLineEdit:focus {{
+                padding: 0px 4px;""" + _EDITOR_FONT + """
+            }
+            QLineEdit:focus {
                 background-color: transparent;
-            }}
-        """
+            }
+        """,
+        False: """
+            QLineEdit {""" + _EDITOR_BASE + """
+                color: %(text)s;
+                margin: 0px;
+                padding: 0px 8px;""" + _EDITOR_FONT + """
+            }
+        """,
+    }
+
+    @classmethod
+    def _build_line_edit_stylesheet(cls, theme: str, highlighted: bool) -> str:
+        return cls._LINE_EDIT_TEMPLATES[highlighted] % COLORS[theme]
 
     @classmethod
     def get_combobox_stylesheet(cls, theme: str, highlighted: bool = True) -> str:
@@ -138,41 +449,38 @@ class ThemeStylesheetService:
             theme: Theme name ('dark', 'light', 'bloomberg')
             highlighted: If True, use accent color background. If False, transparent.
         """
-        c = cls.get_colors(theme)
-
-        if not highlighted:
-            return f"""
-                QComboBox {{
-                    background-color: transparent;
-                    color: {c['text']};
-                    border: none;
-                    padding: 4px 8px;
-                    font-size: 14px;
-                }}
-                QComboBox::drop-down {{ border: none; width: 0px; }}
-                QComboBox QAbstractItemView {{
-                    background-color: {c['bg_header']};
-                    color: {c['text']};
-                    selection-background-color: {c['accent']};
-                }}
-            """
-
-        return f"""
-            QComboBox {{
-                background-color: transparent;
-                color: {c['text_on_accent']};
-                border: none;
-                padding: 4px 4px;
-                font-size: 14px;
-            }}
-            QComboBox::drop-down {{ border: none; width: 0px; }}
-            QComboBox:focus {{ background-color: transparent; }}
-            QComboBox QAbstractItemView {{
-                background-color: {c['accent']};
-                color: {c['text_on_accent']};
-                selection-background-color: {c['accent_selection']};
-            }}
-        """
+        css = cls._stylesheet_cache.get(("combobox", theme, highlighted))
+        return css if css is not None else cls._cached_stylesheet("combobox", theme, highlighted)
+
+    _COMBOBOX_TEMPLATES: Final[Mapping[bool, str]] = {
+        True: """
+            QComboBox {""" + _EDITOR_BASE + """
+                color: %(text_on_accent)s;
+                padding: 4px 4px;""" + _EDITOR_FONT + """
+            }""" + _DROPDOWN_HIDDEN + """
+            QComboBox:focus { background-color: transparent; }
+            QComboBox QAbstractItemView {
+                background-color: %(accent)s;
+                color: %(text_on_accent)s;
+                selection-background-color: %(accent_selection)s;
+            }
+        """,
+        False: """
+            QComboBox {""" + _EDITOR_BASE + """
+                color: %(text)s;
+                padding: 4px 8px;""" + _EDITOR_FONT + """
+            }""" + _DROPDOWN_HIDDEN + """
+            QComboBox QAbstractItemView {
+                background-color: %(bg_header)s;
+                color: %(text)s;
+                selection-background-color: %(accent)s;
+            }
+        """,
+    }
+
+    @classmethod
+    def _build_combobox_stylesheet(cls, theme: str, highlighted: bool) -> str:
+        return cls._COMBOBOX_TEMPLATES[highlighted] % COLORS[theme]
 
     @classmethod
     def get_dialog_stylesheet(cls, theme: str) -> str:
@@ -187,353 +495,256 @@ class ThemeStylesheetService:
         - Combo boxes
         - Radio buttons and checkboxes
         """
-        c = cls.get_colors(theme)
-
-        # Additional colors for dialogs
-        bg_pressed = "#1a1a1a" if theme == "dark" else "#d0d0d0" if theme == "light" else "#060a10"
-        bg_hover = "#3d3d3d" if theme == "dark" else "#e8e8e8" if theme == "light" else "#1a2838"
-        text_desc = "#888888" if theme == "dark" else "#666666" if theme == "light" else "#666666"
-        text_disabled = "#666666" if theme == "dark" else "#999999" if theme == "light" else "#555555"
-
-        return f"""
-            QDialog {{
-                background-color: {c['bg']};
-                color: {c['text']};
-            }}
-            QWidget#titleBar {{
-                background-color: {c['bg_header']};
-            }}
-            QLabel#titleLabel {{
-                color: {c['text']};
+        css = cls._stylesheet_cache.get(("dialog", theme, False))
+        return css if css is not None else cls._cached_stylesheet("dialog", theme, False)
+
+    _DIALOG_TEMPLATE: Final = """
+            QDialog {
+                background-color: %(bg)s;
+                color: %(text)s;
+            }
+            QWidget#titleBar {
+                background-color: %(bg_header)s;
+            }
+            QLabel#titleLabel {
+                color: %(text)s;
                 font-size: 14px;
                 font-weight: bold;
                 background-color: transparent;
-            }}
-            QPushButton#titleBarCloseButton {{
+            }
+            QPushButton#titleBarCloseButton {
                 background-color: transparent;
-                color: {c['text']};
+                color: %(text)s;
                 border: none;
                 font-size: 16px;
-            }}
-            QPushButton#titleBarCloseButton:hover {{
+            }
+            QPushButton#titleBarCloseButton:hover {
                 background-color: #d32f2f;
                 color: #ffffff;
-            }}
-            QLabel {{
-                color: {c['text_muted']};
+            }
+            QLabel {
+                color: %(text_muted)s;
                 font-size: 13px;
                 background-color: transparent;
-            }}
-            QLabel#descriptionLabel {{
-                color: {text_desc};
+            }
+            QLabel#descriptionLabel {
+                color: %(text_desc)s;
                 font-size: 12px;
                 background-color: transparent;
-            }}
-            QLabel#sectionHeader {{
-                color: {c['text']};
+            }
+            QLabel#sectionHeader {
+                color: %(text)s;
                 font-size: 14px;
                 font-weight: bold;
                 background-color: transparent;
                 margin-top: 5px;
-            }}
-            QLabel#infoBody {{
-                color: {c['text_muted']};
+            }
+            QLabel#infoBody {
+                color: %(text_muted)s;
                 font-size: 13px;
                 background-color: transparent;
                 line-height: 1.4;
-            }}
-            QLabel#sourcesBody {{
-                color: {c['text_muted']};
+            }
+            QLabel#sourcesBody {
+                color: %(text_muted)s;
                 font-size: 12px;
                 background-color: transparent;
-            }}
-            QLineEdit {{
-                background-color: {c['bg_header']};
-                color: {c['text']};
-                border: 1px solid {c['border']};
+            }
+            QLineEdit {
+                background-color: %(bg_header)s;
+                color: %(text)s;
+                border: 1px solid %(border)s;
                 border-radius: 3px;
                 padding: 5px;
                 font-size: 13px;
-            }}
-            QLineEdit:focus {{
-                border-color: {c['accent']};
-            }}
-            QListWidget {{
-                background-color: {c['bg_header']};
-                color: {c['text']};
-                border: 1px solid {c['border']};
+            }
+            QLineEdit:focus {
+                border-color: %(accent)s;
+            }
+            QListWidget {
+                background-color: %(bg_header)s;
+                color: %(text)s;
+                border: 1px solid %(border)s;
                 border-radius: 3px;
                 font-size: 13px;
-            }}
-            QListWidget::item:selected {{
-                background-color: {c['accent']};
-                color: {c['text_on_accent']};
-            }}
-            QListWidget::item:hover {{
-                background-color: {bg_hover};
-            }}
-            QComboBox {{
-                background-color: {c['bg_header']};
-                color: {c['text']};
-                border: 1px solid {c['border']};
+            }
+            QListWidget::item:selected {
+                background-color: %(accent)s;
+                color: %(text_on_accent)s;
+            }
+            QListWidget::item:hover {
+                background-color: %(bg_hover)s;
+            }
+            QComboBox {
+                background-color: %(bg_header)s;
+                color: %(text)s;
+                border: 1px solid %(border)s;
                 border-radius: 3px;
                 padding: 5px 10px;
                 font-size: 13px;
-            }}
-            QComboBox:hover {{
-                border-color: {c['accent']};
-            }}
-            QComboBox::drop-down {{
+            }
+            QComboBox:hover {
+                border-color: %(accent)s;
+            }
+            QComboBox::drop-down {
                 border: none;
                 width: 20px;
-            }}
-            QComboBox::down-arrow {{
+            }
+            QComboBox::down-arrow {
                 image: none;
                 border-left: 5px solid transparent;
                 border-right: 5px solid transparent;
-                border-top: 6px solid {c['text']};
+                border-top: 6px solid %(text)s;
                 margin-right: 8px;
-            }}
-            QComboBox QAbstractItemView {{
-                background-color: {c['bg_header']};
-                color: {c['text']};
-                selection-background-color: {c['accent']};
-                selection-color: {c['text_on_accent']};
+            }
+            QComboBox QAbstractItemView {
+                background-color: %(bg_header)s;
+                color: %(text)s;
+                selection-background-color: %(accent)s;
+                selection-color: %(text_on_accent)s;
                 font-size: 13px;
                 padding: 4px;
-            }}
-            QRadioButton {{
-                color: {c['text']};
+            }
+            QRadioButton {
+                color: %(text)s;
                 font-size: 13px;
                 spacing: 8px;
                 background-color: transparent;
-            }}
-            QRadioButton::indicator {{
+            }
+            QRadioButton::indicator {
                 width: 16px;
                 height: 16px;
                 border-radius: 8px;
-                border: 2px solid {c['border']};
-                background-color: {c['bg_header']};
-            }}
-            QRadioButton::indicator:checked {{
-                border-color: {c['accent']};
-                background-color: {c['accent']};
-            }}
-            QRadioButton::indicator:hover {{
-                border-color: {c['accent']};
-            }}
-            QCheckBox {{
-                color: {c['text']};
+                border: 2px solid %(border)s;
+                background-color: %(bg_header)s;
+            }
+            QRadioButton::indicator:checked {
+                border-color: %(accent)s;
+                background-color: %(accent)s;
+            }
+            QRadioButton::indicator:hover {
+                border-color: %(accent)s;
+            }
+            QCheckBox {
+                color: %(text)s;
                 font-size: 13px;
                 spacing: 8px;
                 background-color: transparent;
-            }}
-            QCheckBox::indicator {{
+            }
+            QCheckBox::indicator {
                 width: 16px;
                 height: 16px;
                 border-radius: 3px;
-                border: 2px solid {c['border']};
-                background-color: {c['bg_header']};
-            }}
-            QCheckBox::indicator:checked {{
-                border-color: {c['accent']};
-                background-color: {c['accent']};
-            }}
-            QCheckBox::indicator:hover {{
-                border-color: {c['accent']};
-            }}
-            QCheckBox:disabled {{
-                color: {text_disabled};
-            }}
-            QCheckBox::indicator:disabled {{
-                border-color: {c['bg_header']};
-                background-color: {bg_pressed};
-            }}
-            QPushButton {{
-                background-color: {c['bg_header']};
-                color: {c['text']};
-                border: 1px solid {c['border']};
-                border-radius: 3px;
-                padding: 6px 12px;
-                font-size: 13px;
-            }}
-            QPushButton:hover {{
-                background-color: {bg_hover};
-                border-color: {c['accent']};
-            }}
-            QPushButton:pressed {{
-                background-color: {bg_pressed};
-            }}
-            QPushButton#defaultButton {{
-                background-color: {c['accent']};
-                color: {c['text_on_accent']};
-                border: 1px solid {c['accent']};
+                border: 2px solid %(border)s;
+                background-color: %(bg_header)s;
+            }
+            QCheckBox::indicator:checked {
+                border-color: %(accent)s;
+                background-color: %(accent)s;
+            }
+            QCheckBox::indicator:hover {
+                border-color: %(accent)s;
+            }
+            QCheckBox:disabled {
+                color: %(text_disabled)s;
+            }
+            QCheckBox::indicator:disabled {
+                border-color: %(bg_header)s;
+                background-color: %(bg_pressed)s;
+            }""" + _PUSH_BUTTON_BASE + """
+            QPushButton:pressed {
+                background-color: %(bg_pressed)s;
+            }
+            QPushButton#defaultButton {
+                background-color: %(accent)s;
+                color: %(text_on_accent)s;
+                border: 1px solid %(accent)s;
                 font-weight: 600;
-            }}
-            QPushButton#defaultButton:hover {{
-                background-color: {c['accent_hover']};
-                border-color: {c['accent_hover']};
-            }}
-            QPushButton#defaultButton:pressed {{
-                background-color: {c['accent']};
-            }}
-            QLabel#noteLabel {{
-                color: {text_desc};
+            }
+            QPushButton#defaultButton:hover {
+                background-color: %(accent_hover)s;
+                border-color: %(accent_hover)s;
+            }
+            QPushButton#defaultButton:pressed {
+                background-color: %(accent)s;
+            }
+            QLabel#noteLabel {
+                color: %(text_desc)s;
                 font-style: italic;
                 font-size: 11px;
                 background-color: transparent;
-            }}
-            QGroupBox {{
-                color: {c['text']};
-                background-color: {c['bg']};
-                border: 2px solid {c['border']};
+            }
+            QGroupBox {
+                color: %(text)s;
+                background-color: %(bg)s;
+                border: 2px solid %(border)s;
                 border-radius: 8px;
                 margin-top: 10px;
                 padding-top: 20px;
                 font-size: 14px;
                 font-weight: bold;
-            }}
-            QGroupBox::title {{
+            }
+            QGroupBox::title {
                 subcontrol-origin: margin;
                 left: 15px;
                 padding: 0 5px;
-                background-color: {c['bg']};
-            }}
-            QSpinBox {{
-                background-color: {c['bg_header']};
-                color: {c['text']};
-                border: 1px solid {c['border']};
+                background-color: %(bg)s;
+            }
+            QSpinBox {
+                background-color: %(bg_header)s;
+                color: %(text)s;
+                border: 1px solid %(border)s;
                 border-radius: 3px;
                 padding: 5px 8px;
                 font-size: 13px;
-            }}
-            QSpinBox:hover {{
-                border-color: {c['accent']};
-            }}
-            QSpinBox:focus {{
-                border-color: {c['accent']};
-            }}
-            QScrollArea {{
+            }
+            QSpinBox:hover {
+                border-color: %(accent)s;
+            }
+            QSpinBox:focus {
+                border-color: %(accent)s;
+            }
+            QScrollArea {
                 border: none;
-                background-color: {c['bg']};
-            }}
-            QScrollBar:vertical {{
-                background-color: {c['bg']};
+                background-color: %(bg)s;
+            }
+            QScrollBar:vertical {
+                background-color: %(bg)s;
                 width: 12px;
                 margin: 0px;
-            }}
-            QScrollBar::handle:vertical {{
-                background-color: {bg_hover};
+            }
+            QScrollBar::handle:vertical {
+                background-color: %(bg_hover)s;
                 border-radius: 6px;
                 min-height: 20px;
-            }}
-            QScrollBar::handle:vertical:hover {{
-                background-color: {c['border']};
-            }}
-            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {{
+            }
+            QScrollBar::handle:vertical:hover {
+                background-color: %(border)s;
+            }
+            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
                 height: 0px;
-            }}
-            QScrollBar:horizontal {{
-                background-color: {c['bg']};
+            }
+            QScrollBar:horizontal {
+                background-color: %(bg)s;
                 height: 12px;
                 margin: 0px;
-            }}
-            QScrollBar::handle:horizontal {{
-                background-color: {bg_hover};
+            }
+            QScrollBar::handle:horizontal {
+                background-color: %(bg_hover)s;
                 border-radius: 6px;
                 min-width: 20px;
-            }}
-            QScrollBar::handle:horizontal:hover {{
-                background-color: {c['border']};
-            }}
-            QScrollBar::add-line:horizontal, QScrollBar::sub-line:horizontal {{
+            }
+            QScrollBar::handle:horizontal:hover {
+                background-color: %(border)s;
+            }
+            QScrollBar::add-line:horizontal, QScrollBar::sub-line:horizontal {
                 width: 0px;
-            }}
+            }
         """
 
-    # ------------------------------------------------------------------
-    # Layout stylesheet color palettes (preserves exact ThemeManager values)
-    # ------------------------------------------------------------------
-
-    _SIDEBAR = {
-        "dark": {
-            "bg": "#2d2d2d", "text": "#ffffff", "header_bg": "#1a1a1a",
-            "accent": "#00d4ff", "footer": "#666666", "nav_text": "#cccccc",
-            "hover_bg": "#3d3d3d", "hover_text": "#ffffff",
-            "text_on_accent": "#000000",
-        },
-        "light": {
-            "bg": "#f5f5f5", "text": "#000000", "header_bg": "#e0e0e0",
-            "accent": "#0066cc", "footer": "#999999", "nav_text": "#333333",
-            "hover_bg": "#e8e8e8", "hover_text": "#000000",
-            "text_on_accent": "#ffffff",
-        },
-        "bloomberg": {
-            "bg": "#0d1420", "text": "#e8e8e8", "header_bg": "#000814",
-            "accent": "#FF8000", "footer": "#666666", "nav_text": "#b0b0b0",
-            "hover_bg": "#162030", "hover_text": "#e8e8e8",
-            "text_on_accent": "#000000",
-        },
-    }
-
-    _CONTENT = {
-        "dark": {
-            "bg": "#1e1e1e", "text": "#ffffff", "text_muted": "#cccccc",
-            "groupbox_bg": "#2d2d2d", "groupbox_extra": "",
-        },
-        "light": {
-            "bg": "#ffffff", "text": "#000000", "text_muted": "#333333",
-            "groupbox_bg": "#f5f5f5", "groupbox_extra": "border: 2px solid #d0d0d0;",
-        },
-        "bloomberg": {
-            "bg": "#000814", "text": "#e8e8e8", "text_muted": "#b0b0b0",
-            "groupbox_bg": "#0a1018",
-            "groupbox_extra": 'border: 1px solid #1a2332; font-family: "Segoe UI", "Arial", sans-serif;',
-        },
-    }
-
-    _CONTROLS = {
-        "dark": {
-            "bg": "#2d2d2d", "accent": "#00d4ff", "label_color": "#b0b0b0",
-            "label_size": "12px", "input_bg": "#1e1e1e", "input_text": "#ffffff",
-            "input_border": "#3d3d3d", "input_padding": "7px 10px", "input_font": "",
-            "selection_color": "#000000", "hover_bg": "#252525", "focus_bg": "#252525",
-            "arrow_color": "#cccccc", "dropdown_bg": "#2d2d2d", "dropdown_text": "#ffffff",
-        },
-        "light": {
-            "bg": "#f5f5f5", "accent": "#0066cc", "label_color": "#555555",
-            "label_size": "12px", "input_bg": "#ffffff", "input_text": "#000000",
-            "input_border": "#cccccc", "input_padding": "7px 10px", "input_font": "",
-            "selection_color": "#ffffff", "hover_bg": "#f9f9f9", "focus_bg": "#ffffff",
-            "arrow_color": "#555555", "dropdown_bg": "#ffffff", "dropdown_text": "#000000",
-        },
-        "bloomberg": {
-            "bg": "#0d1420", "accent": "#FF8000", "label_color": "#b0b0b0",
-            "label_size": "11px", "input_bg": "#0a1018", "input_text": "#e8e8e8",
-            "input_border": "#1a2332", "input_padding": "6px 10px",
-            "input_font": 'font-family: "Menlo", "Consolas", "Courier New";',
-            "selection_color": "#000000", "hover_bg": "#0d1420", "focus_bg": "#0d1420",
-            "arrow_color": "#b0b0b0", "dropdown_bg": "#0d1420", "dropdown_text": "#e8e8e8",
-        },
-    }
-
-    _BUTTON = {
-        "dark": {
-            "text": "#ffffff", "accent": "#00d4ff",
-            "accent_rgba": "rgba(0, 212, 255, 0.15)",
-            "text_on_accent": "#000000",
-        },
-        "light": {
-            "text": "#000000", "accent": "#0066cc",
-            "accent_rgba": "rgba(0, 102, 204, 0.15)",
-            "text_on_accent": "#ffffff",
-        },
-        "bloomberg": {
-            "text": "#e8e8e8", "accent": "#FF8000",
-            "accent_rgba": "rgba(255, 128, 0, 0.15)",
-            "text_on_accent": "#000000",
-        },
-    }
+    @classmethod
+    def _build_dialog_stylesheet(cls, theme: str, highlighted: bool) -> str:
+        return cls._DIALOG_TEMPLATE % {**COLORS[theme], **_DIALOG[theme]}
 
     # ------------------------------------------------------------------
     # Layout stylesheets
@@ -542,179 +753,206 @@ class ThemeStylesheetService:
     @classmethod
     def get_sidebar_stylesheet(cls, theme: str) -> str:
         """Get sidebar stylesheet for a theme."""
-        s = cls._SIDEBAR.get(theme, cls._SIDEBAR["dark"])
-        mono = 'font-family: "Menlo", "Consolas", "Courier New";' if theme == "bloomberg" else ""
-        hover_border = f"border-left: 3px solid {s['accent']};" if theme == "bloomberg" else ""
-        return f"""
-            #sidebar {{ background-color: {s['bg']}; color: {s['text']}; }}
-            #sidebarHeader {{
-                background-color: {s['header_bg']}; color: {s['accent']};
-                font-size: 14px; font-weight: bold; {mono}
-                padding: 20px 10px; border-bottom: 2px solid {s['accent']};
-            }}
-            #sidebarFooter {{ color: {s['footer']}; font-size: 10px; {mono} padding: 10px; }}
-            #navButton {{
+        css = cls._stylesheet_cache.get(("sidebar", theme, False))
+        return css if css is not None else cls._cached_stylesheet("sidebar", theme, False)
+
+    _SIDEBAR_TEMPLATE: Final = """
+            #sidebar { background-color: %(bg)s; color: %(text)s; }
+            #sidebarHeader {
+                background-color: %(header_bg)s; color: %(accent)s;
+                font-size: 14px; font-weight: bold; %(mono)s
+                padding: 20px 10px; border-bottom: 2px solid %(accent)s;
+            }
+            #sidebarFooter { color: %(footer)s; font-size: 10px; %(mono)s padding: 10px; }
+            #navButton {
                 text-align: left; padding: 15px 20px; border: none;
-                background-color: transparent; color: {s['nav_text']};
+                background-color: transparent; color: %(nav_text)s;
                 font-size: 13px; font-weight: 500;
-            }}
-            #navButton:hover {{
-                background-color: {s['hover_bg']}; color: {s['hover_text']}; {hover_border}
-            }}
-            #navButton:checked {{
-                background-color: {s['accent']}; color: {s['text_on_accent']};
+            }
+            #navButton:hover {
+                background-color: %(hover_bg)s; color: %(hover_text)s; %(hover_border)s
+            }
+            #navButton:checked {
+                background-color: %(accent)s; color: %(text_on_accent)s;
                 font-weight: bold;
-            }}
+            }
         """
 
+    @classmethod
+    def _build_sidebar_stylesheet(cls, theme: str, highlighted: bool) -> str:
+        return cls._SIDEBAR_TEMPLATE % _SIDEBAR[theme]
+
     @classmethod
     def get_content_stylesheet(cls, theme: str) -> str:
         """Get content area stylesheet for a theme."""
-        s = cls._CONTENT.get(theme, cls._CONTENT["dark"])
-        return f"""
-            QStackedWidget {{ background-color: {s['bg']}; }}
-            QScrollArea {{ background-color: {s['bg']}; border: none; }}
-            QGroupBox {{ color: {s['text']}; background-color: {s['groupbox_bg']}; {s['groupbox_extra']} }}
-            QLabel {{ color: {s['text_muted']}; }}
-            QRadioButton {{ color: {s['text_muted']}; }}
-            QWidget {{ background-color: {s['bg']}; color: {s['text']}; }}
+        css = cls._stylesheet_cache.get(("content", theme, False))
+        return css if css is not None else cls._cached_stylesheet("content", theme, False)
+
+    _CONTENT_TEMPLATE: Final = """
+            QStackedWidget { background-color: %(bg)s; }
+            QScrollArea { background-color: %(bg)s; border: none; }
+            QGroupBox { color: %(text)s; background-color: %(groupbox_bg)s; %(groupbox_extra)s }
+            QLabel { color: %(text_muted)s; }
+            QRadioButton { color: %(text_muted)s; }
+            QWidget { background-color: %(bg)s; color: %(text)s; }
         """
 
+    @classmethod
+    def _build_content_stylesheet(cls, theme: str, highlighted: bool) -> str:
+        return cls._CONTENT_TEMPLATE % _CONTENT[theme]
+
     @classmethod
     def get_controls_stylesheet(cls, theme: str) -> str:
         """Get chart controls bar stylesheet for a theme."""
-        s = cls._CONTROLS.get(theme, cls._CONTROLS["dark"])
-        return f"""
-            QWidget {{
-                background-color: {s['bg']};
-                border-bottom: 2px solid {s['accent']};
-            }}
-            QLabel {{
-                color: {s['label_color']};
-                font-size: {s['label_size']};
+        css = cls._stylesheet_cache.get(("controls", theme, False))
+        return css if css is not None else cls._cached_stylesheet("controls", theme, False)
+
+    _CONTROLS_TEMPLATE: Final = """
+            QWidget {
+                background-color: %(bg)s;
+                border-bottom: 2px solid %(accent)s;
+            }
+            QLabel {
+                color: %(label_color)s;
+                font-size: %(label_size)s;
                 font-weight: bold;
                 font-family: "Segoe UI", "Arial", sans-serif;
                 letter-spacing: 0.5px;
                 padding: 0px 5px;
-            }}
-            QLineEdit {{
-                background-color: {s['input_bg']};
-                color: {s['input_text']};
-                border: 1px solid {s['input_border']};
+            }
+            QLineEdit {
+                background-color: %(input_bg)s;
+                color: %(input_text)s;
+                border: 1px solid %(input_border)s;
                 border-radius: 2px;
-                padding: {s['input_padding']};
+                padding: %(input_padding)s;
                 font-size: 13px;
                 font-weight: 600;
-                {s['input_font']}
-                selection-background-color: {s['accent']};
-                selection-color: {s['selection_color']};
-            }}
-            QLineEdit:hover {{
-                border: 1px solid {s['accent']};
-                background-color: {s['hover_bg']};
-            }}
-            QLineEdit:focus {{
-                border: 1px solid {s['accent']};
-                background-color: {s['focus_bg']};
-            }}
-            QComboBox {{
-                background-color: {s['input_bg']};
-                color: {s['input_text']};
-                border: 1px solid {s['input_border']};
+                %(input_font)s
+                selection-background-color: %(accent)s;
+                selection-color: %(selection_color)s;
+            }
+            QLineEdit:hover {
+                border: 1px solid %(accent)s;
+                background-color: %(hover_bg)s;
+            }
+            QLineEdit:focus {
+                border: 1px solid %(accent)s;
+                background-color: %(focus_bg)s;
+            }
+            QComboBox {
+                background-color: %(input_bg)s;
+                color: %(input_text)s;
+                border: 1px solid %(input_border)s;
                 border-radius: 2px;
-                padding: {s['input_padding']};
+                padding: %(input_padding)s;
                 font-size: 13px;
                 font-weight: 500;
-            }}
-            QComboBox:hover {{
-                border: 1px solid {s['accent']};
-                background-color: {s['hover_bg']};
-            }}
-            QComboBox::drop-down {{
+            }
+            QComboBox:hover {
+                border: 1px solid %(accent)s;
+                background-color: %(hover_bg)s;
+            }
+            QComboBox::drop-down {
                 border: none;
                 width: 20px;
-            }}
-            QComboBox::down-arrow {{
+            }
+            QComboBox::down-arrow {
                 image: none;
                 border-left: 4px solid transparent;
                 border-right: 4px solid transparent;
-                border-top: 5px solid {s['arrow_color']};
+                border-top: 5px solid %(arrow_color)s;
                 margin-right: 5px;
-            }}
-            QComboBox::down-arrow:hover {{
-                border-top-color: {s['accent']};
-            }}
-            QComboBox QAbstractItemView {{
-                background-color: {s['dropdown_bg']};
-                color: {s['dropdown_text']};
-                selection-background-color: {s['accent']};
-                selection-color: {s['selection_color']};
-                border: 1px solid {s['accent']};
-            }}
+            }
+            QComboBox::down-arrow:hover {
+                border-top-color: %(accent)s;
+            }
+            QComboBox QAbstractItemView {
+                background-color: %(dropdown_bg)s;
+                color: %(dropdown_text)s;
+                selection-background-color: %(accent)s;
+                selection-color: %(selection_color)s;
+                border: 1px solid %(accent)s;
+            }
         """
 
+    @classmethod
+    def _build_controls_stylesheet(cls, theme: str, highlighted: bool) -> str:
+        return cls._CONTROLS_TEMPLATE % _CONTROLS[theme]
+
     @classmethod
     def get_home_button_stylesheet(cls, theme: str) -> str:
         """Get home/settings button stylesheet for a theme."""
-        s = cls._BUTTON.get(theme, cls._BUTTON["dark"])
-        font = 'font-family: "Segoe UI", "Arial", sans-serif;' if theme == "bloomberg" else ""
-        return f"""
-            #homeButton, #chartSettingsButton, #settingsButton {{
+        css = cls._stylesheet_cache.get(("home_button", theme, False))
+        return css if css is not None else cls._cached_stylesheet("home_button", theme, False)
+
+    _HOME_BUTTON_TEMPLATE: Final = """
+            #homeButton, #chartSettingsButton, #settingsButton {
                 background-color: transparent;
-                color: {s['text']};
+                color: %(text)s;
                 border: 1px solid transparent;
                 border-radius: 2px;
                 font-size: 13px;
                 font-weight: bold;
-                {font}
-            }}
-            #settingsButton {{
+                %(font)s
+            }
+            #settingsButton {
                 margin: 5px 10px;
-            }}
-            #homeButton:hover, #chartSettingsButton:hover, #settingsButton:hover {{
-                background-color: {s['accent_rgba']};
-                border: 1px solid {s['accent']};
-            }}
-            #homeButton:pressed, #chartSettingsButton:pressed, #settingsButton:pressed {{
-                background-color: {s['accent']};
-                color: {s['text_on_accent']};
-                border: 1px solid {s['accent']};
-            }}
+            }
+            #homeButton:hover, #chartSettingsButton:hover, #settingsButton:hover {
+                background-color: %(accent_rgba)s;
+                border: 1px solid %(accent)s;
+            }
+            #homeButton:pressed, #chartSettingsButton:pressed, #settingsButton:pressed {
+                background-color: %(accent)s;
+                color: %(text_on_accent)s;
+                border: 1px solid %(accent)s;
+            }
         """
 
+    @classmethod
+    def _build_home_button_stylesheet(cls, theme: str, highlighted: bool) -> str:
+        return cls._HOME_BUTTON_TEMPLATE % _BUTTON[theme]
+
     @classmethod
     def get_button_stylesheet(cls, theme: str) -> str:
         """Get universal QPushButton stylesheet for a theme."""
-        s = cls._BUTTON.get(theme, cls._BUTTON["dark"])
-        return f"""
-            QPushButton {{
+        css = cls._stylesheet_cache.get(("button", theme, False))
+        return css if css is not None else cls._cached_stylesheet("button", theme, False)
+
+    _BUTTON_TEMPLATE: Final = """
+            QPushButton {
                 background-color: transparent;
-                color: {s['text']};
+                color: %(text)s;
                 border: 1px solid transparent;
                 border-radius: 2px;
                 padding: 8px 14px;
                 font-weight: 600;
                 font-size: 13px;
-            }}
-            QPushButton:hover {{
-                background-color: {s['accent_rgba']};
-                border: 1px solid {s['accent']};
-            }}
-            QPushButton:pressed {{
-                background-color: {s['accent']};
-                color: {s['text_on_accent']};
-                border: 1px solid {s['accent']};
-            }}
-            QPushButton:checked {{
-                background-color: {s['accent']};
-                color: {s['text_on_accent']};
-                border: 1px solid {s['accent']};
-            }}
-            QPushButton:disabled {{
+            }
+            QPushButton:hover {
+                background-color: %(accent_rgba)s;
+                border: 1px solid %(accent)s;
+            }
+            QPushButton:pressed {
+                background-color: %(accent)s;
+                color: %(text_on_accent)s;
+                border: 1px solid %(accent)s;
+            }
+            QPushButton:checked {
+                background-color: %(accent)s;
+                color: %(text_on_accent)s;
+                border: 1px solid %(accent)s;
+            }
+            QPushButton:disabled {
                 opacity: 0.4;
-            }}
+            }
         """
 
+    @classmethod
+    def _build_button_stylesheet(cls, theme: str, highlighted: bool) -> str:
+        return cls._BUTTON_TEMPLATE % _BUTTON[theme]
+
     @classmethod
     def get_toolbar_stylesheet(cls, theme: str) -> str:
         """Get universal toolbar stylesheet for module control bars.
@@ -722,239 +960,200 @@ class ThemeStylesheetService:
         Covers all widget types used in any toolbar: labels, buttons,
         combos, line edits, view tabs, overlay toggles, run/delete buttons.
         """
-        c = cls.get_colors(theme)
-
-        # Derived colors per theme
-        if theme == "dark":
-            bg_hover = "#3d3d3d"
-            bg_pressed = "#1a1a1a"
-            run_hover = "#00bfe6"
-            run_pressed = "#00a6c7"
-            disabled_bg = "#1a1a1a"
-            disabled_text = "#666666"
-            disabled_border = "#2d2d2d"
-            delete_hover_bg = "#5c1a1a"
-        elif theme == "light":
-            bg_hover = "#e8e8e8"
-            bg_pressed = "#d0d0d0"
-            run_hover = "#0055aa"
-            run_pressed = "#004488"
-            disabled_bg = "#e0e0e0"
-            disabled_text = "#999999"
-            disabled_border = "#cccccc"
-            delete_hover_bg = "#ffebee"
-        else:  # bloomberg
-            bg_hover = "#1a2838"
-            bg_pressed = "#060a10"
-            run_hover = "#e67300"
-            run_pressed = "#cc6600"
-            disabled_bg = "#060a10"
-            disabled_text = "#555555"
-            disabled_border = "#1a2838"
-            delete_hover_bg = "#3d1a1a"
-
-        return f"""
-            #moduleToolbar, #treasuryToolbar, #rateProbToolbar {{
-                background-color: {c['bg']};
-            }}
-            QWidget#curve_zone, QWidget#lookback_zone {{
+        css = cls._stylesheet_cache.get(("toolbar", theme, False))
+        return css if css is not None else cls._cached_stylesheet("toolbar", theme, False)
+
+    _TOOLBAR_TEMPLATE: Final = """
+            #moduleToolbar, #treasuryToolbar, #rateProbToolbar {
+                background-color: %(bg)s;
+            }
+            QWidget#curve_zone, QWidget#lookback_zone {
                 background: transparent;
-            }}
-            QLabel {{
-                color: {c['text_muted']};
+            }
+            QLabel {
+                color: %(text_muted)s;
                 font-size: 13px;
                 background: transparent;
-            }}
-            QLabel#control_label {{
-                color: {c['text']};
+            }
+            QLabel#control_label {
+                color: %(text)s;
                 font-size: 13px;
                 font-weight: 500;
                 background: transparent;
-            }}
-            QLabel#portfolio_label {{
-                color: {c['text']};
+            }
+            QLabel#portfolio_label {
+                color: %(text)s;
                 font-size: 15px;
                 font-weight: 500;
                 background: transparent;
-            }}
-            QLabel#info_label {{
-                color: {c['text']};
+            }
+            QLabel#info_label {
+                color: %(text)s;
                 font-size: 13px;
                 font-weight: 500;
                 background: transparent;
-            }}
-            QLabel#info_label_muted {{
-                color: {c['text_muted']};
+            }
+            QLabel#info_label_muted {
+                color: %(text_muted)s;
                 font-size: 12px;
                 background: transparent;
-            }}
-            QLabel#separator {{
-                color: {c['border']};
+            }
+            QLabel#separator {
+                color: %(border)s;
                 font-size: 18px;
                 background: transparent;
                 padding: 0 2px;
-            }}
-            QPushButton {{
-                background-color: {c['bg_header']};
-                color: {c['text']};
-                border: 1px solid {c['border']};
-                border-radius: 3px;
-                padding: 6px 12px;
-                font-size: 13px;
-            }}
-            QPushButton:hover {{
-                background-color: {bg_hover};
-                border-color: {c['accent']};
-            }}
-            QPushButton:pressed {{
-                background-color: {c['bg']};
-            }}
-            QPushButton:checked {{
-                background-color: {c['accent']};
-                color: {c['text_on_accent']};
-                border-color: {c['accent']};
-            }}
-            QPushButton:disabled {{
-                background-color: {disabled_bg};
-                color: {disabled_text};
-                border-color: {disabled_border};
-            }}
-            QPushButton#run_btn {{
-                background-color: {c['accent']};
-                color: {c['text_on_accent']};
+            }""" + _PUSH_BUTTON_BASE + """
+            QPushButton:pressed {
+                background-color: %(bg)s;
+            }
+            QPushButton:checked {
+                background-color: %(accent)s;
+                color: %(text_on_accent)s;
+                border-color: %(accent)s;
+            }
+            QPushButton:disabled {
+                background-color: %(disabled_bg)s;
+                color: %(disabled_text)s;
+                border-color: %(disabled_border)s;
+            }
+            QPushButton#run_btn {
+                background-color: %(accent)s;
+                color: %(text_on_accent)s;
                 font-weight: bold;
-                border: 1px solid {c['accent']};
-            }}
-            QPushButton#run_btn:hover {{
-                background-color: {run_hover};
-                border-color: {run_hover};
-            }}
-            QPushButton#run_btn:pressed {{
-                background-color: {run_pressed};
-            }}
-            #viewTab {{
+                border: 1px solid %(accent)s;
+            }
+            QPushButton#run_btn:hover {
+                background-color: %(run_hover)s;
+                border-color: %(run_hover)s;
+            }
+            QPushButton#run_btn:pressed {
+                background-color: %(run_pressed)s;
+            }
+            #viewTab {
                 background-color: transparent;
-                color: {c['text_muted']};
+                color: %(text_muted)s;
                 border: none;
                 border-radius: 2px;
                 padding: 10px 20px;
                 font-size: 14px;
                 font-weight: 500;
-            }}
-            #viewTab:hover {{
-                background-color: {bg_hover};
-                color: {c['text']};
-            }}
-            #viewTab:checked {{
-                background-color: {c['accent']};
-                color: {c['text_on_accent']};
+            }
+            #viewTab:hover {
+                background-color: %(bg_hover)s;
+                color: %(text)s;
+            }
+            #viewTab:checked {
+                background-color: %(accent)s;
+                color: %(text_on_accent)s;
                 font-weight: bold;
-            }}
-            QPushButton#overlay_btn {{
+            }
+            QPushButton#overlay_btn {
                 font-weight: bold;
-            }}
-            QPushButton#overlay_btn:checked {{
-                background-color: {c['accent']};
-                color: {c['text_on_accent']};
-                border-color: {c['accent']};
-            }}
-            QPushButton#delete_btn:hover {{
-                background-color: {delete_hover_bg};
+            }
+            QPushButton#overlay_btn:checked {
+                background-color: %(accent)s;
+                color: %(text_on_accent)s;
+                border-color: %(accent)s;
+            }
+            QPushButton#delete_btn:hover {
+                background-color: %(delete_hover_bg)s;
                 border-color: #d32f2f;
-            }}
-            QPushButton#delete_btn:pressed {{
+            }
+            QPushButton#delete_btn:pressed {
                 background-color: #d32f2f;
                 color: #ffffff;
-            }}
-            QPushButton#infoButton {{
+            }
+            QPushButton#infoButton {
                 font-size: 16px;
                 font-weight: bold;
                 border-radius: 20px;
                 padding: 0px;
                 min-width: 40px;
                 max-width: 40px;
-            }}
-            QComboBox {{
-                background-color: {c['bg_header']};
-                color: {c['text']};
-                border: 1px solid {c['border']};
+            }
+            QComboBox {
+                background-color: %(bg_header)s;
+                color: %(text)s;
+                border: 1px solid %(border)s;
                 border-radius: 3px;
                 padding: 8px 12px;
                 font-size: 13px;
-            }}
-            QComboBox:hover {{
-                border-color: {c['accent']};
-            }}
-            QComboBox::drop-down {{
+            }
+            QComboBox:hover {
+                border-color: %(accent)s;
+            }
+            QComboBox::drop-down {
                 border: none;
                 width: 24px;
-            }}
-            QComboBox::down-arrow {{
+            }
+            QComboBox::down-arrow {
                 image: none;
                 border-left: 6px solid transparent;
                 border-right: 6px solid transparent;
-                border-top: 7px solid {c['text']};
+                border-top: 7px solid %(text)s;
                 margin-right: 10px;
-            }}
-            QComboBox QAbstractItemView {{
-                background-color: {c['bg_header']};
-                color: {c['text']};
-                selection-background-color: {c['accent']};
-                selection-color: {c['text_on_accent']};
+            }
+            QComboBox QAbstractItemView {
+                background-color: %(bg_header)s;
+                color: %(text)s;
+                selection-background-color: %(accent)s;
+                selection-color: %(text_on_accent)s;
                 font-size: 13px;
                 padding: 4px;
                 outline: none;
-            }}
-            QComboBox QAbstractItemView::item {{
+            }
+            QComboBox QAbstractItemView::item {
                 padding: 8px 12px;
                 min-height: 24px;
-            }}
-            QComboBox QAbstractItemView::item:selected {{
-                background-color: {c['accent']};
-                color: {c['text_on_accent']};
-            }}
-            QLineEdit {{
-                background-color: {c['bg_header']};
-                color: {c['text']};
-                border: 1px solid {c['border']};
+            }
+            QComboBox QAbstractItemView::item:selected {
+                background-color: %(accent)s;
+                color: %(text_on_accent)s;
+            }
+            QLineEdit {
+                background-color: %(bg_header)s;
+                color: %(text)s;
+                border: 1px solid %(border)s;
                 border-radius: 3px;
                 padding: 8px 12px;
                 font-size: 14px;
-            }}
-            QLineEdit:focus {{
-                border-color: {c['accent']};
-            }}
+            }
+            QLineEdit:focus {
+                border-color: %(accent)s;
+            }
         """
 
+    @classmethod
+    def _build_toolbar_stylesheet(cls, theme: str, highlighted: bool) -> str:
+        return cls._TOOLBAR_TEMPLATE % {**COLORS[theme], **_TOOLBAR[theme]}
+
     @classmethod
     def get_background_rgb(cls, theme: str) -> Tuple[int, int, int]:
         """Get background RGB tuple for PyQtGraph charts."""
-        return {"dark": (30, 30, 30), "light": (255, 255, 255), "bloomberg": (13, 20, 32)}.get(theme, (30, 30, 30))
+        return _CHART_BACKGROUND_RGB.get(theme) or _CHART_BACKGROUND_RGB["dark"]
 
     @classmethod
     def get_accent_rgb(cls, theme: str) -> Tuple[int, int, int]:
         """Get accent color RGB tuple for chart highlights."""
-        return {"dark": (0, 212, 255), "light": (0, 102, 204), "bloomberg": (255, 128, 0)}.get(theme, (0, 212, 255))
+        return _CHART_ACCENT_RGB.get(theme) or _CHART_ACCENT_RGB["dark"]
 
     @classmethod
     def get_text_rgb(cls, theme: str) -> Tuple[int, int, int]:
         """Get text color RGB tuple for chart labels."""
-        return {"light": (0, 0, 0)}.get(theme, (255, 255, 255))
+        return _CHART_TEXT_RGB.get(theme) or _CHART_TEXT_RGB["dark"]
 
     @classmethod
     def get_crosshair_rgb(cls, theme: str) -> Tuple[int, int, int]:
         """Get crosshair color RGB tuple for charts."""
-        return {"dark": (150, 150, 150), "light": (100, 100, 100), "bloomberg": (100, 120, 140)}.get(theme, (150, 150, 150))
+        return _CHART_CROSSHAIR_RGB.get(theme) or _CHART_CROSSHAIR_RGB["dark"]
 
     @classmethod
     def get_chart_background_color(cls, theme: str) -> str:
         """Get chart background color for a theme."""
-        return {"light": "w", "bloomberg": "#000814"}.get(theme, "#1e1e1e")
+        return _CHART_BACKGROUND.get(theme) or _CHART_BACKGROUND["dark"]
 
     @classmethod
     def get_chart_line_color(cls, theme: str) -> Tuple[int, int, int]:
         """Get chart line color RGB tuple for a theme."""
-        return {
-            "light": (0, 0, 0),
-            "bloomberg": (0, 212, 255),
-        }.get(theme, (76, 175, 80))
+        return _CHART_LINE_RGB.get(theme) or _CHART_LINE_RGB["dark"]
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import json
+import os
 import threading
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
@@ -94,6 +95,12 @@ class TickerMetadataService:
 
             return cls._cache
 
+    @classmethod
+    def _store(cls, cache: Dict[str, Dict[str, Any]], ticker: str, metadata: Dict[str, Any]) -> None:
+        """Insert a cache entry under the lock, so it never races a save."""
+        with cls._lock:
+            cache[ticker] = metadata
+
     @classmethod
     def _save_cache(cls) -> None:
         """Save cache to disk."""
@@ -101,12 +108,20 @@ class TickerMetadataService:
             return
 
         with cls._lock:
+            # Dump a snapshot so background lookups can keep inserting
+            snapshot = dict(cls._cache)
             cls._ensure_dir()
+
+            # Write to a temp file and swap it in so a failed dump never
+            # leaves a truncated cache file
+            tmp_path = cls._CACHE_FILE.with_suffix(cls._CACHE_FILE.suffix + ".tmp")
             try:
-                with open(cls._CACHE_FILE, "w", encoding="utf-8") as f:
-                    json.dump(cls._cache, f, indent=2)
-            except IOError as e:
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    json.dump(snapshot, f, indent=2)
+                os.replace(tmp_path, cls._CACHE_FILE)
+            except (OSError, TypeError, ValueError) as e:
                 print(f"Warning: Could not save ticker metadata cache: {e}")
+                tmp_path.unlink(missing_ok=True)
 
     @classmethod
     def clear_cache(cls) -> None:
@@ -196,7 +211,7 @@ class TickerMetadataService:
 
         # Fetch fresh data
         metadata = cls._fetch_from_yfinance(ticker_upper)
-        cache[ticker_upper] = metadata
+        cls._store(cache, ticker_upper, metadata)
         cls._save_cache()
 
         return metadata.copy()
@@ -252,14 +267,14 @@ class TickerMetadataService:
                         ticker = future_to_ticker[future]
                         try:
                             metadata = future.result()
-                            cache[ticker] = metadata
+                            cls._store(cache, ticker, metadata)
                             result[ticker] = metadata.copy()
                         except Exception as e:
                             print(f"Warning: Failed to fetch metadata for {ticker}: {e}")
                             # Create empty entry
                             empty_entry = {field: None for field in cls.ALL_FIELDS}
                             empty_entry["last_updated"] = datetime.now().isoformat()
-                            cache[ticker] = empty_entry
+                            cls._store(cache, ticker, empty_entry)
                             result[ticker] = empty_entry.copy()
 
                         completed += 1
@@ -465,7 +480,7 @@ class TickerMetadataService:
                     if field not in metadata or metadata.get(field) is None:
                         metadata[field] = existing.get(field)
 
-            cache[ticker_upper] = metadata
+            cls._store(cache, ticker_upper, metadata)
             cached_count += 1
 
         # Save to disk
@@ -1,14 +1,85 @@
 """Ticker Returns Service - Single-ticker return analysis methods."""
 
-from typing import TYPE_CHECKING, Optional
+import threading
+from collections import OrderedDict
+from datetime import date, datetime, timezone
+from typing import TYPE_CHECKING, Optional, Tuple
 
 if TYPE_CHECKING:
+    import numpy as np
     import pandas as pd
 
 
 class TickerReturnsService:
     """Return analysis for individual tickers (not portfolios)."""
 
+    # Full-history daily returns per (ticker, UTC date), LRU-bounded. Every
+    # metric getter starts from get_ticker_returns, so a dashboard computing
+    # several metrics for one ticker fetches and diffs its prices once. The
+    # date in the key expires entries when a new daily bar can exist
+    _DAILY_RETURNS_MAX_ENTRIES = 256
+    _daily_returns_cache: "OrderedDict[Tuple[str, date], pd.Series]" = OrderedDict()
+    _cache_lock = threading.Lock()
+
+    @classmethod
+    def _get_daily_returns(cls, ticker: str) -> "pd.Series":
+        """Full-history daily returns for a market ticker, memoized per UTC day."""
+        key = (ticker, datetime.now(timezone.utc).date())
+        with cls._cache_lock:
+            returns = cls._daily_returns_cache.get(key)
+            if returns is not None:
+                cls._daily_returns_cache.move_to_end(key)
+                return returns
+
+        import pandas as pd
+
+        from app.services.market_data import fetch_price_history
+
+        # skip_live_bar=True - returns calculations use daily closes, not intraday
+        df = fetch_price_history(ticker, period="max", interval="1d", skip_live_bar=True)
+        if df.empty:
+            # Not cached - a failed fetch should be retried on the next call
+            return pd.Series(dtype=float)
+
+        # Calculate daily returns
+        returns = df["Close"].pct_change().dropna()
+        returns.name = ticker
+
+        with cls._cache_lock:
+            cls._daily_returns_cache[key] = returns
+            while len(cls._daily_returns_cache) > cls._DAILY_RETURNS_MAX_ENTRIES:
+                cls._daily_returns_cache.popitem(last=False)
+        return returns
+
+    @staticmethod
+    def _wealth_and_peak(
+        returns: "pd.Series",
+    ) -> Tuple["np.ndarray", "np.ndarray", "np.ndarray"]:
+        """
+        Wealth index (1 + r).cumprod() and its running maximum as arrays.
+
+        Missing returns compound as 0%, matching pandas' skipna cumprod/cummax.
+
+        Returns:
+            (wealth, running_peak, missing_mask)
+        """
+        import numpy as np
+
+        wealth = returns.to_numpy(dtype=np.float64, copy=True)
+        missing = np.isnan(wealth)
+        wealth[missing] = 0.0
+        wealth += 1.0
+        np.cumprod(wealth, out=wealth)
+        # Missing days don't set a peak (matters only before the first return)
+        peak_source = np.where(missing, -np.inf, wealth) if missing.any() else wealth
+        return wealth, np.maximum.accumulate(peak_source), missing
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Drop all memoized ticker returns."""
+        with cls._cache_lock:
+            cls._daily_returns_cache.clear()
+
     @classmethod
     def get_ticker_returns(
         cls,
@@ -46,29 +117,21 @@ class TickerReturnsService:
                 return pd.Series(dtype=float, name=ticker)
             if start_date or end_date:
                 from app.services.returns_data_service import ReturnsDataService
-                df = returns.to_frame()
-                df = ReturnsDataService._filter_date_range(df, start_date, end_date)
-                returns = df.iloc[:, 0] if len(df.columns) else pd.Series(dtype=float)
+                returns = ReturnsDataService._filter_date_range(returns, start_date, end_date)
             returns.name = ticker
             return returns
 
-        from app.services.market_data import fetch_price_history
-
-        # skip_live_bar=True - returns calculations use daily closes, not intraday
-        df = fetch_price_history(ticker, period="max", interval="1d", skip_live_bar=True)
-        if df.empty:
-            return pd.Series(dtype=float)
-
-        # Calculate daily returns
-        returns = df["Close"].pct_change().dropna()
-        returns.name = ticker
+        # Copied so callers can't mutate the cached series
+        returns = cls._get_daily_returns(ticker).copy()
+        if returns.empty:
+            return returns
 
         # Filter date range
         if start_date or end_date:
             from app.services.returns_data_service import ReturnsDataService
-            returns_df = returns.to_frame()
-            returns_df = ReturnsDataService._filter_date_range(returns_df, start_date, end_date)
-            returns = returns_df[ticker] if ticker in returns_df.columns else returns_df.iloc[:, 0]
+            returns = ReturnsDataService._filter_date_range(
+                returns, start_date, end_date, copy=False
+            )
 
         # Resample if needed
         if interval.lower() != "daily":
@@ -139,6 +202,7 @@ class TickerReturnsService:
         Returns:
             Series of drawdown values (as negative decimals, e.g., -0.15 = -15%)
         """
+        import numpy as np
         import pandas as pd
 
         returns = cls.get_ticker_returns(ticker, start_date, end_date, interval="daily")
@@ -146,16 +210,15 @@ class TickerReturnsService:
         if returns.empty:
             return pd.Series(dtype=float)
 
-        # Calculate cumulative returns (wealth index)
-        cumulative = (1 + returns).cumprod()
-
-        # Calculate running maximum
-        running_max = cumulative.cummax()
+        # Wealth index and its running maximum
+        drawdowns, running_max, missing = cls._wealth_and_peak(returns)
 
-        # Drawdown = current / peak - 1
-        drawdowns = cumulative / running_max - 1
+        # Drawdown = current / peak - 1, in the wealth buffer
+        drawdowns /= running_max
+        drawdowns -= 1.0
+        drawdowns[missing] = np.nan
 
-        return drawdowns
+        return pd.Series(drawdowns, index=returns.index, name=returns.name)
 
     @classmethod
     def get_ticker_rolling_returns(
@@ -176,14 +239,8 @@ class TickerReturnsService:
             return pd.Series(dtype=float)
 
         # Calculate rolling compounded returns
-        def compound_return(window):
-            return (1 + window).prod() - 1
-
-        rolling_returns = returns.rolling(window=window_days).apply(
-            compound_return, raw=False
-        )
-
-        return rolling_returns.dropna()
+        from app.services.returns_data_service import ReturnsDataService
+        return ReturnsDataService._rolling_compound_returns(returns, window_days)
 
     @classmethod
     def get_ticker_time_under_water(
@@ -198,6 +255,7 @@ class TickerReturnsService:
         Returns:
             Series of days under water (integer values)
         """
+        import numpy as np
         import pandas as pd
 
         returns = cls.get_ticker_returns(ticker, start_date, end_date, interval="daily")
@@ -205,21 +263,23 @@ class TickerReturnsService:
         if returns.empty:
             return pd.Series(dtype=float)
 
-        # Calculate cumulative returns (wealth index)
-        cumulative = (1 + returns).cumprod()
+        from app.utils.numba_kernels import HAS_NUMBA
+
+        if HAS_NUMBA:
+            # Fused wealth / peak / counter kernel - no intermediate series
+            from app.utils.numba_kernels import days_under_water
 
-        # Calculate running maximum
-        running_max = cumulative.cummax()
+            values = returns.to_numpy(dtype=np.float64)
+            return pd.Series(days_under_water(values), index=returns.index, dtype=int)
 
-        # Track days under water
-        days_under_water = pd.Series(0, index=cumulative.index, dtype=int)
+        # Wealth index and its running maximum
+        cumulative, running_max, missing = cls._wealth_and_peak(returns)
 
-        current_underwater_days = 0
-        for i, (cum, peak) in enumerate(zip(cumulative, running_max)):
-            if cum < peak:
-                current_underwater_days += 1
-            else:
-                current_underwater_days = 0
-            days_under_water.iloc[i] = current_underwater_days
+        # Days under water = distance from the most recent row that was not
+        # below its peak (the counter resets there, and on missing days)
+        positions = np.arange(len(cumulative))
+        reset = ~(cumulative < running_max)
+        reset |= missing
+        last_reset = np.maximum.accumulate(np.where(reset, positions, -1))
 
-        return days_under_water
+        return pd.Series(positions - last_reset, index=returns.index, dtype=int)
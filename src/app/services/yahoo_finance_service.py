@@ -13,12 +13,15 @@ import pickle
 import subprocess
 import sys
 import textwrap
+import threading
 from datetime import datetime
 from typing import TYPE_CHECKING, Callable, Optional
 
 from app.core.paths import is_frozen
 
 if TYPE_CHECKING:
+    from concurrent.futures import ThreadPoolExecutor
+
     import pandas as pd
 
 # Scripts executed in child processes — curl_cffi heap is fully isolated
@@ -55,6 +58,25 @@ class YahooFinanceService:
     daemon threads that trigger shiboken6 PYSIDE-803 crashes.
     """
 
+    # Map of possible column names (lowercased) to standard names
+    _COLUMN_MAP: dict[str, str] = {
+        "open": "Open",
+        "high": "High",
+        "low": "Low",
+        "close": "Close",
+        "volume": "Volume",
+        "adj close": "Adj Close",
+        "adj_close": "Adj Close",
+    }
+
+    # OHLCV columns kept by _normalize_columns, in output order
+    _STANDARD_COLS: tuple[str, ...] = ("Open", "High", "Low", "Close", "Volume")
+
+    # Background pool for single-ticker metadata caching, created on first use
+    # so importing the service starts no threads
+    _metadata_executor: Optional["ThreadPoolExecutor"] = None
+    _metadata_executor_lock = threading.Lock()
+
     @classmethod
     def _clean_env(cls):
         """Return env dict without DYLD_INSERT_LIBRARIES (Guard Malloc)."""
@@ -162,8 +184,7 @@ class YahooFinanceService:
             df = cls._normalize_columns(df)
 
             # Ensure DatetimeIndex
-            df.index = pd.to_datetime(df.index)
-            df.sort_index(inplace=True)
+            cls._ensure_sorted_datetime_index(df)
 
             return df
 
@@ -214,8 +235,7 @@ class YahooFinanceService:
             df = cls._normalize_columns(df)
 
             # Ensure DatetimeIndex
-            df.index = pd.to_datetime(df.index)
-            df.sort_index(inplace=True)
+            cls._ensure_sorted_datetime_index(df)
 
             # Get the most recent bar (should be today or most recent trading day)
             if not df.empty:
@@ -240,36 +260,45 @@ class YahooFinanceService:
             df: DataFrame with various column name formats
 
         Returns:
-            DataFrame with normalized column names
+            New DataFrame with normalized column names. It is built with
+            take(), so it never shares memory with df and pandas doesn't track
+            it as a copy of a slice - callers can pass slices of a batch
+            download without copying and modify the result in place.
         """
-        # Map of possible column names to standard names
-        column_map = {
-            "open": "Open",
-            "high": "High",
-            "low": "Low",
-            "close": "Close",
-            "volume": "Volume",
-            "adj close": "Adj Close",
-            "adj_close": "Adj Close",
-        }
-
-        # Rename columns (case-insensitive)
-        new_columns = {}
-        for col in df.columns:
-            col_lower = col.lower().strip()
-            if col_lower in column_map:
-                new_columns[col] = column_map[col_lower]
-
-        if new_columns:
-            df = df.rename(columns=new_columns)
-
-        # Keep only OHLCV columns
-        standard_cols = ["Open", "High", "Low", "Close", "Volume"]
-        available_cols = [c for c in standard_cols if c in df.columns]
-        df = df[available_cols]
+        # Position of each standard column (case-insensitive, first match)
+        column_map = cls._COLUMN_MAP
+        standard_cols = cls._STANDARD_COLS
+        positions = {}
+        for i, col in enumerate(df.columns):
+            name = column_map.get(col.lower().strip())
+            if name in standard_cols and name not in positions:
+                positions[name] = i
+
+        # Keep only OHLCV columns - one positional take instead of a
+        # rename copy followed by a label-selection copy. take() (unlike a
+        # list .iloc) isn't tracked as a copy of a slice, so callers can
+        # modify the result in place without SettingWithCopyWarning.
+        available_cols = [c for c in standard_cols if c in positions]
+        df = df.take([positions[c] for c in available_cols], axis=1)
+        df.columns = available_cols
 
         return df
 
+    @staticmethod
+    def _ensure_sorted_datetime_index(df: "pd.DataFrame") -> None:
+        """
+        Coerce df to a sorted DatetimeIndex in place.
+
+        yf.download already returns a sorted DatetimeIndex, so the parse and
+        the sort only run when that isn't the case.
+        """
+        import pandas as pd
+
+        if not isinstance(df.index, pd.DatetimeIndex):
+            df.index = pd.to_datetime(df.index)
+        if not df.index.is_monotonic_increasing:
+            df.sort_index(inplace=True)
+
     @classmethod
     def fetch_full_history(cls, ticker: str) -> "pd.DataFrame":
         """
@@ -315,19 +344,14 @@ class YahooFinanceService:
             df = cls._normalize_columns(df)
 
             # Ensure DatetimeIndex
-            df.index = pd.to_datetime(df.index)
-            df.sort_index(inplace=True)
+            cls._ensure_sorted_datetime_index(df)
 
             print(f"Fetched {len(df)} bars for {ticker} from Yahoo Finance")
 
-            # Also cache metadata (name, sector, etc.) for this ticker
-            try:
-                from app.services.ticker_metadata_service import TickerMetadataService
-
-                TickerMetadataService.get_metadata(ticker)
-            except Exception as meta_err:
-                # Don't fail the fetch if metadata caching fails
-                print(f"Warning: Could not cache metadata for {ticker}: {meta_err}")
+            # Also cache metadata (name, sector, etc.) for this ticker - in
+            # the background, so the history is returned without waiting on
+            # another Yahoo round-trip
+            cls._prefetch_metadata(ticker)
 
             return df
 
@@ -335,6 +359,38 @@ class YahooFinanceService:
             print(f"Yahoo Finance full history fetch failed for {ticker}: {e}")
             return pd.DataFrame()
 
+    @classmethod
+    def _prefetch_metadata(cls, ticker: str) -> None:
+        """Cache a ticker's metadata on a background thread (fire-and-forget)."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        from app.services.ticker_metadata_service import TickerMetadataService
+
+        with cls._metadata_executor_lock:
+            if cls._metadata_executor is None:
+                cls._metadata_executor = ThreadPoolExecutor(
+                    max_workers=2, thread_name_prefix="yf-meta"
+                )
+            executor = cls._metadata_executor
+
+        def report(future) -> None:
+            # Don't fail anything if metadata caching fails
+            if future.cancelled():
+                return
+            meta_err = future.exception()
+            if meta_err is not None:
+                print(f"Warning: Could not cache metadata for {ticker}: {meta_err}")
+
+        executor.submit(TickerMetadataService.get_metadata, ticker).add_done_callback(report)
+
+    @classmethod
+    def shutdown_metadata_prefetch(cls) -> None:
+        """Drop queued metadata lookups so they don't delay interpreter exit."""
+        with cls._metadata_executor_lock:
+            executor, cls._metadata_executor = cls._metadata_executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
     @classmethod
     def fetch_full_history_safe(
         cls, ticker: str
@@ -502,9 +558,8 @@ class YahooFinanceService:
                     if isinstance(df.columns, pd.MultiIndex):
                         df.columns = [c[0] for c in df.columns]
 
-                    ticker_df = cls._normalize_columns(df.copy())
-                    ticker_df.index = pd.to_datetime(ticker_df.index)
-                    ticker_df.sort_index(inplace=True)
+                    ticker_df = cls._normalize_columns(df)
+                    cls._ensure_sorted_datetime_index(ticker_df)
                     ticker_df.dropna(how="all", inplace=True)
 
                     if not ticker_df.empty:
@@ -520,10 +575,9 @@ class YahooFinanceService:
                 for i, ticker in enumerate(tickers):
                     try:
                         if ticker in df.columns.get_level_values(0):
-                            ticker_df = df[ticker].copy()
+                            ticker_df = df.xs(ticker, axis=1, level=0)
                             ticker_df = cls._normalize_columns(ticker_df)
-                            ticker_df.index = pd.to_datetime(ticker_df.index)
-                            ticker_df.sort_index(inplace=True)
+                            cls._ensure_sorted_datetime_index(ticker_df)
                             ticker_df.dropna(how="all", inplace=True)
 
                             if not ticker_df.empty:
@@ -554,8 +608,9 @@ class YahooFinanceService:
         """
         Fetch historical data for multiple tickers with per-ticker date ranges.
 
-        Groups tickers by identical date ranges and batch downloads each group.
-        Used by BenchmarkReturnsService for incremental updates.
+        Groups tickers by identical date ranges and batch downloads each group,
+        running the group downloads in parallel. Progress is reported per
+        completed group. Used by BenchmarkReturnsService for incremental updates.
 
         Args:
             tickers: List of ticker symbols
@@ -582,62 +637,97 @@ class YahooFinanceService:
         completed = 0
         total = len(tickers)
 
-        for (start_date, end_date), group_tickers in range_groups.items():
-            try:
-                df = cls.safe_download(
-                    tickers=" ".join(group_tickers) if len(group_tickers) > 1 else group_tickers[0],
-                    start=start_date,
-                    end=end_date,
-                    interval="1d",
-                    auto_adjust=False,
-                    progress=False,
-                    threads=False,
-                    group_by="ticker" if len(group_tickers) > 1 else "column",
-
-                    timeout=30,
-                )
-
-                if df is None or df.empty:
-                    completed += len(group_tickers)
-                    continue
+        def record(group_tickers: list[str], group_results: dict[str, pd.DataFrame]) -> None:
+            nonlocal completed
+            results.update(group_results)
+            completed += len(group_tickers)
+            if progress_callback:
+                progress_callback(completed, total, group_tickers[-1])
 
-                if len(group_tickers) == 1:
-                    ticker = group_tickers[0]
-                    if isinstance(df.columns, pd.MultiIndex):
-                        df.columns = [c[0] for c in df.columns]
-                    ticker_df = cls._normalize_columns(df.copy())
-                    ticker_df.index = pd.to_datetime(ticker_df.index)
-                    ticker_df.sort_index(inplace=True)
-                    ticker_df.dropna(how="all", inplace=True)
-                    if not ticker_df.empty:
-                        results[ticker] = ticker_df
-                    completed += 1
-                    if progress_callback:
-                        progress_callback(completed, total, ticker)
-                else:
-                    for ticker in group_tickers:
-                        try:
-                            if ticker in df.columns.get_level_values(0):
-                                ticker_df = df[ticker].copy()
-                                ticker_df = cls._normalize_columns(ticker_df)
-                                ticker_df.index = pd.to_datetime(ticker_df.index)
-                                ticker_df.sort_index(inplace=True)
-                                ticker_df.dropna(how="all", inplace=True)
-                                if not ticker_df.empty:
-                                    results[ticker] = ticker_df
-                        except Exception:
-                            pass
-                        completed += 1
-                        if progress_callback:
-                            progress_callback(completed, total, ticker)
+        if len(range_groups) == 1:
+            (start_date, end_date), group_tickers = next(iter(range_groups.items()))
+            record(group_tickers, cls._fetch_range_group(start_date, end_date, group_tickers))
+        else:
+            # Each group is an independent download - run them side by side
+            from concurrent.futures import ThreadPoolExecutor, as_completed
 
-            except Exception as e:
-                print(f"Yahoo batch date range failed for group: {e}")
-                completed += len(group_tickers)
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                futures = {
+                    executor.submit(cls._fetch_range_group, start_date, end_date, group): group
+                    for (start_date, end_date), group in range_groups.items()
+                }
+                for future in as_completed(futures):
+                    record(futures[future], future.result())
 
         print(f"Yahoo batch date range: {len(results)}/{total} tickers fetched")
         return results
 
+    @classmethod
+    def _fetch_range_group(
+        cls,
+        start_date: str,
+        end_date: str,
+        group_tickers: list[str],
+    ) -> dict[str, "pd.DataFrame"]:
+        """
+        Fetch one date range for a group of tickers in a single yf.download call.
+
+        Args:
+            start_date: Start date in YYYY-MM-DD format
+            end_date: End date in YYYY-MM-DD format
+            group_tickers: Tickers sharing this date range
+
+        Returns:
+            Dict mapping ticker -> DataFrame with OHLCV data (failures omitted)
+        """
+        import pandas as pd
+
+        results: dict[str, pd.DataFrame] = {}
+
+        try:
+            df = cls.safe_download(
+                tickers=" ".join(group_tickers) if len(group_tickers) > 1 else group_tickers[0],
+                start=start_date,
+                end=end_date,
+                interval="1d",
+                auto_adjust=False,
+                progress=False,
+                threads=False,
+                group_by="ticker" if len(group_tickers) > 1 else "column",
+
+                timeout=30,
+            )
+
+            if df is None or df.empty:
+                return results
+
+            if len(group_tickers) == 1:
+                ticker = group_tickers[0]
+                if isinstance(df.columns, pd.MultiIndex):
+                    df.columns = [c[0] for c in df.columns]
+                ticker_df = cls._normalize_columns(df)
+                cls._ensure_sorted_datetime_index(ticker_df)
+                ticker_df.dropna(how="all", inplace=True)
+                if not ticker_df.empty:
+                    results[ticker] = ticker_df
+            else:
+                for ticker in group_tickers:
+                    try:
+                        if ticker in df.columns.get_level_values(0):
+                            ticker_df = df.xs(ticker, axis=1, level=0)
+                            ticker_df = cls._normalize_columns(ticker_df)
+                            cls._ensure_sorted_datetime_index(ticker_df)
+                            ticker_df.dropna(how="all", inplace=True)
+                            if not ticker_df.empty:
+                                results[ticker] = ticker_df
+                    except Exception:
+                        pass
+
+        except Exception as e:
+            print(f"Yahoo batch date range failed for group: {e}")
+
+        return results
+
     @classmethod
     def fetch_batch_current_prices(cls, tickers: list[str]) -> dict[str, float]:
         """
@@ -688,16 +778,13 @@ class YahooFinanceService:
                     close_series = df["Close"].dropna()
                     if not close_series.empty:
                         prices[ticker] = float(close_series.iloc[-1])
-            else:
-                # Multiple tickers - MultiIndex columns
-                for ticker in tickers:
-                    try:
-                        if ticker in df.columns.get_level_values(0):
-                            ticker_close = df[ticker]["Close"].dropna()
-                            if not ticker_close.empty:
-                                prices[ticker] = float(ticker_close.iloc[-1])
-                    except Exception:
-                        pass  # Skip failed tickers silently
+            elif "Close" in df.columns.get_level_values(1):
+                # Multiple tickers - MultiIndex columns. Last valid close of
+                # every ticker at once; tickers without one are skipped
+                closes = df.xs("Close", axis=1, level=1)
+                last = closes.ffill().iloc[-1]
+                last = last[last.index.isin(tickers)].dropna()
+                prices = last.astype(float).to_dict()
 
             return prices
 
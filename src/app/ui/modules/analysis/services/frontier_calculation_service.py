@@ -46,15 +46,15 @@ class FrontierCalculationService:
             return pd.DataFrame(), pd.DataFrame()
 
         prices = pd.DataFrame(price_data)
+        if not prices.index.is_monotonic_increasing:
+            prices = prices.sort_index()
 
+        # Sorted index - slice rather than build boolean masks
         if start_date is not None and end_date is not None:
-            prices = prices.loc[
-                (prices.index >= pd.Timestamp(start_date))
-                & (prices.index <= pd.Timestamp(end_date))
-            ]
+            prices = prices.loc[pd.Timestamp(start_date):pd.Timestamp(end_date)]
         elif lookback_days is not None:
             cutoff = prices.index.max() - pd.Timedelta(days=lookback_days)
-            prices = prices.loc[prices.index >= cutoff]
+            prices = prices.loc[cutoff:]
 
         prices = prices.dropna()
         daily_returns = prices.pct_change().dropna()
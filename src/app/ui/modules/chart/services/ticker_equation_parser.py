@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 import re
-from typing import List, Tuple, Union
+from concurrent.futures import ThreadPoolExecutor
+from enum import IntEnum
+from typing import Dict, List, NamedTuple, Optional, Tuple, Union
 
 import numpy as np
 import pandas as pd
@@ -15,6 +17,50 @@ from app.core.config import (
     ERROR_NO_OVERLAPPING_DATES,
 )
 
+# Decimal literal (1, 2.5, .5, 1e-3) - a single regex scan instead of a
+# float() attempt that raises for every ticker
+_NUM_RE = re.compile(r"-?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?\Z")
+# Any letter (a ticker needs at least one)
+_LETTER_RE = re.compile(r"[^\W\d_]")
+
+# One raw token: an operator or parenthesis, or a run of other non-space
+# characters. A "-" stays inside a word when a letter or digit follows it,
+# so BTC-USD is one token while "BTC-USD - ETH-USD" splits around the minus
+_OPERATOR_CHARS = re.escape("".join(sorted(EQUATION_OPERATORS)))
+_TOKEN_RE = re.compile(
+    rf"[^\s(){_OPERATOR_CHARS}]+(?:-(?=[^\W_])[^\s(){_OPERATOR_CHARS}]+)*"
+    rf"|[(){_OPERATOR_CHARS}]"
+)
+
+# Equation indicators, checked in one scan:
+# - Explicit equation marker at the start
+# - Division, multiplication, or parentheses anywhere
+# - + with whitespace on either side
+# - - with whitespace on both sides (BTC-USD is a ticker, but
+#   "BTC-USD - ETH-USD" is an equation)
+_EQUATION_RE = re.compile(rf"^{re.escape(EQUATION_PREFIX)}|[/*()]|\+\s|\s\+|\s-\s")
+
+# Operator precedence for RPN conversion
+_PRECEDENCE = {"+": 1, "-": 1, "*": 2, "/": 2}
+
+
+class TokenKind(IntEnum):
+    """Kind of an equation token, decided once during tokenization."""
+
+    TICKER = 0
+    NUMBER = 1
+    OP = 2
+    LPAREN = 3
+    RPAREN = 4
+
+
+class Token(NamedTuple):
+    """A classified equation token; ``value`` is set for numbers only."""
+
+    kind: TokenKind
+    text: str
+    value: Optional[float] = None
+
 
 class TickerEquationParser:
     """
@@ -29,6 +75,9 @@ class TickerEquationParser:
 
     def __init__(self):
         self._ticker_cache = {}
+        # Parsed form of each expression: (rpn, unique tickers). Only the
+        # fetched data changes between re-renders of the same equation
+        self._expr_cache: Dict[str, Tuple[List[Token], List[str]]] = {}
 
     def is_equation(self, text: str) -> bool:
         """
@@ -38,34 +87,7 @@ class TickerEquationParser:
         2. Contains operators (/, *, +) or parentheses
         3. Contains multiple ticker-like tokens separated by operators
         """
-        text = text.strip()
-        
-        # Explicit equation marker
-        if text.startswith(EQUATION_PREFIX):
-            return True
-        
-        # Check for operators that indicate equations
-        # Look for operators that are NOT part of ticker names
-        # We need to be careful with - since it appears in ticker names
-        
-        # Check for these clear equation indicators:
-        # - Division: /
-        # - Multiplication: *
-        # - Parentheses: ( or )
-        # - Addition at start/end or with spaces: + 
-        if any(op in text for op in ['/', '*', '(', ')']):
-            return True
-        
-        # Check for + with spaces or at boundaries
-        if re.search(r'(\s\+\s|\+\s|\s\+)', text):
-            return True
-            
-        # Check for - with spaces (to distinguish from ticker hyphens)
-        # BTC-USD is a ticker, but "BTC-USD - ETH-USD" is an equation
-        if re.search(r'\s-\s', text):
-            return True
-        
-        return False
+        return _EQUATION_RE.search(text.strip()) is not None
 
     def parse_and_evaluate(
         self, equation: str, period: str = DEFAULT_PERIOD, interval: str = "1d"
@@ -84,33 +106,53 @@ class TickerEquationParser:
         else:
             expr = equation
 
-        # Tokenize the expression
-        tokens = self._tokenize(expr)
-
-        # Extract all tickers from tokens
-        tickers = [t for t in tokens if self._is_ticker(t)]
-
-        # Fetch all ticker data
-        ticker_data = {}
-        for ticker in tickers:
-            # Create cache key with ticker, period, and interval
-            cache_key = (ticker, period, interval)
-            if cache_key not in self._ticker_cache:
-                self._ticker_cache[cache_key] = fetch_price_history(ticker, period, interval)
-            ticker_data[ticker] = self._ticker_cache[cache_key]
+        rpn, tickers = self._parse(expr)
+
+        # Fetch uncached tickers, keyed by ticker, period, and interval - in
+        # parallel when there are several, since each fetch mostly waits on
+        # the network
+        uncached = [t for t in tickers if (t, period, interval) not in self._ticker_cache]
+        if len(uncached) == 1:
+            self._ticker_cache[(uncached[0], period, interval)] = fetch_price_history(
+                uncached[0], period, interval
+            )
+        elif uncached:
+            with ThreadPoolExecutor(max_workers=min(8, len(uncached))) as executor:
+                frames = executor.map(
+                    lambda t: fetch_price_history(t, period, interval), uncached
+                )
+                for ticker, df in zip(uncached, frames):
+                    self._ticker_cache[(ticker, period, interval)] = df
+
+        ticker_data = {t: self._ticker_cache[(t, period, interval)] for t in tickers}
 
         # Align dates - find common date range
         aligned_data = self._align_dates(ticker_data)
 
         # Evaluate the expression
-        result = self._evaluate_expression(tokens, aligned_data)
+        result = self._evaluate_expression(rpn, aligned_data)
 
         # Create description
         description = f"{EQUATION_PREFIX}{expr}"
 
         return result, description
 
-    def _tokenize(self, expr: str) -> List[str]:
+    def _parse(self, expr: str) -> Tuple[List[Token], List[str]]:
+        """
+        Tokenize an expression and convert it to RPN, memoized per expression.
+
+        Returns:
+            (rpn_tokens, unique_tickers)
+        """
+        parsed = self._expr_cache.get(expr)
+        if parsed is None:
+            tokens = self._tokenize(expr)
+            tickers = list(dict.fromkeys(t.text for t in tokens if t.kind is TokenKind.TICKER))
+            parsed = (self._infix_to_rpn(tokens), tickers)
+            self._expr_cache[expr] = parsed
+        return parsed
+
+    def _tokenize(self, expr: str) -> List[Token]:
         """
         Tokenize the expression into tickers, operators, numbers, and parentheses.
         
@@ -120,58 +162,29 @@ class TickerEquationParser:
         - Parentheses: (, )
         - Tickers: everything else (uppercase alphanumeric with hyphens)
         """
-        tokens = []
-        current = ""
-
-        i = 0
-        while i < len(expr):
-            char = expr[i]
-
-            # Skip whitespace
-            if char.isspace():
-                if current:
-                    tokens.append(current)
-                    current = ""
-                i += 1
-                continue
-
-            # Parentheses
-            if char in "()":
-                if current:
-                    tokens.append(current)
-                    current = ""
-                tokens.append(char)
-                i += 1
-                continue
-
-            # Operators - but be careful with minus in ticker names
-            if char in EQUATION_OPERATORS:
-                # Look ahead and behind to determine if this is an operator
-                # or part of a ticker name
-                if char == "-":
-                    # If we have a current token and next char is alphanumeric,
-                    # this might be part of a ticker like BTC-USD
-                    if current and i + 1 < len(expr) and expr[i + 1].isalnum():
-                        current += char
-                        i += 1
-                        continue
-
-                # It's an operator
-                if current:
-                    tokens.append(current)
-                    current = ""
-                tokens.append(char)
-                i += 1
-                continue
-
-            # Build up the current token
-            current += char
-            i += 1
-
-        if current:
-            tokens.append(current)
-
-        return tokens
+        tokens = self._split_tokens(expr)
+
+        # Classify once so RPN conversion and evaluation dispatch on the kind
+        # instead of re-testing the text. Words that are neither a ticker nor
+        # a number are dropped, as evaluation always ignored them
+        classified = []
+        for token in tokens:
+            if token in EQUATION_OPERATORS:
+                classified.append(Token(TokenKind.OP, token))
+            elif token == "(":
+                classified.append(Token(TokenKind.LPAREN, token))
+            elif token == ")":
+                classified.append(Token(TokenKind.RPAREN, token))
+            elif self._is_number(token):
+                classified.append(Token(TokenKind.NUMBER, token, float(token)))
+            elif self._is_ticker(token):
+                classified.append(Token(TokenKind.TICKER, token))
+
+        return classified
+
+    def _split_tokens(self, expr: str) -> List[str]:
+        """Split the expression into raw token strings."""
+        return _TOKEN_RE.findall(expr)
 
     def _is_ticker(self, token: str) -> bool:
         """Check if a token is a ticker symbol."""
@@ -182,21 +195,14 @@ class TickerEquationParser:
         if token in EQUATION_OPERATORS or token in "()":
             return False
         # Check if it's a number
-        try:
-            float(token)
+        if _NUM_RE.match(token) is not None:
             return False
-        except ValueError:
-            pass
         # Must contain at least one letter
-        return any(c.isalpha() for c in token)
+        return _LETTER_RE.search(token) is not None
 
     def _is_number(self, token: str) -> bool:
         """Check if token is a number."""
-        try:
-            float(token)
-            return True
-        except ValueError:
-            return False
+        return _NUM_RE.match(token) is not None
 
     def _align_dates(self, ticker_data: dict[str, pd.DataFrame]) -> dict[str, pd.DataFrame]:
         """
@@ -210,116 +216,127 @@ class TickerEquationParser:
             # Only one ticker, no alignment needed
             return ticker_data
 
-        # Get the intersection of all indices
-        common_index = None
-        for df in ticker_data.values():
-            if common_index is None:
-                common_index = df.index
-            else:
-                # Get intersection of indices
-                common_index = common_index.intersection(df.index)
+        # Intersect starting from the shortest index - it bounds the result
+        indexes = sorted((df.index for df in ticker_data.values()), key=len)
+        common_index = indexes[0]
+
+        # Same provider/period usually means identical indices - nothing to do
+        if all(idx is common_index or idx.equals(common_index) for idx in indexes[1:]):
+            if len(common_index) == 0:
+                raise ValueError(ERROR_NO_OVERLAPPING_DATES)
+            return ticker_data
+
+        for idx in indexes[1:]:
+            common_index = common_index.intersection(idx)
 
         if len(common_index) == 0:
             raise ValueError(ERROR_NO_OVERLAPPING_DATES)
 
-        # Reindex all dataframes to common index
-        aligned = {}
-        for ticker, df in ticker_data.items():
-            aligned[ticker] = df.loc[common_index].copy()
-
-        return aligned
+        # Reindex to the common index. Frames are only read from here on, so
+        # no defensive copy; frames already on the common index pass through
+        return {
+            ticker: df if df.index.equals(common_index) else df.loc[common_index]
+            for ticker, df in ticker_data.items()
+        }
 
     def _evaluate_expression(
-        self, tokens: List[str], ticker_data: dict[str, pd.DataFrame]
+        self, rpn: List[Token], ticker_data: dict[str, pd.DataFrame]
     ) -> pd.DataFrame:
         """
-        Evaluate the tokenized expression.
+        Evaluate an expression already converted to RPN.
         Computes OHLC values by evaluating the expression for each price type.
         """
         # Get sample dataframe for index
         sample_df = next(iter(ticker_data.values()))
-        result_df = pd.DataFrame(index=sample_df.index)
-
-        # Evaluate expression for each OHLC component
-        for price_type in ["Open", "High", "Low", "Close"]:
-            # Convert to RPN
-            rpn = self._infix_to_rpn(tokens)
-            
-            # Evaluate RPN for this price type
-            stack = []
-            
-            for token in rpn:
-                if self._is_ticker(token):
-                    # Push ticker data for this price type
-                    df = ticker_data[token]
-                    if price_type in df.columns:
-                        stack.append(df[price_type].values)
-                    else:
-                        # Fallback to Close if price type doesn't exist
-                        stack.append(df["Close"].values)
-
-                elif self._is_number(token):
-                    # Push number as constant
-                    stack.append(float(token))
-
-                elif token in EQUATION_OPERATORS:
-                    # Pop two operands and apply operator
-                    if len(stack) < 2:
-                        raise ValueError(f"{ERROR_INVALID_EXPRESSION}: not enough operands for {token}")
-
-                    b = stack.pop()
-                    a = stack.pop()
-
-                    if token == "+":
-                        result = self._add(a, b)
-                    elif token == "-":
-                        result = self._subtract(a, b)
-                    elif token == "*":
-                        result = self._multiply(a, b)
-                    elif token == "/":
-                        result = self._divide(a, b)
-                    else:
-                        raise ValueError(f"Unknown operator: {token}")
-
-                    stack.append(result)
-
-            if len(stack) != 1:
-                raise ValueError(ERROR_INVALID_EXPRESSION)
-
-            # Get the result for this price type
-            result_values = stack[0]
-            
-            # Handle both array and scalar results
-            if isinstance(result_values, np.ndarray):
-                result_df[price_type] = result_values
-            else:
-                result_df[price_type] = result_values
-
-        return result_df
+        price_types = ["Open", "High", "Low", "Close"]
 
-    def _infix_to_rpn(self, tokens: List[str]) -> List[str]:
+        # Stack each ticker's OHLC into one (N, 4) block so the RPN is walked
+        # once and every operator runs over all four price types at once
+        ticker_arrays = {}
+        for ticker, df in ticker_data.items():
+            # Fallback to Close if price type doesn't exist
+            columns = [c if c in df.columns else "Close" for c in price_types]
+            ticker_arrays[ticker] = df[columns].to_numpy(dtype=float)
+
+        stack = []
+        # Ids of stack arrays produced by an operator. They are referenced only
+        # by the stack, so the next operator can write into them in place
+        # instead of allocating another full-size intermediate
+        temporaries = set()
+
+        for kind, token, value in rpn:
+            if kind is TokenKind.TICKER:
+                stack.append(ticker_arrays[token])
+
+            elif kind is TokenKind.NUMBER:
+                # Push number as constant
+                stack.append(value)
+
+            elif kind is TokenKind.OP:
+                # Pop two operands and apply operator
+                if len(stack) < 2:
+                    raise ValueError(f"{ERROR_INVALID_EXPRESSION}: not enough operands for {token}")
+
+                b = stack.pop()
+                a = stack.pop()
+
+                if id(a) in temporaries:
+                    out = a
+                elif id(b) in temporaries and np.ndim(a) <= np.ndim(b):
+                    out = b
+                else:
+                    out = None
+                temporaries.discard(id(a))
+                temporaries.discard(id(b))
+
+                if token == "+":
+                    result = self._add(a, b, out)
+                elif token == "-":
+                    result = self._subtract(a, b, out)
+                elif token == "*":
+                    result = self._multiply(a, b, out)
+                elif token == "/":
+                    result = self._divide(a, b, out)
+                else:
+                    raise ValueError(f"Unknown operator: {token}")
+
+                if isinstance(result, np.ndarray):
+                    temporaries.add(id(result))
+                stack.append(result)
+
+        if len(stack) != 1:
+            raise ValueError(ERROR_INVALID_EXPRESSION)
+
+        result_values = stack[0]
+
+        # A constant expression fills every row and price type
+        if not isinstance(result_values, np.ndarray):
+            result_values = np.full((len(sample_df.index), len(price_types)), result_values)
+
+        return pd.DataFrame(result_values, index=sample_df.index, columns=price_types)
+
+    def _infix_to_rpn(self, tokens: List[Token]) -> List[Token]:
         """Convert infix notation to Reverse Polish Notation (RPN)."""
         output = []
         operator_stack = []
 
-        precedence = {"+": 1, "-": 1, "*": 2, "/": 2}
-
         for token in tokens:
-            if self._is_ticker(token) or self._is_number(token):
+            kind = token.kind
+            if kind is TokenKind.TICKER or kind is TokenKind.NUMBER:
                 output.append(token)
-            elif token == "(":
+            elif kind is TokenKind.LPAREN:
                 operator_stack.append(token)
-            elif token == ")":
-                while operator_stack and operator_stack[-1] != "(":
+            elif kind is TokenKind.RPAREN:
+                while operator_stack and operator_stack[-1].kind is not TokenKind.LPAREN:
                     output.append(operator_stack.pop())
-                if operator_stack and operator_stack[-1] == "(":
+                if operator_stack:
                     operator_stack.pop()
-            elif token in EQUATION_OPERATORS:
+            else:
+                precedence = _PRECEDENCE[token.text]
                 while (
                     operator_stack
-                    and operator_stack[-1] != "("
-                    and operator_stack[-1] in precedence
-                    and precedence[operator_stack[-1]] >= precedence[token]
+                    and operator_stack[-1].kind is TokenKind.OP
+                    and _PRECEDENCE[operator_stack[-1].text] >= precedence
                 ):
                     output.append(operator_stack.pop())
                 operator_stack.append(token)
@@ -329,27 +346,43 @@ class TickerEquationParser:
 
         return output
 
-    # Arithmetic operations that handle both arrays and scalars
-    def _add(self, a: Union[np.ndarray, float], b: Union[np.ndarray, float]) -> Union[np.ndarray, float]:
-        return a + b
-
-    def _subtract(self, a: Union[np.ndarray, float], b: Union[np.ndarray, float]) -> Union[np.ndarray, float]:
-        return a - b
-
-    def _multiply(self, a: Union[np.ndarray, float], b: Union[np.ndarray, float]) -> Union[np.ndarray, float]:
-        return a * b
-
-    def _divide(self, a: Union[np.ndarray, float], b: Union[np.ndarray, float]) -> Union[np.ndarray, float]:
-        # Handle division by zero
-        if isinstance(b, np.ndarray):
-            return np.divide(a, b, out=np.full_like(a, np.nan, dtype=float), where=b != 0)
-        else:
-            if b == 0:
-                if isinstance(a, np.ndarray):
-                    return np.full_like(a, np.nan, dtype=float)
-                return np.nan
-            return a / b
+    # Arithmetic operations that handle both arrays and scalars. When ``out``
+    # is given (a stack temporary nothing else references) the result is
+    # written into it instead of allocating a new array
+    def _add(
+        self, a: Union[np.ndarray, float], b: Union[np.ndarray, float],
+        out: Optional[np.ndarray] = None,
+    ) -> Union[np.ndarray, float]:
+        return np.add(a, b, out=out)
+
+    def _subtract(
+        self, a: Union[np.ndarray, float], b: Union[np.ndarray, float],
+        out: Optional[np.ndarray] = None,
+    ) -> Union[np.ndarray, float]:
+        return np.subtract(a, b, out=out)
+
+    def _multiply(
+        self, a: Union[np.ndarray, float], b: Union[np.ndarray, float],
+        out: Optional[np.ndarray] = None,
+    ) -> Union[np.ndarray, float]:
+        return np.multiply(a, b, out=out)
+
+    def _divide(
+        self, a: Union[np.ndarray, float], b: Union[np.ndarray, float],
+        out: Optional[np.ndarray] = None,
+    ) -> Union[np.ndarray, float]:
+        # Handle division by zero: divide once with the warnings silenced,
+        # then turn the resulting infinities (and 0/0) into NaN
+        with np.errstate(divide="ignore", invalid="ignore"):
+            result = np.divide(a, b, out=out)
+        if isinstance(result, np.ndarray):
+            bad = ~np.isfinite(result)
+            if bad.any():
+                result[bad] = np.nan
+            return result
+        return result if np.isfinite(result) else np.nan
 
     def clear_cache(self):
-        """Clear the ticker data cache."""
-        self._ticker_cache.clear()
\ No newline at end of file
+        """Clear the ticker data and parsed expression caches."""
+        self._ticker_cache.clear()
+        self._expr_cache.clear()
\ No newline at end of file
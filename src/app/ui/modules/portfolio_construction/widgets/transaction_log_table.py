@@ -2723,21 +2723,25 @@ class TransactionLogTable(LazyThemeMixin, FieldRevertMixin, SortingMixin, Editab
         bg_color = self._get_cell_background_color()
         combo_style = self._get_combo_stylesheet()
 
+        # Resolve the palette-derived styles once, not per cell
+        container_style = f"QWidget {{ background-color: {bg_color}; }}"
+        if self._highlight_editable and bg_color != "transparent":
+            item_brush = QBrush(QColor(bg_color))
+        else:
+            item_brush = QBrush()  # Reset to default
+
         for row in range(self.rowCount()):
             # Columns 0-6 have container widgets with inner widgets
             for col in range(7):
                 container = self.cellWidget(row, col)
                 if container:
                     # Update container background
-                    container.setStyleSheet(f"QWidget {{ background-color: {bg_color}; }}")
+                    container.setStyleSheet(container_style)
 
                     # Update cell item background
                     item = self.item(row, col)
                     if item:
-                        if self._highlight_editable and bg_color != "transparent":
-                            item.setBackground(QBrush(QColor(bg_color)))
-                        else:
-                            item.setBackground(QBrush())  # Reset to default
+                        item.setBackground(item_brush)
 
                     # Update inner widget style
                     inner = container.property("_inner_widget")
@@ -244,16 +244,13 @@ class BrinsonAttributionService:
         Returns:
             Dict mapping ticker -> cumulative return (decimal)
         """
-        import pandas as pd
+        from app.services.returns_data_service import ReturnsDataService
 
         if returns_df is None or returns_df.empty:
             return {}
 
-        # Filter to date range
-        mask = (returns_df.index >= pd.Timestamp(start_date)) & (
-            returns_df.index <= pd.Timestamp(end_date)
-        )
-        period_returns = returns_df.loc[mask]
+        # Filter to date range (sorted-index slice, not a boolean mask)
+        period_returns = ReturnsDataService._filter_date_range(returns_df, start_date, end_date, copy=False)
 
         if period_returns.empty:
             return {}
@@ -261,10 +258,9 @@ class BrinsonAttributionService:
         # Also filter weights if provided (using its own date range, not the returns mask)
         period_weights = None
         if weights_df is not None and not weights_df.empty:
-            weights_mask = (weights_df.index >= pd.Timestamp(start_date)) & (
-                weights_df.index <= pd.Timestamp(end_date)
-            )
-            period_weights = weights_df.loc[weights_mask] if weights_mask.any() else None
+            period_weights = ReturnsDataService._filter_date_range(weights_df, start_date, end_date, copy=False)
+            if period_weights.empty:
+                period_weights = None
 
         # Calculate cumulative return: (1 + r1) * (1 + r2) * ... - 1
         # If weights provided, only include days when ticker was held (weight > 0)
@@ -310,22 +306,16 @@ class BrinsonAttributionService:
             Total portfolio return as decimal
         """
         import pandas as pd
+        from app.services.returns_data_service import ReturnsDataService
 
         if daily_weights is None or daily_weights.empty:
             return 0.0
         if ticker_returns is None or ticker_returns.empty:
             return 0.0
 
-        # Filter to period
-        start = pd.Timestamp(period_start)
-        end = pd.Timestamp(period_end)
-
-        weights = daily_weights[
-            (daily_weights.index >= start) & (daily_weights.index <= end)
-        ]
-        returns = ticker_returns[
-            (ticker_returns.index >= start) & (ticker_returns.index <= end)
-        ]
+        # Filter to period (sorted-index slices)
+        weights = ReturnsDataService._filter_date_range(daily_weights, period_start, period_end, copy=False)
+        returns = ReturnsDataService._filter_date_range(ticker_returns, period_start, period_end, copy=False)
 
         if weights.empty or returns.empty:
             return 0.0
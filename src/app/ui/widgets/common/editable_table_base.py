@@ -317,22 +317,24 @@ class EditableTableBase(QTableWidget):
 
         editable_cols = self._get_editable_columns()
 
+        # Resolve the palette-derived styles once, not per cell
+        container_stylesheet = f"QWidget {{ background-color: {bg_color}; }}"
+        if self._highlight_editable and bg_color != "transparent":
+            item_brush = QBrush(QColor(bg_color))
+        else:
+            item_brush = QBrush()
+
         for row in range(self.rowCount()):
             for col in editable_cols:
                 container = self.cellWidget(row, col)
                 if container:
                     # Update container background
-                    container.setStyleSheet(
-                        f"QWidget {{ background-color: {bg_color}; }}"
-                    )
+                    container.setStyleSheet(container_stylesheet)
 
                     # Update cell item background
                     item = self.item(row, col)
                     if item:
-                        if self._highlight_editable and bg_color != "transparent":
-                            item.setBackground(QBrush(QColor(bg_color)))
-                        else:
-                            item.setBackground(QBrush())
+                        item.setBackground(item_brush)
 
                     # Update inner widget style
                     inner = container.property("_inner_widget")
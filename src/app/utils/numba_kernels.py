@@ -0,0 +1,125 @@
+"""
+Optional Numba-compiled numeric kernels.
+
+Numba is an optional dependency (``pip install .[fast]``). When it is not
+installed ``HAS_NUMBA`` is False and callers keep their pandas/NumPy path.
+
+Import this module lazily (inside the function that needs it) - importing
+Numba adds noticeable startup time, so it is deliberately not re-exported
+from ``app.utils``.
+"""
+
+from __future__ import annotations
+
+import math
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+
+if HAS_NUMBA:
+
+    @njit(parallel=True, cache=True)
+    def rolling_annualized_volatility(
+        values: np.ndarray, window: int, periods_per_year: float
+    ) -> np.ndarray:
+        """
+        Rolling sample std (ddof=1) of each column, annualized.
+
+        Equivalent to ``df.rolling(window).std() * sqrt(periods_per_year)``
+        with the leading ``window - 1`` rows dropped. A window containing
+        any NaN yields NaN, as with pandas' default ``min_periods``.
+
+        Args:
+            values: 2D array of shape (rows, columns)
+            window: Rolling window length (>= 2, <= rows)
+            periods_per_year: Annualization factor (252 for daily data)
+
+        Returns:
+            float64 array of shape (rows - window + 1, columns)
+        """
+        n_rows, n_cols = values.shape
+        out = np.empty((n_rows - window + 1, n_cols), dtype=np.float64)
+        scale = math.sqrt(periods_per_year)
+
+        for j in prange(n_cols):
+            count = 0
+            n_nan = 0
+            mean = 0.0
+            m2 = 0.0
+            for i in range(n_rows):
+                # Welford add
+                x = float(values[i, j])
+                if math.isnan(x):
+                    n_nan += 1
+                else:
+                    count += 1
+                    delta = x - mean
+                    mean += delta / count
+                    m2 += delta * (x - mean)
+
+                # Welford remove for the value leaving the window
+                if i >= window:
+                    y = float(values[i - window, j])
+                    if math.isnan(y):
+                        n_nan -= 1
+                    else:
+                        count -= 1
+                        if count == 0:
+                            mean = 0.0
+                            m2 = 0.0
+                        else:
+                            delta = y - mean
+                            mean -= delta / count
+                            m2 -= delta * (y - mean)
+
+                if i >= window - 1:
+                    if n_nan > 0:
+                        out[i - window + 1, j] = np.nan
+                    else:
+                        var = m2 / (window - 1)
+                        out[i - window + 1, j] = math.sqrt(var if var > 0.0 else 0.0) * scale
+
+        return out
+
+    @njit(cache=True)
+    def days_under_water(returns: np.ndarray) -> np.ndarray:
+        """
+        Consecutive days the wealth index has been below its running peak.
+
+        Fuses ``(1 + r).cumprod()``, its ``cummax()`` and the reset counter
+        into one pass without materializing either series. A missing return
+        compounds as 0% and resets the counter, as the NumPy path does.
+
+        Args:
+            returns: 1D array of periodic returns (decimals)
+
+        Returns:
+            int64 array of the same length
+        """
+        n = returns.shape[0]
+        out = np.empty(n, dtype=np.int64)
+        wealth = 1.0
+        peak = -np.inf
+        days = 0
+
+        for i in range(n):
+            r = returns[i]
+            if math.isnan(r):
+                days = 0
+            else:
+                wealth *= 1.0 + r
+                if wealth < peak:
+                    days += 1
+                else:
+                    peak = wealth
+                    days = 0
+            out[i] = days
+
+        return out
@@ -0,0 +1,167 @@
+"""Tests for chart.services.ticker_equation_parser."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.ui.modules.chart.services import ticker_equation_parser as tep
+from app.ui.modules.chart.services.ticker_equation_parser import TickerEquationParser, TokenKind
+
+
+def _ohlc(start: float, n: int = 10, offset: int = 0) -> pd.DataFrame:
+    dates = pd.bdate_range("2024-01-01", periods=n + offset)[offset:]
+    close = start + np.arange(n, dtype=float)
+    return pd.DataFrame(
+        {"Open": close - 0.5, "High": close + 1.0, "Low": close - 1.0, "Close": close},
+        index=dates,
+    )
+
+
+@pytest.fixture
+def parser(monkeypatch):
+    frames = {
+        "BTC-USD": _ohlc(100.0),
+        "ETH-USD": _ohlc(10.0),
+        "SPX": _ohlc(50.0, offset=2),
+    }
+    calls = []
+
+    def fake_fetch(ticker, period, interval):
+        calls.append(ticker)
+        return frames[ticker]
+
+    monkeypatch.setattr(tep, "fetch_price_history", fake_fetch)
+    parser = TickerEquationParser()
+    parser.fetch_calls = calls
+    parser.frames = frames
+    return parser
+
+
+class TestParseAndEvaluate:
+    def test_ohlc_evaluated_per_price_type(self, parser):
+        df, description = parser.parse_and_evaluate("=(BTC-USD + ETH-USD)/2")
+        btc, eth = parser.frames["BTC-USD"], parser.frames["ETH-USD"]
+        assert description == "=(BTC-USD + ETH-USD)/2"
+        assert list(df.columns) == ["Open", "High", "Low", "Close"]
+        for col in df.columns:
+            np.testing.assert_allclose(df[col].values, (btc[col].values + eth[col].values) / 2)
+
+    def test_precedence(self, parser):
+        df, _ = parser.parse_and_evaluate("=BTC-USD + ETH-USD * 2")
+        expected = parser.frames["BTC-USD"]["Close"] + parser.frames["ETH-USD"]["Close"] * 2
+        np.testing.assert_allclose(df["Close"].values, expected.values)
+
+    def test_aligns_to_common_dates(self, parser):
+        df, _ = parser.parse_and_evaluate("=BTC-USD/SPX")
+        common = parser.frames["BTC-USD"].index.intersection(parser.frames["SPX"].index)
+        assert df.index.equals(common)
+        expected = parser.frames["BTC-USD"].loc[common, "Close"] / parser.frames["SPX"].loc[common, "Close"]
+        np.testing.assert_allclose(df["Close"].values, expected.values)
+
+    def test_no_overlapping_dates_raises(self, parser):
+        parser.frames["SPX"] = _ohlc(50.0).set_axis(pd.bdate_range("2023-01-02", periods=10))
+        with pytest.raises(ValueError):
+            parser.parse_and_evaluate("=BTC-USD/SPX")
+
+    def test_align_dates_passes_through_shared_index(self, parser):
+        data = {"BTC-USD": parser.frames["BTC-USD"], "ETH-USD": parser.frames["ETH-USD"]}
+        assert parser._align_dates(data) is data
+
+    def test_missing_price_type_falls_back_to_close(self, parser):
+        parser.frames["ETH-USD"] = parser.frames["ETH-USD"][["Close"]]
+        df, _ = parser.parse_and_evaluate("=ETH-USD*2")
+        for col in df.columns:
+            np.testing.assert_allclose(df[col].values, parser.frames["ETH-USD"]["Close"].values * 2)
+
+    def test_division_by_zero_is_nan(self, parser):
+        df, _ = parser.parse_and_evaluate("=BTC-USD/0")
+        assert df.isna().all().all()
+
+    def test_division_by_zero_series_is_nan(self, parser, recwarn):
+        df, _ = parser.parse_and_evaluate("=ETH-USD/(BTC-USD - BTC-USD) + 1/0")
+        assert df.isna().all().all()
+        assert not [w for w in recwarn if issubclass(w.category, RuntimeWarning)]
+
+    def test_scalar_divided_by_ticker(self, parser):
+        df, _ = parser.parse_and_evaluate("=2/BTC-USD")
+        np.testing.assert_allclose(df["Close"].values, 2 / parser.frames["BTC-USD"]["Close"].values)
+
+    def test_repeated_ticker_is_not_overwritten(self, parser):
+        original = parser.frames["BTC-USD"].copy()
+        df, _ = parser.parse_and_evaluate("=BTC-USD - BTC-USD/2 + (BTC-USD*2 - ETH-USD)/BTC-USD")
+        btc, eth = original["Close"].values, parser.frames["ETH-USD"]["Close"].values
+        np.testing.assert_allclose(df["Close"].values, btc - btc / 2 + (btc * 2 - eth) / btc)
+        pd.testing.assert_frame_equal(parser.frames["BTC-USD"], original)
+
+    def test_fetch_is_cached(self, parser):
+        parser.parse_and_evaluate("=BTC-USD*2")
+        parser.parse_and_evaluate("=BTC-USD*3")
+        assert parser.fetch_calls == ["BTC-USD"]
+
+    def test_fetches_each_ticker_once(self, parser):
+        df, _ = parser.parse_and_evaluate("=BTC-USD + ETH-USD*BTC-USD - SPX")
+        assert sorted(parser.fetch_calls) == ["BTC-USD", "ETH-USD", "SPX"]
+        assert len(df) == 8
+
+    def test_parse_is_cached(self, parser, monkeypatch):
+        parser.parse_and_evaluate("=BTC-USD/ETH-USD")
+        monkeypatch.setattr(parser, "_tokenize", lambda expr: pytest.fail("re-tokenized"))
+        df, _ = parser.parse_and_evaluate("= BTC-USD/ETH-USD")
+        expected = parser.frames["BTC-USD"]["Close"] / parser.frames["ETH-USD"]["Close"]
+        np.testing.assert_allclose(df["Close"].values, expected.values)
+
+    def test_invalid_expression_raises(self, parser):
+        with pytest.raises(ValueError):
+            parser.parse_and_evaluate("=BTC-USD +")
+
+
+class TestTokenize:
+    def test_classifies_tokens_once(self, parser):
+        tokens = parser._tokenize("(BTC-USD - ETH-USD)*2.5")
+        assert [(t.kind, t.text) for t in tokens] == [
+            (TokenKind.LPAREN, "("),
+            (TokenKind.TICKER, "BTC-USD"),
+            (TokenKind.OP, "-"),
+            (TokenKind.TICKER, "ETH-USD"),
+            (TokenKind.RPAREN, ")"),
+            (TokenKind.OP, "*"),
+            (TokenKind.NUMBER, "2.5"),
+        ]
+        assert tokens[-1].value == 2.5
+
+    @pytest.mark.parametrize(
+        "expr, expected",
+        [
+            ("BTC-USD-EUR/2", ["BTC-USD-EUR", "/", "2"]),
+            ("BTC-USD - ETH-USD", ["BTC-USD", "-", "ETH-USD"]),
+            ("BTC-USD-(SPX)", ["BTC-USD", "-", "(", "SPX", ")"]),
+            ("-SPX*1e-3", ["-", "SPX", "*", "1e-3"]),
+            ("  ^GSPC\t/ BRK.B ", ["^GSPC", "/", "BRK.B"]),
+        ],
+    )
+    def test_split_tokens(self, parser, expr, expected):
+        assert parser._split_tokens(expr) == expected
+
+    @pytest.mark.parametrize("text", ["2", "2.5", ".5", "3.", "1e5", "1e-5", "2.5E+3"])
+    def test_numbers(self, parser, text):
+        assert parser._is_number(text)
+        assert not parser._is_ticker(text)
+
+    @pytest.mark.parametrize("text", ["SPY", "BTC-USD", "^GSPC", "1INCH-USD", "NAN"])
+    def test_tickers(self, parser, text):
+        assert parser._is_ticker(text)
+        assert not parser._is_number(text)
+
+    def test_rpn_order(self, parser):
+        rpn = parser._infix_to_rpn(parser._tokenize("BTC-USD + ETH-USD * (SPX - 1)"))
+        assert [t.text for t in rpn] == ["BTC-USD", "ETH-USD", "SPX", "1", "-", "*", "+"]
+
+
+class TestIsEquation:
+    @pytest.mark.parametrize("text", ["=BTC-USD", "BTC-USD/SPX", "BTC-USD * 2", "(SPY)", "SPY + QQQ", "SPY - QQQ"])
+    def test_equations(self, parser, text):
+        assert parser.is_equation(text)
+
+    @pytest.mark.parametrize("text", ["BTC-USD", "SPY", "  AAPL  "])
+    def test_plain_tickers(self, parser, text):
+        assert not parser.is_equation(text)
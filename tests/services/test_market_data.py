@@ -49,6 +49,32 @@ class TestClassifyTickers:
         assert "MSFT" in tickers
 
 
+    def test_disk_cache_read_once_per_ticker(self, monkeypatch):
+        """Current disk caches are read once and classified in input order."""
+        from app.services import market_data
+
+        with market_data._memory_cache_lock:
+            market_data._memory_cache.clear()
+
+        df = pd.DataFrame({"Close": [1.0]}, index=pd.DatetimeIndex(["2024-01-02"]))
+        reads = []
+
+        def get_cached_data(ticker):
+            reads.append(ticker)
+            return df
+
+        monkeypatch.setattr(market_data._cache, "has_cache", lambda t: t != "MSFT")
+        monkeypatch.setattr(market_data._cache, "get_cached_data", get_cached_data)
+        monkeypatch.setattr(
+            market_data._cache, "is_cache_current", lambda t, df=None: df is not None
+        )
+
+        groups = classify_tickers(["AAPL", "MSFT", "GOOG", "AMZN"])
+        assert [c.ticker for c in groups[TickerGroup.CACHE_CURRENT]] == ["AAPL", "GOOG", "AMZN"]
+        assert [c.ticker for c in groups[TickerGroup.NEEDS_UPDATE]] == ["MSFT"]
+        assert sorted(reads) == ["AAPL", "AMZN", "GOOG"]
+
+
 class TestResampleData:
     def test_daily_passthrough(self):
         from app.services.market_data import _resample_data
@@ -0,0 +1,127 @@
+"""Tests for app.services.position_history_service.PositionHistoryService."""
+
+import pandas as pd
+import pytest
+
+from app.services.portfolio_data_service import PortfolioDataService, Transaction
+from app.services.position_history_service import PositionHistoryService
+
+
+def _tx(date, ticker, tx_type, quantity, sequence=0):
+    return Transaction(
+        id=f"{date}-{ticker}-{sequence}",
+        date=date,
+        ticker=ticker,
+        transaction_type=tx_type,
+        quantity=quantity,
+        entry_price=100.0,
+        fees=0.0,
+        sequence=sequence,
+    )
+
+
+class TestPositionHistory:
+    @pytest.fixture
+    def transactions(self, monkeypatch):
+        txs = [
+            _tx("2024-01-02", "FREE CASH", "Buy", 1000.0),
+            _tx("2024-01-02", "AAA", "Buy", 10.0, 1),
+            _tx("2024-01-04", "BBB", "Buy", 5.0),
+            _tx("2024-01-06", "AAA", "Sell", 4.0),
+        ]
+        monkeypatch.setattr(
+            PortfolioDataService, "get_transactions", classmethod(lambda cls, name: txs)
+        )
+        return txs
+
+    def test_positions_accumulate_daily(self, transactions):
+        positions = PositionHistoryService.get_position_history("p", end_date="2024-01-08")
+        assert positions.index[0] == pd.Timestamp("2024-01-02")
+        assert positions.index[-1] == pd.Timestamp("2024-01-08")
+        assert len(positions) == 7
+        assert positions["AAA"].tolist() == [10, 10, 10, 10, 6, 6, 6]
+        assert positions["BBB"].tolist() == [0, 0, 5, 5, 5, 5, 5]
+        assert positions["FREE CASH"].iloc[-1] == 1000.0
+
+    def test_exclude_cash(self, transactions):
+        positions = PositionHistoryService.get_position_history(
+            "p", end_date="2024-01-08", include_cash=False
+        )
+        assert "FREE CASH" not in positions.columns
+
+    def test_start_date_filter(self, transactions):
+        positions = PositionHistoryService.get_position_history(
+            "p", start_date="2024-01-05", end_date="2024-01-08"
+        )
+        assert positions.index[0] == pd.Timestamp("2024-01-05")
+        assert positions.loc["2024-01-05", "AAA"] == 10.0
+
+    def test_transactions_after_end_date_ignored(self, transactions):
+        positions = PositionHistoryService.get_position_history("p", end_date="2024-01-05")
+        assert positions.index[-1] == pd.Timestamp("2024-01-05")
+        assert positions["AAA"].iloc[-1] == 10.0
+
+    def test_end_date_before_first_transaction(self, transactions):
+        positions = PositionHistoryService.get_position_history("p", end_date="2023-12-31")
+        assert positions.empty
+
+    def test_no_transactions(self, monkeypatch):
+        monkeypatch.setattr(
+            PortfolioDataService, "get_transactions", classmethod(lambda cls, name: [])
+        )
+        assert PositionHistoryService.get_position_history("p").empty
+
+
+class TestDailyWeights:
+    def test_market_value_weights(self, monkeypatch):
+        from app.services import market_data
+        from app.services.returns_data_service import ReturnsDataService
+
+        txs = [
+            _tx("2024-01-05", "FREE CASH", "Buy", 100.0),
+            _tx("2024-01-05", "AAA", "Buy", 1.0, 1),
+            _tx("2024-01-05", "BBB", "Buy", 2.0, 2),
+        ]
+        monkeypatch.setattr(
+            PortfolioDataService, "get_transactions", classmethod(lambda cls, name: txs)
+        )
+        # Friday and Monday closes only; the weekend carries Friday's close
+        closes = pd.DataFrame(
+            {"AAA": [100.0, 200.0]},
+            index=pd.DatetimeIndex(["2024-01-05", "2024-01-08"]),
+        )
+        monkeypatch.setattr(
+            ReturnsDataService, "get_close_matrix", classmethod(lambda cls, name: closes)
+        )
+        bbb = pd.DataFrame(
+            {"Close": [50.0, 50.0]}, index=pd.DatetimeIndex(["2024-01-04", "2024-01-08"])
+        )
+        monkeypatch.setattr(market_data, "fetch_price_history_batch", lambda t: {"BBB": bbb})
+
+        weights = PositionHistoryService.get_daily_weights("p", end_date="2024-01-08")
+        assert list(weights.index) == list(pd.date_range("2024-01-05", "2024-01-08"))
+        assert weights.sum(axis=1).round(12).eq(1.0).all()
+
+        sunday = weights.loc["2024-01-07"]
+        assert sunday["AAA"] == pytest.approx(100 / 300)
+        assert sunday["BBB"] == pytest.approx(100 / 300)
+        assert sunday["FREE CASH"] == pytest.approx(100 / 300)
+
+        monday = weights.loc["2024-01-08"]
+        assert monday["AAA"] == pytest.approx(200 / 400)
+
+    def test_no_prices(self, monkeypatch):
+        from app.services import market_data
+        from app.services.returns_data_service import ReturnsDataService
+
+        txs = [_tx("2024-01-05", "AAA", "Buy", 1.0)]
+        monkeypatch.setattr(
+            PortfolioDataService, "get_transactions", classmethod(lambda cls, name: txs)
+        )
+        monkeypatch.setattr(
+            ReturnsDataService, "get_close_matrix", classmethod(lambda cls, name: None)
+        )
+        monkeypatch.setattr(market_data, "fetch_price_history_batch", lambda t: {})
+
+        weights = PositionHistoryService.get_daily_weights("p", end_date="2024-01-06")
+        assert (weights["AAA"] == 0.0).all()
@@ -11,6 +11,7 @@ class TestPreferencesService:
         PreferencesService._preferences = {}
         monkeypatch.setattr(PreferencesService, "_SAVE_PATH", tmp_path / "preferences.json")
         yield
+        PreferencesService.flush()
         PreferencesService._preferences = {}
 
     def test_default_theme(self):
@@ -22,6 +23,11 @@ class TestPreferencesService:
         PreferencesService.set_theme("dark")
         assert PreferencesService.get_theme() == "dark"
 
+    def test_generic_set_updates_theme(self):
+        PreferencesService.initialize()
+        PreferencesService.set("theme", "light")
+        assert PreferencesService.get_theme() == "light"
+
     def test_generic_get_set(self):
         PreferencesService.initialize()
         PreferencesService.set("custom_key", "custom_value")
@@ -41,3 +47,55 @@ class TestPreferencesService:
         PreferencesService._preferences = {}
         PreferencesService.load_preferences()
         assert PreferencesService.get_theme() == "light"
+
+    @pytest.fixture
+    def qapp(self):
+        from PySide6.QtWidgets import QApplication
+
+        return QApplication.instance() or QApplication([])
+
+    def test_set_debounces_write(self, tmp_path, qapp):
+        PreferencesService.initialize()
+        PreferencesService.set("a", 1)
+        PreferencesService.set("b", 2)
+        assert not (tmp_path / "preferences.json").exists()
+
+        PreferencesService.flush()
+        PreferencesService._preferences = {}
+        PreferencesService.load_preferences()
+        assert PreferencesService.get("a") == 1
+        assert PreferencesService.get("b") == 2
+
+    def test_debounced_save_runs_on_event_loop(self, tmp_path, qapp):
+        from PySide6.QtTest import QTest
+
+        PreferencesService.initialize()
+        PreferencesService.set("a", 1)
+        QTest.qWait(PreferencesService._SAVE_DELAY_MS * 2)
+        assert (tmp_path / "preferences.json").exists()
+        assert not PreferencesService._save_pending
+
+    def test_save_without_event_loop_is_immediate(self, tmp_path, monkeypatch):
+        from PySide6.QtCore import QCoreApplication
+
+        monkeypatch.setattr(QCoreApplication, "instance", staticmethod(lambda: None))
+        PreferencesService.initialize()
+        PreferencesService.set("a", 1)
+        assert (tmp_path / "preferences.json").exists()
+
+    def test_save_is_atomic(self, tmp_path):
+        PreferencesService.initialize()
+        PreferencesService.set_theme("dark")
+        PreferencesService.save_preferences()
+        assert (tmp_path / "preferences.json").exists()
+        assert not (tmp_path / "preferences.json.tmp").exists()
+
+    def test_failed_save_keeps_previous_file(self, tmp_path):
+        PreferencesService.initialize()
+        PreferencesService.save_preferences()
+        PreferencesService._preferences["bad"] = object()
+        PreferencesService.save_preferences()
+        PreferencesService.load_preferences()
+        assert PreferencesService.get("bad") is None
+        assert PreferencesService.get_theme() == "bloomberg"
+        assert not (tmp_path / "preferences.json.tmp").exists()
@@ -0,0 +1,25 @@
+"""Tests for app.services.qt_settings_mixin.QtSettingsSerializationMixin."""
+
+from PySide6.QtCore import Qt
+
+from app.services.qt_settings_mixin import QtSettingsSerializationMixin
+
+
+class TestQtSettingsSerialization:
+    def test_serialize_line_styles(self):
+        mixin = QtSettingsSerializationMixin()
+        result = mixin._serialize_settings(
+            {"line_style": Qt.DashLine, "kde_line_style": Qt.DotLine, "width": 1}
+        )
+        assert result == {"line_style": "dash", "kde_line_style": "dot", "width": 1}
+
+    def test_serialize_tuples_to_lists(self):
+        mixin = QtSettingsSerializationMixin()
+        result = mixin._serialize_settings({"line_color": (1, 2, 3)})
+        assert result == {"line_color": [1, 2, 3]}
+
+    def test_round_trip(self):
+        mixin = QtSettingsSerializationMixin()
+        settings = {"mean_line_style": Qt.DashDotLine, "mean_color": (4, 5, 6), "show": True}
+        restored = mixin._deserialize_settings(mixin._serialize_settings(settings))
+        assert restored == settings
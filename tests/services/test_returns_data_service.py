@@ -1,5 +1,7 @@
 """Tests for app.services.returns_data_service.ReturnsDataService."""
 
+from collections import OrderedDict
+
 import numpy as np
 import pandas as pd
 import pytest
@@ -14,6 +16,23 @@ class TestFilterDateRange:
         result = ReturnsDataService._filter_date_range(df, None, None)
         assert len(result) == 50
 
+    def test_no_filter_copies_by_default(self):
+        dates = pd.bdate_range("2024-01-02", periods=10)
+        df = pd.DataFrame({"A": range(10)}, index=dates)
+        result = ReturnsDataService._filter_date_range(df, None, None)
+        assert result is not df
+        pd.testing.assert_frame_equal(result, df)
+
+        # Slices are copied too, so mutating the result leaves the source alone
+        window = ReturnsDataService._filter_date_range(df, "2024-01-03", None)
+        window.iloc[0, 0] = -1
+        assert df["A"].iloc[1] == 1
+
+    def test_no_filter_without_copy_returns_same_frame(self):
+        dates = pd.bdate_range("2024-01-02", periods=10)
+        df = pd.DataFrame({"A": range(10)}, index=dates)
+        assert ReturnsDataService._filter_date_range(df, None, None, copy=False) is df
+
     def test_start_filter(self):
         dates = pd.bdate_range("2024-01-02", periods=50)
         df = pd.DataFrame({"A": range(50)}, index=dates)
@@ -33,12 +52,213 @@ class TestFilterDateRange:
         assert result.index.min() >= pd.Timestamp("2024-02-01")
         assert result.index.max() <= pd.Timestamp("2024-03-01")
 
+    def test_unsorted_index(self):
+        dates = pd.bdate_range("2024-01-02", periods=50)[::-1]
+        df = pd.DataFrame({"A": range(50)}, index=dates)
+        result = ReturnsDataService._filter_date_range(df, "2024-01-10", "2024-01-20")
+        assert result.index.is_monotonic_increasing
+        assert result.index.min() >= pd.Timestamp("2024-01-10")
+        assert result.index.max() <= pd.Timestamp("2024-01-20")
+
+    def test_series(self):
+        dates = pd.bdate_range("2024-01-02", periods=50)
+        s = pd.Series(range(50), index=dates, name="A")
+        result = ReturnsDataService._filter_date_range(s, "2024-02-01", None)
+        assert isinstance(result, pd.Series)
+        assert result.index.min() >= pd.Timestamp("2024-02-01")
+
     def test_empty_df(self):
         df = pd.DataFrame()
         result = ReturnsDataService._filter_date_range(df, "2024-01-01", "2024-12-31")
         assert result.empty
 
 
+class TestComputeReturns:
+    def test_returns_float32(self, monkeypatch, sample_ohlcv_df):
+        from app.services import market_data
+        from app.services.portfolio_data_service import PortfolioDataService
+
+        monkeypatch.setattr(PortfolioDataService, "get_tickers", classmethod(lambda cls, name: ["AAA"]))
+        monkeypatch.setattr(market_data, "fetch_price_history_batch", lambda tickers: {"AAA": sample_ohlcv_df})
+        result = ReturnsDataService._compute_returns("p")
+        assert list(result.columns) == ["AAA"]
+        assert result["AAA"].dtype == np.float32
+        assert len(result) == len(sample_ohlcv_df) - 1
+
+    def test_captures_close_matrix(self, monkeypatch, sample_ohlcv_df):
+        from app.services import market_data
+        from app.services.portfolio_data_service import PortfolioDataService
+
+        monkeypatch.setattr(PortfolioDataService, "get_tickers", classmethod(lambda cls, name: ["AAA"]))
+        monkeypatch.setattr(market_data, "fetch_price_history_batch", lambda tickers: {"AAA": sample_ohlcv_df})
+        ReturnsDataService._compute_returns("p")
+        closes = ReturnsDataService._close_cache["p"]
+        assert closes["AAA"].equals(sample_ohlcv_df["Close"])
+
+        ReturnsDataService.invalidate_cache("p")
+        assert "p" not in ReturnsDataService._close_cache
+
+    def test_close_matrix_fetched_once_on_miss(self, monkeypatch, sample_ohlcv_df):
+        from app.services import market_data
+        from app.services.portfolio_data_service import PortfolioDataService
+
+        calls = []
+
+        def fetch(tickers):
+            calls.append(tickers)
+            return {"AAA": sample_ohlcv_df}
+
+        monkeypatch.setattr(ReturnsDataService, "_close_cache", OrderedDict())
+        monkeypatch.setattr(ReturnsDataService, "_is_cache_valid", classmethod(lambda cls, name: True))
+        monkeypatch.setattr(PortfolioDataService, "get_tickers", classmethod(lambda cls, name: ["AAA"]))
+        monkeypatch.setattr(market_data, "fetch_price_history_batch", fetch)
+
+        first = ReturnsDataService.get_close_matrix("p")
+        second = ReturnsDataService.get_close_matrix("p")
+        assert first is second
+        assert list(first.columns) == ["AAA"]
+        assert len(calls) == 1
+
+
+class TestPortfolioReturns:
+    @pytest.fixture
+    def daily_returns(self, monkeypatch):
+        dates = pd.bdate_range("2024-01-02", periods=4)
+        df = pd.DataFrame(
+            {"A": [0.01, np.nan, 0.03, -0.01], "B": [0.02, 0.04, np.nan, 0.0]},
+            index=dates,
+        )
+        monkeypatch.setattr(
+            ReturnsDataService, "get_daily_returns",
+            classmethod(lambda cls, name, start=None, end=None, copy=True: df),
+        )
+        return df
+
+    def test_equal_weights(self, daily_returns):
+        result = ReturnsDataService.get_portfolio_returns("p")
+        expected = daily_returns.fillna(0).mean(axis=1)
+        np.testing.assert_allclose(result.values, expected.values, rtol=1e-6)
+        assert result.dtype == np.float64
+
+    def test_custom_weights_normalized(self, daily_returns):
+        result = ReturnsDataService.get_portfolio_returns("p", weights={"A": 3, "B": 1})
+        expected = daily_returns["A"].fillna(0) * 0.75 + daily_returns["B"].fillna(0) * 0.25
+        np.testing.assert_allclose(result.values, expected.values, rtol=1e-6)
+
+    def test_zero_weights(self, daily_returns):
+        result = ReturnsDataService.get_portfolio_returns("p", weights={"C": 1})
+        assert result.empty
+
+
+class TestFilledValues:
+    def test_slices_shared_array_for_cached_frame(self, monkeypatch):
+        dates = pd.bdate_range("2024-01-02", periods=5)
+        full = pd.DataFrame(
+            {"A": [0.01, np.nan, 0.03, -0.01, 0.02], "B": [np.nan, 0.04, 0.0, 0.01, 0.0]},
+            index=dates,
+        ).astype("float32")
+        monkeypatch.setattr(ReturnsDataService, "_memory_cache", OrderedDict(p=full))
+        monkeypatch.setattr(ReturnsDataService, "_filled_cache", OrderedDict())
+
+        window = ReturnsDataService._filter_date_range(full, "2024-01-03", "2024-01-05")
+        first = ReturnsDataService._get_filled_values("p", window)
+        second = ReturnsDataService._get_filled_values("p", full)
+
+        np.testing.assert_array_equal(first, window.fillna(0).to_numpy())
+        assert np.shares_memory(first, second)
+        assert not first.flags.writeable
+
+        ReturnsDataService.invalidate_cache("p")
+        assert "p" not in ReturnsDataService._filled_cache
+
+    def test_unrelated_frame_converted_directly(self, monkeypatch):
+        monkeypatch.setattr(ReturnsDataService, "_memory_cache", OrderedDict())
+        df = pd.DataFrame({"A": [np.nan, 0.5]})
+        result = ReturnsDataService._get_filled_values("p", df)
+        np.testing.assert_array_equal(result, [[0.0], [0.5]])
+
+
+class TestTimeVaryingPortfolioReturns:
+    def test_weighted_sum_excludes_cash(self, monkeypatch):
+        from app.services.portfolio_data_service import PortfolioDataService
+
+        dates = pd.bdate_range("2024-01-02", periods=4)
+        returns = pd.DataFrame(
+            {"A": [0.01, np.nan, 0.03, -0.01], "B": [0.02, 0.04, -0.02, 0.0]},
+            index=dates,
+        )
+        weights = pd.DataFrame(
+            {"A": [0.5, 0.4, 0.3, 0.2], "B": [0.3, 0.3, 0.3, 0.3], "FREE CASH": [0.2, 0.3, 0.4, 0.5]},
+            index=dates,
+        )
+        monkeypatch.setattr(
+            PortfolioDataService, "is_weights_portfolio", classmethod(lambda cls, name: False)
+        )
+        monkeypatch.setattr(
+            ReturnsDataService, "get_daily_returns",
+            classmethod(lambda cls, name, start=None, end=None, copy=True: returns),
+        )
+        monkeypatch.setattr(
+            ReturnsDataService, "get_daily_weights",
+            classmethod(lambda cls, name, start=None, end=None, include_cash=True: weights),
+        )
+        result = ReturnsDataService.get_time_varying_portfolio_returns("p")
+        expected = (weights[["A", "B"]] * returns.fillna(0)).sum(axis=1)
+        np.testing.assert_allclose(result.values, expected.values)
+        assert result.name == "portfolio_return"
+
+
+class TestCumulativeReturns:
+    def test_matches_pandas_cumprod(self, monkeypatch):
+        dates = pd.bdate_range("2024-01-02", periods=5)
+        df = pd.DataFrame(
+            {"A": [np.nan, 0.01, 0.02, np.nan, -0.03], "B": [0.05, -0.02, 0.0, 0.01, 0.02]},
+            index=dates,
+        )
+        monkeypatch.setattr(
+            ReturnsDataService, "get_daily_returns",
+            classmethod(lambda cls, name, start=None, end=None, copy=True: df),
+        )
+        result = ReturnsDataService.get_cumulative_returns("p")
+        expected = (1 + df).cumprod() - 1
+        pd.testing.assert_frame_equal(result, expected)
+
+    def test_total_loss(self, monkeypatch):
+        dates = pd.bdate_range("2024-01-02", periods=3)
+        df = pd.DataFrame({"A": [0.1, -1.0, 0.5]}, index=dates)
+        monkeypatch.setattr(
+            ReturnsDataService, "get_daily_returns",
+            classmethod(lambda cls, name, start=None, end=None, copy=True: df),
+        )
+        result = ReturnsDataService.get_cumulative_returns("p")
+        np.testing.assert_allclose(result["A"].values, [0.1, -1.0, -1.0])
+
+
+class TestVolatility:
+    @pytest.fixture
+    def daily_returns(self, monkeypatch):
+        rng = np.random.default_rng(3)
+        dates = pd.bdate_range("2024-01-02", periods=80)
+        df = pd.DataFrame(rng.normal(0, 0.01, (80, 2)), index=dates, columns=["A", "B"])
+        df.iloc[:15, 1] = np.nan
+        monkeypatch.setattr(
+            ReturnsDataService, "get_daily_returns",
+            classmethod(lambda cls, name, start=None, end=None, copy=True: df),
+        )
+        return df
+
+    @pytest.mark.parametrize("has_numba", [True, False])
+    def test_matches_pandas_rolling(self, daily_returns, monkeypatch, has_numba):
+        from app.utils import numba_kernels
+
+        if has_numba and not numba_kernels.HAS_NUMBA:
+            pytest.skip("numba not installed")
+        monkeypatch.setattr(numba_kernels, "HAS_NUMBA", has_numba)
+        result = ReturnsDataService.get_volatility("p", window=10)
+        expected = (daily_returns.rolling(10).std() * np.sqrt(252)).dropna()
+        pd.testing.assert_frame_equal(result, expected)
+
+
 class TestResampleReturns:
     def test_weekly(self):
         dates = pd.bdate_range("2024-01-02", periods=100)
@@ -52,6 +272,14 @@ class TestResampleReturns:
         result = ReturnsDataService._resample_returns(returns, "monthly")
         assert len(result) < 252
 
+    def test_matches_geometric_linking(self):
+        dates = pd.bdate_range("2024-01-02", periods=60)
+        returns = pd.Series(np.random.default_rng(1).normal(0, 0.01, 60), index=dates, name="r")
+        returns.iloc[5] = np.nan
+        result = ReturnsDataService._resample_returns(returns, "monthly")
+        expected = returns.resample("ME").apply(lambda r: (1 + r).prod() - 1)
+        pd.testing.assert_series_equal(result, expected)
+
     def test_daily_passthrough(self):
         returns = pd.Series([0.01, 0.02])
         result = ReturnsDataService._resample_returns(returns, "daily")
@@ -62,6 +290,20 @@ class TestResampleReturns:
         assert result.empty
 
 
+class TestRollingCompoundReturns:
+    def test_matches_window_product(self):
+        dates = pd.bdate_range("2024-01-02", periods=60)
+        returns = pd.Series(np.random.default_rng(3).normal(0, 0.01, 60), index=dates, name="r")
+        result = ReturnsDataService._rolling_compound_returns(returns, 21)
+        expected = returns.rolling(21).apply(lambda w: (1 + w).prod() - 1, raw=True).dropna()
+        pd.testing.assert_series_equal(result, expected)
+
+    def test_total_loss_window(self):
+        returns = pd.Series([0.1, -1.0, 0.1, 0.1, 0.2])
+        result = ReturnsDataService._rolling_compound_returns(returns, 2)
+        np.testing.assert_allclose(result.values, [-1.0, -1.0, 0.21, 0.32])
+
+
 class TestDistributionStatistics:
     def test_basic(self):
         rng = np.random.default_rng(42)
@@ -80,6 +322,63 @@ class TestDistributionStatistics:
         assert stats["count"] == 0
 
 
+class TestParquetCache:
+    def test_round_trip(self, tmp_path, monkeypatch, sample_ohlcv_df):
+        import pyarrow.parquet as pq
+
+        from app.services.portfolio_data_service import PortfolioDataService
+
+        returns = sample_ohlcv_df[["Close"]].pct_change().dropna().astype("float32")
+        monkeypatch.setattr(ReturnsDataService, "_CACHE_DIR", tmp_path)
+        monkeypatch.setattr(ReturnsDataService, "_memory_cache", OrderedDict())
+        monkeypatch.setattr(ReturnsDataService, "_memory_cache_timestamps", {})
+        monkeypatch.setattr(ReturnsDataService, "_mtime_cache", {})
+        monkeypatch.setattr(ReturnsDataService, "_compute_returns", classmethod(lambda cls, name: returns))
+        monkeypatch.setattr(
+            PortfolioDataService, "get_portfolio_modified_time",
+            classmethod(lambda cls, name: pd.Timestamp("2000-01-01").to_pydatetime()),
+        )
+
+        ReturnsDataService.get_daily_returns("p")
+        path = ReturnsDataService._get_cache_path("p")
+        meta = pq.ParquetFile(path).metadata
+        assert meta.num_row_groups == 1
+        assert meta.row_group(0).column(0).compression == "ZSTD"
+        assert meta.format_version == "2.6"
+        assert not meta.row_group(0).column(0).is_stats_set
+
+        # Served from disk once the memory cache is dropped
+        ReturnsDataService._memory_cache.clear()
+        monkeypatch.setattr(ReturnsDataService, "_compute_returns", classmethod(lambda cls, name: pd.DataFrame()))
+        result = ReturnsDataService.get_daily_returns("p")
+        pd.testing.assert_frame_equal(result, returns, check_freq=False)
+        assert pq.read_schema(path).field("Close").type == "float"
+
+
+class TestPortfolioMtime:
+    def test_memoized_within_ttl(self, monkeypatch):
+        from datetime import datetime
+
+        from app.services.portfolio_data_service import PortfolioDataService
+
+        calls = []
+
+        def modified_time(cls, name):
+            calls.append(name)
+            return datetime(2024, 1, 1)
+
+        monkeypatch.setattr(ReturnsDataService, "_mtime_cache", {})
+        monkeypatch.setattr(PortfolioDataService, "get_portfolio_modified_time", classmethod(modified_time))
+
+        assert ReturnsDataService._get_portfolio_mtime("p") == datetime(2024, 1, 1)
+        ReturnsDataService._get_portfolio_mtime("p")
+        assert calls == ["p"]
+
+        ReturnsDataService.invalidate_cache("p")
+        ReturnsDataService._get_portfolio_mtime("p")
+        assert calls == ["p", "p"]
+
+
 class TestInvalidateCache:
     def test_invalidate_clears_memory(self):
         ReturnsDataService._memory_cache["test_portfolio"] = "dummy"
@@ -91,3 +390,80 @@ class TestInvalidateCache:
         ReturnsDataService._memory_cache["p2"] = "b"
         ReturnsDataService.invalidate_all_caches()
         assert len(ReturnsDataService._memory_cache) == 0
+
+
+class TestMemoryCacheLru:
+    def test_evicts_least_recently_used(self, monkeypatch):
+        from datetime import datetime
+
+        monkeypatch.setattr(ReturnsDataService, "_memory_cache", OrderedDict())
+        monkeypatch.setattr(ReturnsDataService, "_memory_cache_timestamps", {})
+        monkeypatch.setattr(ReturnsDataService, "_MEMORY_CACHE_MAX_ENTRIES", 2)
+        monkeypatch.setattr(
+            ReturnsDataService, "_get_portfolio_mtime", classmethod(lambda cls, name: datetime(2000, 1, 1))
+        )
+        cache = ReturnsDataService._memory_cache
+
+        ReturnsDataService._store_returns("a", pd.DataFrame({"x": [1.0]}))
+        ReturnsDataService._store_returns("b", pd.DataFrame({"x": [2.0]}))
+        ReturnsDataService.get_daily_returns("a")  # touch "a"
+        ReturnsDataService._store_returns("c", pd.DataFrame({"x": [3.0]}))
+
+        assert list(cache) == ["a", "c"]
+
+    def test_eviction_drops_side_tables(self, monkeypatch):
+        from datetime import datetime
+
+        monkeypatch.setattr(ReturnsDataService, "_memory_cache", OrderedDict())
+        monkeypatch.setattr(ReturnsDataService, "_memory_cache_timestamps", {})
+        monkeypatch.setattr(ReturnsDataService, "_mtime_cache", {})
+        monkeypatch.setattr(ReturnsDataService, "_MEMORY_CACHE_MAX_ENTRIES", 2)
+
+        for name in ["a", "b", "c"]:
+            ReturnsDataService._mtime_cache[name] = (datetime(2000, 1, 1), 0.0)
+            ReturnsDataService._store_returns(name, pd.DataFrame({"x": [1.0]}))
+
+        assert set(ReturnsDataService._memory_cache_timestamps) == {"b", "c"}
+        assert set(ReturnsDataService._mtime_cache) == {"b", "c"}
+
+    def test_memory_hit_skips_disk_check(self, monkeypatch):
+        from datetime import datetime
+
+        def fail(cls, name):
+            raise AssertionError("disk cache checked on a memory hit")
+
+        monkeypatch.setattr(ReturnsDataService, "_memory_cache", OrderedDict())
+        monkeypatch.setattr(ReturnsDataService, "_memory_cache_timestamps", {})
+        monkeypatch.setattr(ReturnsDataService, "_is_cache_valid", classmethod(fail))
+        mtime = [datetime(2000, 1, 1)]
+        monkeypatch.setattr(ReturnsDataService, "_get_portfolio_mtime", classmethod(lambda cls, name: mtime[0]))
+
+        df = pd.DataFrame({"x": [1.0]})
+        ReturnsDataService._store_returns("p", df)
+        assert ReturnsDataService.get_daily_returns("p", copy=False) is df
+        pd.testing.assert_frame_equal(ReturnsDataService.get_daily_returns("p"), df)
+
+        # Modified after load: the memory entry is stale
+        mtime[0] = datetime.now().replace(year=datetime.now().year + 1)
+        assert not ReturnsDataService._is_memory_cache_valid("p")
+
+
+class TestCashDrag:
+    def test_tickers_weighted_equally(self, monkeypatch):
+        from app.services.portfolio_data_service import PortfolioDataService
+
+        dates = pd.bdate_range("2024-01-02", periods=4)
+        weights = pd.DataFrame({"AAA": [0.75] * 4, "FREE CASH": [0.25] * 4}, index=dates)
+        # BBB has one observation; a pooled mean would underweight it
+        returns = pd.DataFrame(
+            {"AAA": [0.01, 0.01, 0.01, 0.01], "BBB": [np.nan, np.nan, np.nan, 0.03]},
+            index=dates,
+        ).astype("float32")
+        monkeypatch.setattr(PortfolioDataService, "is_weights_portfolio", classmethod(lambda cls, name: False))
+        monkeypatch.setattr(ReturnsDataService, "get_daily_weights", classmethod(lambda cls, *a, **k: weights))
+        monkeypatch.setattr(ReturnsDataService, "get_daily_returns", classmethod(lambda cls, *a, **k: returns))
+
+        result = ReturnsDataService.calculate_cash_drag("p")
+        expected = returns.mean().mean()
+        assert result["avg_cash_weight"] == pytest.approx(0.25)
+        assert result["cash_drag_bps"] == pytest.approx(0.25 * expected * 252 * 10000, rel=1e-6)
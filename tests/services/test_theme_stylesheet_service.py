@@ -1,23 +1,54 @@
 """Tests for app.services.theme_stylesheet_service.ThemeStylesheetService."""
 
+import dataclasses
+from collections.abc import Mapping
+
 import pytest
 
+from app.services import theme_stylesheet_service
 from app.services.theme_stylesheet_service import ThemeStylesheetService
 
 
 class TestGetColors:
     @pytest.mark.parametrize("theme", ["dark", "light", "bloomberg"])
-    def test_returns_dict(self, theme):
+    def test_returns_mapping(self, theme):
         colors = ThemeStylesheetService.get_colors(theme)
-        assert isinstance(colors, dict)
+        assert isinstance(colors, Mapping)
         assert len(colors) > 0
 
+    def test_palette_is_read_only(self):
+        colors = ThemeStylesheetService.get_colors("dark")
+        with pytest.raises(TypeError):
+            colors["bg"] = "#000000"
+        with pytest.raises(AttributeError):
+            colors.bg = "#000000"
+
+    def test_attribute_and_key_access_agree(self):
+        colors = ThemeStylesheetService.get_colors("light")
+        assert colors.bg == colors["bg"]
+        assert dict(colors)["accent"] == colors.accent
+        with pytest.raises(KeyError):
+            colors["__class__"]
+
     @pytest.mark.parametrize("theme", ["dark", "light", "bloomberg"])
     def test_has_essential_keys(self, theme):
         colors = ThemeStylesheetService.get_colors(theme)
         # Should have background and text colors at minimum
         assert any("bg" in k.lower() or "background" in k.lower() for k in colors)
 
+    @pytest.mark.parametrize("theme", ["dark", "light", "bloomberg"])
+    def test_layout_palettes_share_base_tokens(self, theme):
+        colors = ThemeStylesheetService.get_colors(theme)
+        assert theme_stylesheet_service._SIDEBAR[theme]["accent"] is colors.accent
+        assert theme_stylesheet_service._CONTROLS[theme]["accent"] is colors.accent
+        assert theme_stylesheet_service._BUTTON[theme]["text"] is colors.text
+
+    def test_layout_palettes_are_read_only(self):
+        with pytest.raises(TypeError):
+            theme_stylesheet_service._SIDEBAR["dark"]["bg"] = "#000000"
+        with pytest.raises(TypeError):
+            theme_stylesheet_service._TOOLBAR["neon"] = {}
+
 
 class TestStylesheetGeneration:
     @pytest.mark.parametrize("theme", ["dark", "light", "bloomberg"])
@@ -49,6 +80,72 @@ class TestStylesheetGeneration:
         assert isinstance(css, str)
 
 
+class TestStylesheetCache:
+    @pytest.mark.parametrize("theme", ["dark", "light", "bloomberg"])
+    @pytest.mark.parametrize("highlighted", [True, False])
+    def test_repeat_calls_share_string(self, theme, highlighted):
+        first = ThemeStylesheetService.get_line_edit_stylesheet(theme, highlighted)
+        assert ThemeStylesheetService.get_line_edit_stylesheet(theme, highlighted) is first
+        combo = ThemeStylesheetService.get_combobox_stylesheet(theme, highlighted)
+        assert ThemeStylesheetService.get_combobox_stylesheet(theme, highlighted) is combo
+
+    @pytest.mark.parametrize(
+        "getter",
+        ["dialog", "sidebar", "content", "controls", "home_button", "button", "toolbar"],
+    )
+    def test_layout_stylesheets_memoized(self, getter):
+        get = getattr(ThemeStylesheetService, f"get_{getter}_stylesheet")
+        assert get("bloomberg") is get("bloomberg")
+        assert get("no-such-theme") is get("dark")
+
+    def test_renders_only_requested_themes(self):
+        ThemeStylesheetService.reload()
+        ThemeStylesheetService.get_table_stylesheet("light")
+        cache = ThemeStylesheetService._stylesheet_cache
+        for kind, variants in ThemeStylesheetService._STYLESHEET_VARIANTS.items():
+            for highlighted in variants:
+                assert (kind, "light", highlighted) in cache
+                assert (kind, "dark", highlighted) not in cache
+        with pytest.raises(TypeError):
+            cache[("table", "light", False)] = ""
+
+    def test_identical_variants_share_object(self):
+        # Dark and Bloomberg both put black text on the accent color
+        assert ThemeStylesheetService.get_line_edit_stylesheet("dark", True) is (
+            ThemeStylesheetService.get_line_edit_stylesheet("bloomberg", True)
+        )
+
+    def test_variants_differ(self):
+        assert ThemeStylesheetService.get_line_edit_stylesheet("dark", True) != (
+            ThemeStylesheetService.get_line_edit_stylesheet("dark", False)
+        )
+
+    def test_unknown_theme_uses_dark(self):
+        assert ThemeStylesheetService.get_table_stylesheet("no-such-theme") is (
+            ThemeStylesheetService.get_table_stylesheet("dark")
+        )
+
+    def test_cached_sheets_are_minified(self):
+        css = ThemeStylesheetService.get_sidebar_stylesheet("bloomberg")
+        assert "\n" not in css
+        assert "#sidebar{background-color:" in css
+        # Spaces inside values and quoted font names survive
+        assert "padding:20px 10px;" in css
+        assert '"Courier New"' in css
+
+    def test_reload_picks_up_patched_palette(self, monkeypatch):
+        colors = dict(theme_stylesheet_service.COLORS)
+        colors["dark"] = dataclasses.replace(colors["dark"], bg="#123456")
+        monkeypatch.setattr(theme_stylesheet_service, "COLORS", colors)
+        try:
+            ThemeStylesheetService.reload()
+            assert "#123456" in ThemeStylesheetService.get_table_stylesheet("dark")
+        finally:
+            monkeypatch.undo()
+            ThemeStylesheetService.reload()
+        assert "#123456" not in ThemeStylesheetService.get_table_stylesheet("dark")
+
+
 class TestColorAccessors:
     @pytest.mark.parametrize("theme", ["dark", "light", "bloomberg"])
     def test_background_rgb(self, theme):
@@ -68,3 +165,11 @@ class TestColorAccessors:
         rgb = ThemeStylesheetService.get_accent_rgb(theme)
         assert isinstance(rgb, tuple)
         assert len(rgb) == 3
+
+    @pytest.mark.parametrize("getter", [
+        "get_background_rgb", "get_accent_rgb", "get_text_rgb",
+        "get_crosshair_rgb", "get_chart_background_color", "get_chart_line_color",
+    ])
+    def test_unknown_theme_uses_dark(self, getter):
+        get = getattr(ThemeStylesheetService, getter)
+        assert get("unknown") == get("dark")
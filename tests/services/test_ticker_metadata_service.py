@@ -53,3 +53,18 @@ class TestTickerMetadataService:
         monkeypatch.setattr(TickerMetadataService, "_CACHE_FILE", tmp_path / "meta.json")
         TickerMetadataService.clear_cache()
         assert TickerMetadataService._cache is None or len(TickerMetadataService._cache) == 0
+
+    def test_save_cache_is_atomic(self, tmp_path, monkeypatch):
+        import json
+
+        cache_file = tmp_path / "meta.json"
+        monkeypatch.setattr(TickerMetadataService, "_CACHE_FILE", cache_file)
+        TickerMetadataService._cache = {"AAPL": {"sector": "Tech"}}
+        TickerMetadataService._save_cache()
+        assert json.loads(cache_file.read_text()) == {"AAPL": {"sector": "Tech"}}
+
+        # A failed dump keeps the previous file and leaves no temp file behind
+        TickerMetadataService._cache["BAD"] = {"sector": object()}
+        TickerMetadataService._save_cache()
+        assert json.loads(cache_file.read_text()) == {"AAPL": {"sector": "Tech"}}
+        assert list(tmp_path.iterdir()) == [cache_file]
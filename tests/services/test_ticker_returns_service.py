@@ -7,6 +7,13 @@ import pytest
 from app.services.ticker_returns_service import TickerReturnsService
 
 
+@pytest.fixture(autouse=True)
+def reset_cache():
+    TickerReturnsService.clear_cache()
+    yield
+    TickerReturnsService.clear_cache()
+
+
 class TestGetTickerReturns:
     def test_returns_series(self, monkeypatch):
         """Should return a pandas Series of daily returns."""
@@ -31,3 +38,54 @@ class TestGetTickerReturns:
         )
         result = TickerReturnsService.get_ticker_returns("BADTICKER")
         assert result.empty
+
+    def test_fetches_once_per_ticker(self, monkeypatch, sample_ohlcv_df):
+        """Metric getters for one ticker should share a single fetch."""
+        calls = []
+
+        def fake_fetch(ticker, *a, **kw):
+            calls.append(ticker)
+            return sample_ohlcv_df
+
+        monkeypatch.setattr("app.services.market_data.fetch_price_history", fake_fetch)
+        returns = TickerReturnsService.get_ticker_returns("AAPL")
+        TickerReturnsService.get_ticker_drawdowns("AAPL")
+        TickerReturnsService.get_ticker_returns("AAPL", interval="weekly")
+        assert calls == ["AAPL"]
+
+        # Callers get their own copy
+        returns.iloc[0] = 99.0
+        assert TickerReturnsService.get_ticker_returns("AAPL").iloc[0] != 99.0
+
+
+class TestGetTickerTimeUnderWater:
+    @pytest.mark.parametrize("has_numba", [True, False])
+    def test_counts_days_since_last_peak(self, monkeypatch, has_numba):
+        """Counter grows while below the peak and resets on a new high."""
+        if has_numba:
+            pytest.importorskip("numba")
+        monkeypatch.setattr("app.utils.numba_kernels.HAS_NUMBA", has_numba)
+        close = [100.0, 110.0, 105.0, 100.0, 108.0, 111.0, 109.0, 112.0, 113.0]
+        mock_df = pd.DataFrame(
+            {"Close": close}, index=pd.bdate_range("2024-01-02", periods=len(close))
+        )
+        monkeypatch.setattr(
+            "app.services.market_data.fetch_price_history",
+            lambda *a, **kw: mock_df,
+        )
+        result = TickerReturnsService.get_ticker_time_under_water("AAPL")
+        assert result.tolist() == [0, 1, 2, 3, 0, 1, 0, 0]
+        assert result.index.equals(mock_df.index[1:])
+
+
+class TestGetTickerDrawdowns:
+    def test_matches_wealth_index(self, monkeypatch, sample_ohlcv_df):
+        monkeypatch.setattr(
+            "app.services.market_data.fetch_price_history",
+            lambda *a, **kw: sample_ohlcv_df,
+        )
+        returns = TickerReturnsService.get_ticker_returns("AAPL")
+        wealth = (1 + returns).cumprod()
+        expected = wealth / wealth.cummax() - 1
+        result = TickerReturnsService.get_ticker_drawdowns("AAPL")
+        pd.testing.assert_series_equal(result, expected)
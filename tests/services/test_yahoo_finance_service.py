@@ -25,12 +25,51 @@ class TestNormalizeColumns:
         result = YahooFinanceService._normalize_columns(df)
         assert "SomeExtra" not in result.columns
 
+    def test_reorders_to_standard(self):
+        df = pd.DataFrame(
+            {"Adj Close": [1.4], " close ": [1.5], "High": [2], "Low": [0.5], "Open": [1], "Volume": [100]}
+        )
+        result = YahooFinanceService._normalize_columns(df)
+        assert list(result.columns) == ["Open", "High", "Low", "Close", "Volume"]
+        assert result["Close"].iloc[0] == 1.5
+
     def test_adj_close_mapped(self):
         df = pd.DataFrame({"adj close": [1.5]})
         result = YahooFinanceService._normalize_columns(df)
         # Adj Close not in standard_cols, so should be dropped
         assert len(result.columns) == 0
 
+    def test_result_can_be_modified_in_place(self):
+        import warnings
+
+        dates = pd.to_datetime(["2024-01-03", "2024-01-02", "2024-01-04"])
+        df = pd.DataFrame(
+            {"Open": [1.0, np.nan, 2.0], "Adj Close": [1.4, np.nan, 2.4], "Close": [1.5, np.nan, 2.5]},
+            index=dates,
+        )
+        batch = pd.concat({"AAPL": df}, axis=1)
+        for source in (df, batch.xs("AAPL", axis=1, level=0)):
+            with warnings.catch_warnings():
+                warnings.simplefilter("error")
+                result = YahooFinanceService._normalize_columns(source)
+                YahooFinanceService._ensure_sorted_datetime_index(result)
+                result.dropna(how="all", inplace=True)
+            assert list(result["Close"]) == [1.5, 2.5]
+            assert source["Close"].isna().sum() == 1
+
+
+class TestEnsureSortedDatetimeIndex:
+    def test_parses_and_sorts(self):
+        df = pd.DataFrame({"Close": [2.0, 1.0]}, index=["2024-01-03", "2024-01-02"])
+        YahooFinanceService._ensure_sorted_datetime_index(df)
+        assert isinstance(df.index, pd.DatetimeIndex)
+        assert df["Close"].tolist() == [1.0, 2.0]
+
+    def test_sorted_index_untouched(self, sample_ohlcv_df):
+        index = sample_ohlcv_df.index
+        YahooFinanceService._ensure_sorted_datetime_index(sample_ohlcv_df)
+        assert sample_ohlcv_df.index is index
+
 
 class TestFetchHistorical:
     def test_returns_dataframe(self, mock_yahoo_download):
@@ -55,6 +94,48 @@ class TestFetchFullHistory:
         result = YahooFinanceService.fetch_full_history("aapl")
         assert isinstance(result, pd.DataFrame)
 
+    def test_metadata_cached_in_background(self, monkeypatch, sample_ohlcv_df):
+        import threading
+
+        from app.services.ticker_metadata_service import TickerMetadataService
+
+        release, fetched = threading.Event(), threading.Event()
+
+        def slow_metadata(ticker):
+            release.wait(5)
+            fetched.set()
+            return {}
+
+        monkeypatch.setattr(YahooFinanceService, "safe_download", lambda *a, **kw: sample_ohlcv_df.copy())
+        monkeypatch.setattr(TickerMetadataService, "get_metadata", slow_metadata)
+
+        result = YahooFinanceService.fetch_full_history("AAPL")
+        assert not result.empty
+        assert not fetched.is_set()
+        release.set()
+        assert fetched.wait(5)
+
+    def test_shutdown_metadata_prefetch_drops_queued_lookups(self, monkeypatch):
+        import threading
+
+        from app.services.ticker_metadata_service import TickerMetadataService
+
+        release, calls = threading.Event(), []
+
+        def slow_metadata(ticker):
+            calls.append(ticker)
+            release.wait(5)
+            return {}
+
+        monkeypatch.setattr(TickerMetadataService, "get_metadata", slow_metadata)
+        for ticker in ["AAPL", "MSFT", "GOOG", "AMZN"]:
+            YahooFinanceService._prefetch_metadata(ticker)
+
+        YahooFinanceService.shutdown_metadata_prefetch()
+        release.set()
+        assert YahooFinanceService._metadata_executor is None
+        assert len(calls) <= 2
+
 
 class TestFetchFullHistorySafe:
     def test_success(self, mock_yahoo_download):
@@ -91,6 +172,56 @@ class TestFetchBatchFullHistory:
         assert len(results) + len(failed) <= 1
 
 
+class TestFetchBatchChunk:
+    @pytest.fixture
+    def batch_download(self, monkeypatch, sample_ohlcv_df):
+        """Patch safe_download with a grouped-by-ticker multi-ticker frame."""
+        frames = {}
+
+        def _download(tickers, **kwargs):
+            names = tickers.split()
+            frames["raw"] = pd.concat([sample_ohlcv_df] * len(names), axis=1, keys=names)
+            return frames["raw"]
+
+        monkeypatch.setattr(YahooFinanceService, "safe_download", _download)
+        return frames
+
+    def test_splits_tickers(self, batch_download, sample_ohlcv_df):
+        results, failed = YahooFinanceService._fetch_batch_chunk(["AAPL", "MSFT"])
+        assert failed == []
+        assert set(results) == {"AAPL", "MSFT"}
+        pd.testing.assert_frame_equal(results["MSFT"], sample_ohlcv_df, check_freq=False)
+
+    def test_results_do_not_share_download_memory(self, batch_download):
+        results, _ = YahooFinanceService._fetch_batch_chunk(["AAPL", "MSFT"])
+        results["AAPL"].iloc[0, 0] = -1.0
+        assert batch_download["raw"]["AAPL"]["Open"].iloc[0] != -1.0
+
+    def test_missing_ticker_failed(self, batch_download, monkeypatch):
+        raw = YahooFinanceService.safe_download
+        monkeypatch.setattr(
+            YahooFinanceService, "safe_download", lambda tickers, **kw: raw("AAPL MSFT")
+        )
+        results, failed = YahooFinanceService._fetch_batch_chunk(["AAPL", "GOOG"])
+        assert set(results) == {"AAPL"}
+        assert failed == ["GOOG"]
+
+    @pytest.mark.filterwarnings("error::pandas.errors.SettingWithCopyWarning")
+    def test_single_ticker_without_copy(self, monkeypatch, sample_ohlcv_df):
+        raw = sample_ohlcv_df.assign(**{"Adj Close": sample_ohlcv_df["Close"]})
+        raw.iloc[0] = np.nan
+        monkeypatch.setattr(YahooFinanceService, "safe_download", lambda tickers, **kw: raw)
+
+        results, failed = YahooFinanceService._fetch_batch_chunk(["AAPL"])
+        assert failed == []
+        assert len(results["AAPL"]) == len(raw) - 1
+        assert not np.shares_memory(results["AAPL"]["Close"].to_numpy(), raw["Close"].to_numpy())
+
+        ranges = {"AAPL": ("2024-01-01", "2024-06-01")}
+        result = YahooFinanceService.fetch_batch_date_range(["AAPL"], ranges)
+        assert len(result["AAPL"]) == len(raw) - 1
+
+
 class TestFetchBatchDateRange:
     def test_empty(self):
         result = YahooFinanceService.fetch_batch_date_range([], {})
@@ -102,6 +233,50 @@ class TestFetchBatchDateRange:
         result = YahooFinanceService.fetch_batch_date_range(tickers, ranges)
         assert "AAPL" in result
 
+    def test_groups_by_range(self, monkeypatch, sample_ohlcv_df):
+        calls = []
+
+        def _download(tickers, start, end, **kwargs):
+            calls.append((tickers, start, end))
+            names = tickers.split()
+            if len(names) == 1:
+                return sample_ohlcv_df.copy()
+            return pd.concat([sample_ohlcv_df] * len(names), axis=1, keys=names)
+
+        monkeypatch.setattr(YahooFinanceService, "safe_download", _download)
+        progress = []
+        ranges = {
+            "AAPL": ("2024-01-01", "2024-06-01"),
+            "MSFT": ("2024-01-01", "2024-06-01"),
+            "SPY": ("2024-03-01", "2024-06-01"),
+        }
+        result = YahooFinanceService.fetch_batch_date_range(
+            list(ranges), ranges, lambda done, total, ticker: progress.append((done, total))
+        )
+        assert set(result) == {"AAPL", "MSFT", "SPY"}
+        assert sorted(calls) == [
+            ("AAPL MSFT", "2024-01-01", "2024-06-01"),
+            ("SPY", "2024-03-01", "2024-06-01"),
+        ]
+        assert progress[-1] == (3, 3)
+
+
+class TestFetchBatchCurrentPrices:
+    def test_last_valid_close_per_ticker(self, monkeypatch, sample_ohlcv_df):
+        tail = sample_ohlcv_df.iloc[-5:]
+        msft = tail.copy()
+        msft.loc[msft.index[-2:], "Close"] = np.nan
+        empty = tail.copy()
+        empty["Close"] = np.nan
+        raw = pd.concat([tail, msft, empty], axis=1, keys=["AAPL", "MSFT", "GONE"])
+        monkeypatch.setattr(YahooFinanceService, "safe_download", lambda *a, **kw: raw)
+
+        prices = YahooFinanceService.fetch_batch_current_prices(["aapl", "MSFT", "GONE"])
+        assert prices == {
+            "AAPL": float(tail["Close"].iloc[-1]),
+            "MSFT": float(tail["Close"].iloc[-3]),
+        }
+
 
 class TestFetchTodayOhlcv:
     def test_returns_single_row(self, mock_yahoo_download):
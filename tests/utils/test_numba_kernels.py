@@ -0,0 +1,53 @@
+"""Tests for app.utils.numba_kernels."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+pytest.importorskip("numba")
+
+from app.utils.numba_kernels import days_under_water, rolling_annualized_volatility
+
+
+class TestRollingAnnualizedVolatility:
+    def test_matches_pandas(self):
+        rng = np.random.default_rng(42)
+        values = rng.normal(0.0, 0.02, (300, 4))
+        expected = (pd.DataFrame(values).rolling(21).std() * np.sqrt(252)).iloc[20:]
+        result = rolling_annualized_volatility(values, 21, 252.0)
+        np.testing.assert_allclose(result, expected.to_numpy(), rtol=1e-9)
+
+    def test_nan_windows(self):
+        rng = np.random.default_rng(7)
+        values = rng.normal(0.0, 0.01, (60, 2)).astype(np.float32)
+        values[:10, 0] = np.nan
+        values[30, 1] = np.nan
+        expected = (pd.DataFrame(values).rolling(5).std() * np.sqrt(252)).iloc[4:]
+        result = rolling_annualized_volatility(values, 5, 252.0)
+        np.testing.assert_array_equal(np.isnan(result), expected.isna().to_numpy())
+        np.testing.assert_allclose(result, expected.to_numpy(), rtol=1e-6)
+
+    def test_output_shape(self):
+        values = np.zeros((10, 3))
+        assert rolling_annualized_volatility(values, 10, 252.0).shape == (1, 3)
+
+
+class TestDaysUnderWater:
+    @staticmethod
+    def _expected(returns):
+        cumulative = (1 + pd.Series(returns)).cumprod()
+        peak = cumulative.cummax()
+        days, count = [], 0
+        for cum, top in zip(cumulative, peak):
+            count = count + 1 if cum < top else 0
+            days.append(count)
+        return np.array(days)
+
+    def test_matches_wealth_index_loop(self):
+        returns = np.random.default_rng(3).normal(0.0, 0.02, 500)
+        np.testing.assert_array_equal(days_under_water(returns), self._expected(returns))
+
+    def test_missing_returns(self):
+        returns = np.random.default_rng(5).normal(0.0, 0.02, 200)
+        returns[[0, 1, 50, 120]] = np.nan
+        np.testing.assert_array_equal(days_under_water(returns), self._expected(returns))